@@ -49,8 +49,13 @@ from slices.allergies.domain.models.allergy_model import PatientAllergy
 from slices.surgeries.domain.models.surgery_model import PatientSurgery
 from slices.illnesses.domain.models.illness_model import PatientIllness
 
+# Import emergency access models for autogenerate
+from slices.emergency_access.domain.models.emergency_snapshot_model import PatientEmergencySnapshot
+from slices.emergency_access.domain.models.emergency_access_log_model import EmergencyAccessLog
+
 # Import dashboard-specific models only
 from slices.dashboard.domain.models.medical_models import DashboardActivityLog
+from slices.dashboard.domain.models.patient_medical_stats_model import PatientMedicalStats
 
 target_metadata = Base.metadata
 
@@ -0,0 +1,52 @@
+"""add_session_token_digests
+
+Revision ID: a3f1c9d2e7b4
+Revises: f0a1b2c3d4e5
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3f1c9d2e7b4'
+down_revision: Union[str, Sequence[str], None] = 'f0a1b2c3d4e5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Key user_sessions by SHA-256 digests of the access and refresh tokens."""
+    op.add_column('user_sessions', sa.Column('session_token_digest', sa.String(length=64), nullable=True))
+    op.add_column('user_sessions', sa.Column('refresh_token_digest', sa.String(length=64), nullable=True))
+
+    # Backfill existing rows (sha256() is built into PostgreSQL 11+)
+    op.execute("""
+        UPDATE user_sessions
+        SET session_token_digest = encode(sha256(convert_to(session_token, 'UTF8')), 'hex'),
+            refresh_token_digest = CASE
+                WHEN refresh_token IS NULL THEN NULL
+                ELSE encode(sha256(convert_to(refresh_token, 'UTF8')), 'hex')
+            END;
+    """)
+
+    op.alter_column('user_sessions', 'session_token_digest', nullable=False)
+    op.create_index('ix_user_sessions_session_token_digest', 'user_sessions', ['session_token_digest'], unique=True)
+    op.create_index('ix_user_sessions_refresh_token_digest', 'user_sessions', ['refresh_token_digest'], unique=True)
+
+    # The wide raw-token indexes are no longer used for lookups
+    op.execute("DROP INDEX IF EXISTS ix_user_sessions_session_token;")
+    op.execute("DROP INDEX IF EXISTS ix_user_sessions_refresh_token;")
+
+
+def downgrade() -> None:
+    """Restore raw-token indexes and drop the digest columns."""
+    op.create_index('ix_user_sessions_session_token', 'user_sessions', ['session_token'], unique=True)
+    op.create_index('ix_user_sessions_refresh_token', 'user_sessions', ['refresh_token'], unique=True)
+    op.drop_index('ix_user_sessions_refresh_token_digest', table_name='user_sessions')
+    op.drop_index('ix_user_sessions_session_token_digest', table_name='user_sessions')
+    op.drop_column('user_sessions', 'refresh_token_digest')
+    op.drop_column('user_sessions', 'session_token_digest')
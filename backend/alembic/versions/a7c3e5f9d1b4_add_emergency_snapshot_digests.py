@@ -0,0 +1,35 @@
+"""add_emergency_snapshot_digests
+
+Revision ID: a7c3e5f9d1b4
+Revises: f3b7d9e1a5c2
+Create Date: 2026-10-17 23:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e5f9d1b4'
+down_revision: Union[str, Sequence[str], None] = 'f3b7d9e1a5c2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Store payload digests on patient_emergency_snapshots (source of the emergency ETags)."""
+    op.add_column('patient_emergency_snapshots', sa.Column('payload_digest', sa.String(length=64), nullable=True))
+    op.add_column('patient_emergency_snapshots', sa.Column('critical_digest', sa.String(length=64), nullable=True))
+
+    # The full digest is computable in SQL; critical digests are filled by the snapshot
+    # backfill (until then the critical ETag is derived from the served payload)
+    op.execute("UPDATE patient_emergency_snapshots SET payload_digest = encode(sha256(payload), 'hex')")
+    op.alter_column('patient_emergency_snapshots', 'payload_digest', nullable=False)
+
+
+def downgrade() -> None:
+    """Drop the snapshot payload digests."""
+    op.drop_column('patient_emergency_snapshots', 'critical_digest')
+    op.drop_column('patient_emergency_snapshots', 'payload_digest')
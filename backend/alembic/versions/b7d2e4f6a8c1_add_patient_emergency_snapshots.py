@@ -0,0 +1,42 @@
+"""add_patient_emergency_snapshots
+
+Revision ID: b7d2e4f6a8c1
+Revises: a3f1c9d2e7b4
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d2e4f6a8c1'
+down_revision: Union[str, Sequence[str], None] = 'a3f1c9d2e7b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the materialized per-patient emergency payload table."""
+    op.create_table(
+        'patient_emergency_snapshots',
+        sa.Column('patient_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('qr_code', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('payload', sa.LargeBinary(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['patient_id'], ['patients.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('patient_id')
+    )
+    op.create_index(
+        'ix_patient_emergency_snapshots_qr_code', 'patient_emergency_snapshots', ['qr_code'], unique=True
+    )
+    # Rows are backfilled with: python -m slices.emergency_access.infrastructure.repositories.emergency_snapshot_writer
+
+
+def downgrade() -> None:
+    """Drop the emergency snapshot table."""
+    op.drop_index('ix_patient_emergency_snapshots_qr_code', table_name='patient_emergency_snapshots')
+    op.drop_table('patient_emergency_snapshots')
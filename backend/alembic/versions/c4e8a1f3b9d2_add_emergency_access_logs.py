@@ -0,0 +1,56 @@
+"""add_emergency_access_logs
+
+Revision ID: c4e8a1f3b9d2
+Revises: b7d2e4f6a8c1
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e8a1f3b9d2'
+down_revision: Union[str, Sequence[str], None] = 'b7d2e4f6a8c1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the month-partitioned emergency access audit table."""
+    op.create_table(
+        'emergency_access_logs',
+        sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column('accessed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('paramedic_user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('patient_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('qr_code', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('access_type', sa.String(length=20), nullable=False),
+        sa.Column('status_code', sa.SmallInteger(), nullable=False),
+        sa.Column('ip_address', postgresql.INET(), nullable=True),
+        sa.Column('user_agent', sa.Text(), nullable=True),
+        sa.Column('latency_ms', sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint('id', 'accessed_at'),
+        postgresql_partition_by='RANGE (accessed_at)'
+    )
+    # Catches rows outside the monthly partitions created by the application
+    op.execute('CREATE TABLE emergency_access_logs_default PARTITION OF emergency_access_logs DEFAULT')
+
+    op.create_index(
+        'ix_emergency_access_logs_qr_code_accessed_at', 'emergency_access_logs', ['qr_code', 'accessed_at']
+    )
+    op.create_index(
+        'ix_emergency_access_logs_patient_id_accessed_at', 'emergency_access_logs', ['patient_id', 'accessed_at']
+    )
+    op.create_index(
+        'ix_emergency_access_logs_paramedic_user_id_accessed_at', 'emergency_access_logs',
+        ['paramedic_user_id', 'accessed_at']
+    )
+
+
+def downgrade() -> None:
+    """Drop the emergency access audit table and all of its partitions."""
+    op.drop_table('emergency_access_logs')
@@ -0,0 +1,52 @@
+"""add_patient_medical_stats
+
+Revision ID: d5b9f2a7c3e1
+Revises: c4e8a1f3b9d2
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5b9f2a7c3e1'
+down_revision: Union[str, Sequence[str], None] = 'c4e8a1f3b9d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COUNTER_COLUMNS = [
+    'medications_count',
+    'active_medications',
+    'allergies_count',
+    'allergies_leve',
+    'allergies_moderada',
+    'allergies_severa',
+    'allergies_critica',
+    'surgeries_count',
+    'illnesses_count',
+    'active_illnesses',
+    'chronic_illnesses',
+]
+
+
+def upgrade() -> None:
+    """Create the denormalized per-patient medical counters table."""
+    op.create_table(
+        'patient_medical_stats',
+        sa.Column('patient_id', postgresql.UUID(as_uuid=True), nullable=False),
+        *[sa.Column(name, sa.Integer(), server_default='0', nullable=False) for name in COUNTER_COLUMNS],
+        sa.Column('last_activity_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['patient_id'], ['patients.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('patient_id')
+    )
+    # Rows are backfilled with: python -m slices.dashboard.infrastructure.repositories.patient_medical_stats_writer
+
+
+def downgrade() -> None:
+    """Drop the patient medical stats table."""
+    op.drop_table('patient_medical_stats')
@@ -0,0 +1,43 @@
+"""add_allergies_other_to_medical_stats
+
+Revision ID: e2a6c8f4b1d7
+Revises: d5b9f2a7c3e1
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a6c8f4b1d7'
+down_revision: Union[str, Sequence[str], None] = 'd5b9f2a7c3e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Count allergies whose severity is not one of the known levels."""
+    op.add_column(
+        'patient_medical_stats',
+        sa.Column('allergies_other', sa.Integer(), server_default='0', nullable=False)
+    )
+    op.execute("""
+        UPDATE patient_medical_stats stats
+        SET allergies_other = other.total
+        FROM (
+            SELECT patient_id, COUNT(*) AS total
+            FROM patient_allergies
+            WHERE severity_level IS NULL
+               OR severity_level NOT IN ('leve', 'moderada', 'severa', 'critica')
+            GROUP BY patient_id
+        ) other
+        WHERE stats.patient_id = other.patient_id
+    """)
+
+
+def downgrade() -> None:
+    """Drop the unknown-severity allergy counter."""
+    op.drop_column('patient_medical_stats', 'allergies_other')
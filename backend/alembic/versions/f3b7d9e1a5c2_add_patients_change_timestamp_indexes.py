@@ -0,0 +1,30 @@
+"""add_patients_change_timestamp_indexes
+
+Revision ID: f3b7d9e1a5c2
+Revises: e2a6c8f4b1d7
+Create Date: 2026-10-17 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b7d9e1a5c2'
+down_revision: Union[str, Sequence[str], None] = 'e2a6c8f4b1d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index patients.created_at/updated_at for the QR resolver's incremental refresh."""
+    # created_at >= :since OR updated_at >= :since becomes a BitmapOr of two index scans
+    op.create_index('ix_patients_created_at', 'patients', ['created_at'])
+    op.create_index('ix_patients_updated_at', 'patients', ['updated_at'])
+
+
+def downgrade() -> None:
+    """Drop the patients change timestamp indexes."""
+    op.drop_index('ix_patients_updated_at', table_name='patients')
+    op.drop_index('ix_patients_created_at', table_name='patients')
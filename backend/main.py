@@ -4,12 +4,14 @@ Main FastAPI application entry point
 """
 
 import os
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 # Import routers
 from slices.signup.infrastructure.api import patient_signup_router, validation_router
 from slices.auth.infrastructure.api import auth_router
+from slices.auth.infrastructure.api.auth_endpoints import get_current_admin_user
 from slices.dashboard.infrastructure.api.dashboard_router import router as dashboard_router
 from slices.medications.infrastructure.api.medications_router import router as medications_router
 from slices.allergies.infrastructure.api.allergies_router import router as allergies_router
@@ -20,12 +22,61 @@ from slices.qr.infrastructure.api.qr_simple_router import router as qr_router
 from slices.emergency_access.infrastructure.api.emergency_access_router import router as emergency_access_router
 from slices.countries.infrastructure.api.countries_router import router as countries_router
 from slices.subscriptions.infrastructure.api.subscriptions_router import router as subscriptions_router
+from slices.auth.infrastructure.security.token_validation_cache import get_token_validation_cache
+from slices.auth.infrastructure.security.password_hashing_engine import get_password_hashing_engine
+from slices.auth.infrastructure.security.session_revocation_list import get_session_revocation_list
+from slices.auth.infrastructure.persistence.login_attempt_audit_sink import get_login_attempt_audit_sink
+from slices.auth.infrastructure.maintenance.session_maintenance import get_session_maintenance_scheduler
+from slices.qr.infrastructure.services.qr_code_resolver import get_qr_code_resolver
+from slices.qr.infrastructure.services.rendered_qr_cache import get_rendered_qr_cache
+from slices.qr.infrastructure.services.qr_prerenderer import get_qr_prerenderer
+from slices.emergency_access.infrastructure.services.critical_payload_cache import get_critical_payload_cache
+from slices.emergency_access.infrastructure.persistence.emergency_access_log_sink import get_emergency_access_log_sink
+from slices.emergency.infrastructure.persistence.emergency_qr_access_counter import get_emergency_qr_access_counter
+from slices.emergency_access.infrastructure.repositories.emergency_snapshot_writer import rebuild_emergency_snapshot
+from slices.dashboard.infrastructure.repositories.patient_medical_stats_writer import refresh_patient_medical_stats
+from slices.signup.infrastructure.persistence.patient_data_change_notifier import configure_patient_data_change_notifier
+from slices.signup.domain.models.user_model import User
+from shared.database import async_engine
+
+# Rows derived from a patient's data, rebuilt in the writer's transaction
+configure_patient_data_change_notifier([rebuild_emergency_snapshot, refresh_patient_medical_stats])
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup/shutdown hooks"""
+    # Periodic user_sessions expiry/purge (one worker at a time via advisory lock)
+    get_session_maintenance_scheduler().start()
+    # Load known QR codes so unknown scans are rejected without a query
+    try:
+        await get_qr_code_resolver().rebuild()
+    except Exception as e:
+        print(f"⚠️ QR RESOLVER - Startup rebuild failed, lookups go to the database: {e}")
+    # Monthly emergency_access_logs partitions for the current and upcoming months (rolled forward by the sink)
+    await get_emergency_access_log_sink().ensure_partitions()
+    yield
+    await get_session_maintenance_scheduler().stop()
+    # Flush queued login audit rows
+    await get_login_attempt_audit_sink().close()
+    # Flush queued emergency access log rows
+    await get_emergency_access_log_sink().close()
+    # Flush pending emergency_qrs access counts
+    await get_emergency_qr_access_counter().close()
+    # Stop the bcrypt executor
+    get_password_hashing_engine().shutdown()
+    # Finish queued QR pre-renders, then stop the threads
+    get_qr_prerenderer().shutdown()
+    # Close pooled asyncpg connections
+    await async_engine.dispose()
+
 
 # Create FastAPI app instance
 app = FastAPI(
     title="VitalGo API",
     description="VitalGo Backend API following Hexagonal Architecture",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
 # Configure CORS - SECURITY HARDENED
@@ -69,6 +120,25 @@ async def health_check():
     }
 
 
+@app.get("/api/admin/stats")
+async def worker_stats(admin_user: User = Depends(get_current_admin_user)):
+    """Per-worker cache, queue and executor counters (admin only)"""
+    return {
+        "worker_pid": os.getpid(),
+        "token_cache": get_token_validation_cache().stats(),
+        "password_hashing": get_password_hashing_engine().stats(),
+        "login_audit": get_login_attempt_audit_sink().stats(),
+        "revocation_list": get_session_revocation_list().stats(),
+        "session_maintenance": get_session_maintenance_scheduler().stats(),
+        "qr_resolver": get_qr_code_resolver().stats(),
+        "qr_image_cache": get_rendered_qr_cache().stats(),
+        "qr_prerender": get_qr_prerenderer().stats(),
+        "emergency_critical_cache": get_critical_payload_cache().stats(),
+        "emergency_access_log": get_emergency_access_log_sink().stats(),
+        "emergency_qr_access": get_emergency_qr_access_counter().stats()
+    }
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
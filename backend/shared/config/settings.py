@@ -25,6 +25,55 @@ class Settings(BaseSettings):
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     BCRYPT_ROUNDS: int = 12
 
+    # Password hashing executor (per worker process)
+    PASSWORD_HASHING_EXECUTOR: str = "thread"  # "thread" or "process"
+    PASSWORD_HASHING_MAX_WORKERS: int = 4
+    PASSWORD_HASHING_MAX_QUEUE_DEPTH: int = 32
+
+    # Token validation cache (per worker process)
+    TOKEN_CACHE_MAX_ENTRIES: int = 10000
+    TOKEN_CACHE_TTL_SECONDS: int = 60
+
+    # Stateless access-token validation (signature + exp + in-memory revocation list)
+    TOKEN_VALIDATION_MODE: str = "database"  # "database" or "stateless"
+    STATELESS_TOKEN_MAX_LIFETIME_MINUTES: int = 30
+    REVOCATION_REFRESH_INTERVAL_SECONDS: int = 5
+
+    # user_sessions maintenance (batched expiry and purge; 0 disables the in-process run)
+    SESSION_MAINTENANCE_INTERVAL_MINUTES: int = 60
+    SESSION_MAINTENANCE_BATCH_SIZE: int = 5000
+    SESSION_RETENTION_DAYS: int = 7
+
+    # QR code resolver (per worker process)
+    QR_RESOLVER_CACHE_SIZE: int = 10000
+    QR_RESOLVER_NEGATIVE_TTL_SECONDS: int = 60
+    QR_RESOLVER_REFRESH_INTERVAL_SECONDS: int = 5
+
+    # Rendered QR image cache (in-memory per worker, optional shared disk directory; "" disables disk)
+    QR_IMAGE_CACHE_MAX_MB: int = 64
+    QR_IMAGE_CACHE_DIR: str = ""
+    QR_RASTERIZER: str = "numpy"  # "numpy" (vectorized) or "pil" (qrcode image factory)
+
+    # Background QR pre-render on signup (box sizes: screen, print, lock-screen wallpaper)
+    QR_PRERENDER_ENABLED: bool = True
+    QR_PRERENDER_BOX_SIZES: str = "10,20,30"  # comma-separated pixels per module
+    QR_PRERENDER_MAX_WORKERS: int = 1
+    QR_PRERENDER_MAX_PENDING: int = 100
+
+    # Emergency access
+    EMERGENCY_BATCH_MAX_CODES: int = 50
+    EMERGENCY_CRITICAL_CACHE_SIZE: int = 5000
+
+    # Legacy emergency_qrs access counters (write-behind, per worker process)
+    EMERGENCY_QR_ACCESS_FLUSH_INTERVAL_SECONDS: float = 5.0
+    EMERGENCY_QR_ACCESS_BATCH_SIZE: int = 500
+
+    # Emergency access log (batched emergency_access_logs writes, per worker process)
+    EMERGENCY_ACCESS_LOG_BATCH_SIZE: int = 500
+    EMERGENCY_ACCESS_LOG_FLUSH_INTERVAL_SECONDS: float = 1.0
+    EMERGENCY_ACCESS_LOG_MAX_QUEUE_SIZE: int = 20000
+    EMERGENCY_ACCESS_LOG_PARTITION_MONTHS_AHEAD: int = 2
+
     # API
     API_V1_STR: str = "/api/v1"
     PROJECT_NAME: str = "VitalGo"
@@ -47,6 +96,15 @@ class Settings(BaseSettings):
     # Rate Limiting
     RATE_LIMIT_PER_MINUTE: int = 60
     REGISTRATION_RATE_LIMIT_PER_HOUR: int = 3
+    RATE_LIMIT_BACKEND: str = "memory"  # "memory" (single node) or "redis" (uses REDIS_URL)
+    LOGIN_IP_MAX_FAILURES_PER_HOUR: int = 15
+    LOGIN_EMAIL_MAX_FAILURES_PER_15_MIN: int = 5
+
+    # Login audit sink (batched login_attempts writes, per worker process)
+    LOGIN_AUDIT_BUFFERED: bool = True
+    LOGIN_AUDIT_BATCH_SIZE: int = 200
+    LOGIN_AUDIT_FLUSH_INTERVAL_SECONDS: float = 1.0
+    LOGIN_AUDIT_MAX_QUEUE_SIZE: int = 10000
 
     @validator('CORS_ORIGINS', pre=True)
     def assemble_cors_origins(cls, v):
@@ -1,3 +1,19 @@
-from .database import Base, engine, SessionLocal, get_db
+from .database import (
+    Base,
+    engine,
+    SessionLocal,
+    get_db,
+    async_engine,
+    AsyncSessionLocal,
+    get_async_db,
+)
 
-__all__ = ["Base", "engine", "SessionLocal", "get_db"]
\ No newline at end of file
+__all__ = [
+    "Base",
+    "engine",
+    "SessionLocal",
+    "get_db",
+    "async_engine",
+    "AsyncSessionLocal",
+    "get_async_db",
+]
@@ -0,0 +1,151 @@
+"""
+Buffered batch writer for append-only audit tables
+
+Rows are queued in memory and written in batches with a multi-row INSERT over
+the async engine, so request paths that audit do not pay for a round trip.
+Batches are flushed when the buffer reaches the batch size, every flush
+interval, and on close (application shutdown). The buffer is bounded; when it
+is full new rows are dropped and counted. A batch that fails to write is put
+back (within the bound) and retried on the next cycle.
+
+Subclasses set the mapped model and the log label, and may override
+_before_flush for per-table upkeep.
+"""
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import insert
+
+from .database import AsyncSessionLocal
+
+
+class BufferedBatchWriter:
+    """Bounded in-memory queue of rows for one table, flushed in batches"""
+
+    # Set by subclasses
+    model = None
+    log_label = "BATCH WRITER"
+    row_noun = "rows"
+
+    def __init__(
+        self,
+        session_factory=AsyncSessionLocal,
+        batch_size: int = 200,
+        flush_interval_seconds: float = 1.0,
+        max_queue_size: int = 10000
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_queue_size = max_queue_size
+
+        self._buffer: List[Dict[str, Any]] = []
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+
+        self._enqueued = 0
+        self._written = 0
+        self._dropped = 0
+        self._failed_batches = 0
+
+    def enqueue(self, row: Dict[str, Any]) -> bool:
+        """
+        Queue a row for the next batch
+
+        Args:
+            row: Column values for the model
+
+        Returns:
+            True if queued, False if dropped because the buffer is full
+        """
+        if len(self._buffer) >= self.max_queue_size:
+            self._dropped += 1
+            return False
+
+        self._ensure_started()
+        self._buffer.append(row)
+        self._enqueued += 1
+
+        if len(self._buffer) >= self.batch_size:
+            self._wakeup.set()
+
+        return True
+
+    async def flush(self) -> int:
+        """
+        Write every buffered row
+
+        Returns:
+            Number of rows written
+        """
+        written = 0
+
+        async with self._flush_lock:
+            if self._buffer:
+                await self._before_flush()
+
+            while self._buffer:
+                batch = self._buffer[:self.batch_size]
+                del self._buffer[:self.batch_size]
+
+                try:
+                    async with self.session_factory() as session:
+                        await session.execute(insert(self.model), batch)
+                        await session.commit()
+                except Exception as e:
+                    self._failed_batches += 1
+                    print(f"⚠️ {self.log_label} - Failed to write {len(batch)} {self.row_noun}: {e}")
+                    # Put the batch back (within the bound) and retry on the next cycle
+                    room = self.max_queue_size - len(self._buffer)
+                    self._buffer[:0] = batch[:room]
+                    self._dropped += len(batch) - min(room, len(batch))
+                    break
+
+                written += len(batch)
+                self._written += len(batch)
+
+        return written
+
+    async def close(self) -> None:
+        """Stop the background flusher and write remaining rows"""
+        self._closed = True
+
+        if self._task is not None:
+            self._wakeup.set()
+            await self._task
+            self._task = None
+
+        await self.flush()
+
+    def stats(self) -> Dict[str, int]:
+        """Get queue counters for this worker"""
+        return {
+            "queued": len(self._buffer),
+            "max_queue_size": self.max_queue_size,
+            "enqueued": self._enqueued,
+            "written": self._written,
+            "dropped": self._dropped,
+            "failed_batches": self._failed_batches
+        }
+
+    async def _before_flush(self) -> None:
+        """Hook run (under the flush lock) before buffered rows are written"""
+        pass
+
+    def _ensure_started(self) -> None:
+        """Start the background flusher on first use"""
+        if self._task is None and not self._closed:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        """Flush on size (wakeup) or time thresholds until closed"""
+        while not self._closed:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+            self._wakeup.clear()
+            await self.flush()
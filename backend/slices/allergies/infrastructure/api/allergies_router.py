@@ -6,9 +6,11 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from shared.database.database import get_db
-from slices.auth.infrastructure.api.auth_endpoints import get_current_user
+from slices.auth.domain.entities.authenticated_identity import AuthenticatedIdentity
+from slices.auth.infrastructure.api.auth_endpoints import get_current_user, get_current_identity
 from slices.signup.domain.models.user_model import User
 from slices.signup.domain.models.patient_model import Patient
+from slices.signup.infrastructure.persistence.patient_data_change_notifier import get_patient_data_change_notifier
 
 from slices.allergies.application.use_cases.manage_allergies import ManageAllergiesUseCase
 from slices.allergies.infrastructure.repositories.allergy_repository import AllergyRepository
@@ -23,13 +25,13 @@ router = APIRouter(prefix="/api/allergies", tags=["Allergies"])
 
 def get_allergy_use_case(db: Session = Depends(get_db)) -> ManageAllergiesUseCase:
     """Dependency to get allergy use case"""
-    allergy_repository = AllergyRepository(db)
+    allergy_repository = AllergyRepository(db, get_patient_data_change_notifier())
     return ManageAllergiesUseCase(allergy_repository)
 
 
-async def get_patient_from_user(user: User, db: Session) -> Patient:
-    """Get patient record from authenticated user"""
-    patient = db.query(Patient).filter(Patient.user_id == user.id).first()
+async def get_patient_from_user(identity: AuthenticatedIdentity) -> Patient:
+    """Get patient record from the identity resolved for this request"""
+    patient = await identity.get_patient()
     if not patient:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -42,7 +44,7 @@ async def get_patient_from_user(user: User, db: Session) -> Patient:
 async def get_allergies(
     current_user: User = Depends(get_current_user),
     allergy_use_case: ManageAllergiesUseCase = Depends(get_allergy_use_case),
-    db: Session = Depends(get_db)
+    identity: AuthenticatedIdentity = Depends(get_current_identity)
 ):
     """Get all allergies for authenticated patient"""
     if current_user.user_type != "patient":
@@ -51,7 +53,7 @@ async def get_allergies(
             detail="Only patients can access allergy data"
         )
 
-    patient = await get_patient_from_user(current_user, db)
+    patient = await get_patient_from_user(identity)
     return await allergy_use_case.get_patient_allergies(patient.id)
 
 
@@ -60,7 +62,7 @@ async def get_allergy(
     allergy_id: int,
     current_user: User = Depends(get_current_user),
     allergy_use_case: ManageAllergiesUseCase = Depends(get_allergy_use_case),
-    db: Session = Depends(get_db)
+    identity: AuthenticatedIdentity = Depends(get_current_identity)
 ):
     """Get a specific allergy by ID"""
     if current_user.user_type != "patient":
@@ -69,7 +71,7 @@ async def get_allergy(
             detail="Only patients can access allergy data"
         )
 
-    patient = await get_patient_from_user(current_user, db)
+    patient = await get_patient_from_user(identity)
     allergy = await allergy_use_case.get_allergy_by_id(allergy_id, patient.id)
 
     if not allergy:
@@ -86,7 +88,7 @@ async def create_allergy(
     allergy_data: CreateAllergyDTO,
     current_user: User = Depends(get_current_user),
     allergy_use_case: ManageAllergiesUseCase = Depends(get_allergy_use_case),
-    db: Session = Depends(get_db)
+    identity: AuthenticatedIdentity = Depends(get_current_identity)
 ):
     """Create a new allergy record"""
     if current_user.user_type != "patient":
@@ -95,7 +97,7 @@ async def create_allergy(
             detail="Only patients can create allergy records"
         )
 
-    patient = await get_patient_from_user(current_user, db)
+    patient = await get_patient_from_user(identity)
     return await allergy_use_case.create_allergy(allergy_data, patient.id)
 
 
@@ -105,7 +107,7 @@ async def update_allergy(
     allergy_data: UpdateAllergyDTO,
     current_user: User = Depends(get_current_user),
     allergy_use_case: ManageAllergiesUseCase = Depends(get_allergy_use_case),
-    db: Session = Depends(get_db)
+    identity: AuthenticatedIdentity = Depends(get_current_identity)
 ):
     """Update an existing allergy record"""
     if current_user.user_type != "patient":
@@ -114,7 +116,7 @@ async def update_allergy(
             detail="Only patients can update allergy records"
         )
 
-    patient = await get_patient_from_user(current_user, db)
+    patient = await get_patient_from_user(identity)
     updated_allergy = await allergy_use_case.update_allergy(allergy_id, allergy_data, patient.id)
 
     if not updated_allergy:
@@ -131,7 +133,7 @@ async def delete_allergy(
     allergy_id: int,
     current_user: User = Depends(get_current_user),
     allergy_use_case: ManageAllergiesUseCase = Depends(get_allergy_use_case),
-    db: Session = Depends(get_db)
+    identity: AuthenticatedIdentity = Depends(get_current_identity)
 ):
     """Delete an allergy record"""
     if current_user.user_type != "patient":
@@ -140,7 +142,7 @@ async def delete_allergy(
             detail="Only patients can delete allergy records"
         )
 
-    patient = await get_patient_from_user(current_user, db)
+    patient = await get_patient_from_user(identity)
     success = await allergy_use_case.delete_allergy(allergy_id, patient.id)
 
     if not success:
@@ -9,13 +9,15 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from slices.allergies.application.ports.allergy_repository import AllergyRepositoryPort
 from slices.allergies.domain.models.allergy_model import PatientAllergy
+from slices.signup.application.ports.patient_data_change_port import PatientDataChangePort
 
 
 class AllergyRepository(AllergyRepositoryPort):
     """SQLAlchemy implementation of allergy repository"""
 
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Session, patient_data_changes: PatientDataChangePort):
         self.db = db_session
+        self.patient_data_changes = patient_data_changes
 
     async def get_allergies_by_patient_id(self, patient_id: UUID) -> List[PatientAllergy]:
         """Get all allergies for a specific patient"""
@@ -42,6 +44,7 @@ class AllergyRepository(AllergyRepositoryPort):
         """Create a new allergy record"""
         try:
             self.db.add(allergy)
+            self.patient_data_changes.patient_data_changed(self.db, allergy.patient_id)
             self.db.commit()
             self.db.refresh(allergy)
             return allergy
@@ -66,6 +69,7 @@ class AllergyRepository(AllergyRepositoryPort):
                 if hasattr(allergy, key):
                     setattr(allergy, key, value)
 
+            self.patient_data_changes.patient_data_changed(self.db, patient_id)
             self.db.commit()
             self.db.refresh(allergy)
             return allergy
@@ -87,6 +91,7 @@ class AllergyRepository(AllergyRepositoryPort):
                 return False
 
             self.db.delete(allergy)
+            self.patient_data_changes.patient_data_changed(self.db, patient_id)
             self.db.commit()
             return True
         except SQLAlchemyError as e:
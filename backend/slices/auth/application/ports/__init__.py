@@ -3,10 +3,12 @@ Authentication application ports (interfaces)
 """
 from .auth_repository import AuthRepository
 from .login_attempt_repository import LoginAttemptRepository
+from .rate_limit_backend import RateLimitBackend
 from .user_session_repository import UserSessionRepository
 
 __all__ = [
     "AuthRepository",
     "LoginAttemptRepository",
+    "RateLimitBackend",
     "UserSessionRepository"
 ]
\ No newline at end of file
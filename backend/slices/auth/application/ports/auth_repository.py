@@ -5,6 +5,8 @@ from abc import ABC, abstractmethod
 from typing import Optional, Tuple
 from uuid import UUID
 
+from slices.auth.domain.entities.login_context import LoginContext
+from slices.auth.domain.models.user_session_model import UserSession
 from slices.signup.domain.models.user_model import User
 from slices.signup.domain.models.patient_model import Patient
 
@@ -27,6 +29,29 @@ class AuthRepository(ABC):
         """Get user with patient data by email for authentication with profile data"""
         pass
 
+    @abstractmethod
+    async def get_patient_by_user_id(self, user_id: UUID) -> Optional[Patient]:
+        """Get the patient record of a user (None for non-patient users)"""
+        pass
+
+    @abstractmethod
+    async def get_identity_by_session_token(
+        self,
+        session_token: str
+    ) -> Optional[Tuple[UserSession, User, Optional[Patient], bool]]:
+        """Get active session, user, patient and lock state for an access token in one query"""
+        pass
+
+    @abstractmethod
+    async def get_login_context_by_email(self, email: str) -> Optional[LoginContext]:
+        """Get user, patient, lock state and active subscription status by email in one query"""
+        pass
+
+    @abstractmethod
+    async def apply_successful_login(self, user: User) -> None:
+        """Set last login, clear lockout state and commit together with any staged login writes"""
+        pass
+
     @abstractmethod
     async def update_last_login(self, user_id: UUID) -> None:
         """Update user's last login timestamp"""
@@ -19,9 +19,10 @@ class LoginAttemptRepository(ABC):
         user_agent: str,
         success: bool,
         failure_reason: Optional[str] = None,
-        user_id: Optional[str] = None
+        user_id: Optional[str] = None,
+        commit: bool = True
     ) -> LoginAttempt:
-        """Record a login attempt"""
+        """Record a login attempt (commit=False stages it in the current transaction)"""
         pass
 
     @abstractmethod
@@ -0,0 +1,23 @@
+"""
+Sliding-window rate limit backend interface (port)
+"""
+from abc import ABC, abstractmethod
+
+
+class RateLimitBackend(ABC):
+    """Interface for sliding-window event counters"""
+
+    @abstractmethod
+    async def count(self, key: str, window_seconds: int) -> int:
+        """Count events recorded for key within the last window_seconds"""
+        pass
+
+    @abstractmethod
+    async def hit(self, key: str, window_seconds: int) -> int:
+        """Record an event for key and return the count within the window"""
+        pass
+
+    @abstractmethod
+    async def retry_after(self, key: str, window_seconds: int, limit: int) -> int:
+        """Seconds until fewer than limit events remain for key within the window (0 if already below)"""
+        pass
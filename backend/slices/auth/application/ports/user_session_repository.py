@@ -21,9 +21,10 @@ class UserSessionRepository(ABC):
         ip_address: str,
         user_agent: str,
         expires_at: datetime,
-        refresh_expires_at: Optional[datetime] = None
+        refresh_expires_at: Optional[datetime] = None,
+        commit: bool = True
     ) -> UserSession:
-        """Create a new user session"""
+        """Create a new user session (commit=False stages it in the current transaction)"""
         pass
 
     @abstractmethod
@@ -2,14 +2,13 @@
 Authenticate User Use Case
 """
 from typing import Dict, Any, Optional
-from datetime import datetime, timedelta
-from fastapi import HTTPException, status
 
 from slices.auth.application.dto import LoginRequestDto, LoginResponseDto, UserResponseDto, LoginErrorResponseDto
 from slices.auth.application.ports import AuthRepository, LoginAttemptRepository, UserSessionRepository
+from slices.auth.domain.entities.authenticated_identity import build_profile_info
 from slices.auth.infrastructure.security.password_service import PasswordService
 from slices.auth.infrastructure.security.jwt_service import JWTService
-from slices.subscriptions.infrastructure.persistence.subscription_repository import SubscriptionRepository
+from slices.auth.infrastructure.rate_limiting.login_rate_limiter import LoginRateLimiter, get_login_rate_limiter
 
 
 class AuthenticateUserUseCase:
@@ -22,14 +21,14 @@ class AuthenticateUserUseCase:
         user_session_repository: UserSessionRepository,
         password_service: PasswordService,
         jwt_service: JWTService,
-        subscription_repository: Optional[SubscriptionRepository] = None
+        rate_limiter: Optional[LoginRateLimiter] = None
     ):
         self.auth_repository = auth_repository
         self.login_attempt_repository = login_attempt_repository
         self.user_session_repository = user_session_repository
         self.password_service = password_service
         self.jwt_service = jwt_service
-        self.subscription_repository = subscription_repository
+        self.rate_limiter = rate_limiter or get_login_rate_limiter()
 
     async def execute(
         self,
@@ -40,6 +39,12 @@ class AuthenticateUserUseCase:
         """
         Authenticate user with comprehensive security checks
 
+        A successful login costs one SELECT (user, patient, lock state and
+        subscription status) and one transaction that inserts the session,
+        updates the user's login state and, when the audit sink is disabled,
+        inserts the login attempt. All repositories share the request's
+        database session, so staged writes are committed together.
+
         Args:
             login_request: Login credentials and options
             ip_address: Client IP address for rate limiting
@@ -51,25 +56,27 @@ class AuthenticateUserUseCase:
         # Step 1: Rate limiting checks
         await self._check_rate_limits(login_request.email, ip_address)
 
-        # Step 2: Get user by email (support all user types, not just patients)
-        user = await self.auth_repository.get_user_by_email(login_request.email)
+        # Step 2: Load user, patient, lock state and subscription status in one query
+        login_context = await self.auth_repository.get_login_context_by_email(login_request.email)
 
         # Step 3: Verify user exists and account status
-        if not user:
+        if not login_context:
             await self._record_failed_attempt(
                 login_request.email, ip_address, user_agent, "user_not_found"
             )
             return self._create_error_response("Email o contraseña incorrectos")
 
-        # Check if user is locked
-        if await self.auth_repository.is_user_locked(user.id):
+        user = login_context.user
+
+        # Check if user is locked (expired locks are cleared on the next successful login)
+        if login_context.is_locked:
             await self._record_failed_attempt(
                 login_request.email, ip_address, user_agent, "account_locked", str(user.id)
             )
             return self._create_error_response("Cuenta bloqueada. Contacte al soporte.")
 
         # Step 4: Verify password
-        if not self.password_service.verify_password(login_request.password, user.password_hash):
+        if not await self.password_service.verify_password_async(login_request.password, user.password_hash):
             await self._record_failed_attempt(
                 login_request.email, ip_address, user_agent, "invalid_password", str(user.id)
             )
@@ -94,11 +101,17 @@ class AuthenticateUserUseCase:
             return self._create_error_response("Email no verificado. Revisa tu bandeja de entrada.")
 
         # Step 6: Successful authentication - generate tokens
+        # Stateless validation serves /me and /validate from the profile claim
+        additional_claims = None
+        if self.jwt_service.stateless_validation:
+            additional_claims = {"profile": build_profile_info(user, login_context.patient)}
+
         token_data = self.jwt_service.create_access_token(
             user_id=str(user.id),
             email=user.email,
             user_type=user.user_type,
-            remember_me=login_request.remember_me
+            remember_me=login_request.remember_me,
+            additional_claims=additional_claims
         )
 
         refresh_token_data = self.jwt_service.create_refresh_token(
@@ -106,44 +119,13 @@ class AuthenticateUserUseCase:
             session_id=token_data["session_id"]
         )
 
-        # Step 7: Create session record
-        session = await self.user_session_repository.create_session(
-            user_id=user.id,
-            session_token=token_data["access_token"],
-            refresh_token=refresh_token_data["refresh_token"],
-            ip_address=ip_address,
-            user_agent=user_agent,
-            expires_at=token_data["expires_at"],
-            refresh_expires_at=refresh_token_data["expires_at"]
-        )
-
-        # Step 8: Update user login info
-        await self.auth_repository.update_last_login(user.id)
-        await self.auth_repository.reset_failed_login_attempts(user.id)
-
-        # Step 9: Record successful attempt
-        await self._record_successful_attempt(login_request.email, ip_address, user_agent, str(user.id))
-
-        # Step 10: Get patient data if user is a patient
-        patient = None
-        if user.user_type == 'patient':
-            patient = await self.auth_repository.get_patient_by_user_id(user.id)
-
-        # Step 11: Check if user has active subscription
-        has_active_subscription = False
-        if self.subscription_repository:
-            try:
-                subscription = await self.subscription_repository.get_user_active_subscription(user.id)
-                has_active_subscription = subscription is not None
-            except Exception as e:
-                # Log error but continue - subscription check is not critical for login
-                print(f"Error checking subscription: {e}")
-                has_active_subscription = False
-
-        # Step 12: Determine redirect URL based on user type, profile completeness, and subscription
+        # Step 7: Determine redirect URL based on user type, profile completeness, and subscription
+        patient = login_context.login_patient
+        has_active_subscription = login_context.has_active_subscription
         redirect_url = self._get_redirect_url(user, has_active_subscription)
 
-        # Step 13: Create response - handle both patients and non-patients (paramedics, etc.)
+        # Step 8: Create response - handle both patients and non-patients (paramedics, etc.)
+        # Built before the commit below, which expires loaded attributes
         if patient:
             # Patient user - use patient profile data
             user_response = UserResponseDto(
@@ -177,6 +159,22 @@ class AuthenticateUserUseCase:
                 has_active_subscription=has_active_subscription
             )
 
+        # Step 9: Stage session and successful attempt, then commit with the user's login state
+        await self.user_session_repository.create_session(
+            user_id=user.id,
+            session_token=token_data["access_token"],
+            refresh_token=refresh_token_data["refresh_token"],
+            ip_address=ip_address,
+            user_agent=user_agent,
+            expires_at=token_data["expires_at"],
+            refresh_expires_at=refresh_token_data["expires_at"],
+            commit=False
+        )
+        await self._record_successful_attempt(
+            login_request.email, ip_address, user_agent, str(user.id), commit=False
+        )
+        await self.auth_repository.apply_successful_login(user)
+
         return {
             "success": True,
             "data": LoginResponseDto(
@@ -189,33 +187,14 @@ class AuthenticateUserUseCase:
         }
 
     async def _check_rate_limits(self, email: str, ip_address: str) -> None:
-        """Check rate limiting for email and IP"""
-        now = datetime.utcnow()
-
-        # Check IP-based rate limiting (15 attempts per hour)
-        ip_failures = await self.login_attempt_repository.count_failures_by_ip(
-            ip_address, now - timedelta(hours=1)
-        )
-        if ip_failures >= 15:
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail="Demasiados intentos desde esta IP. Intente más tarde."
-            )
-
-        # Check email-based rate limiting (5 attempts per 15 minutes)
-        email_failures = await self.login_attempt_repository.count_failures_by_email(
-            email, now - timedelta(minutes=15)
-        )
-        if email_failures >= 5:
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail="Demasiados intentos para este email. Intente en 15 minutos."
-            )
+        """Check rate limiting for email and IP (sliding windows, no audit table reads)"""
+        await self.rate_limiter.check(email, ip_address)
 
     async def _record_failed_attempt(
         self, email: str, ip_address: str, user_agent: str, reason: str, user_id: Optional[str] = None
     ) -> None:
         """Record failed login attempt"""
+        await self.rate_limiter.record_failure(email, ip_address)
         await self.login_attempt_repository.create_attempt(
             email=email,
             ip_address=ip_address,
@@ -226,7 +205,7 @@ class AuthenticateUserUseCase:
         )
 
     async def _record_successful_attempt(
-        self, email: str, ip_address: str, user_agent: str, user_id: str
+        self, email: str, ip_address: str, user_agent: str, user_id: str, commit: bool = True
     ) -> None:
         """Record successful login attempt"""
         await self.login_attempt_repository.create_attempt(
@@ -234,7 +213,8 @@ class AuthenticateUserUseCase:
             ip_address=ip_address,
             user_agent=user_agent,
             success=True,
-            user_id=user_id
+            user_id=user_id,
+            commit=commit
         )
 
     def _create_error_response(self, message: str, attempts_remaining: Optional[int] = None) -> Dict[str, Any]:
@@ -2,10 +2,16 @@
 Validate Token Use Case
 """
 from typing import Dict, Any, Optional
+from uuid import UUID
 from fastapi import HTTPException, status
 
 from slices.auth.application.ports import AuthRepository, UserSessionRepository
+from slices.auth.domain.entities.authenticated_identity import AuthenticatedIdentity, build_user_info
 from slices.auth.infrastructure.security.jwt_service import JWTService
+from slices.auth.infrastructure.security.session_revocation_list import SessionRevocationList
+from slices.auth.infrastructure.security.token_digest import hash_token
+from slices.auth.infrastructure.security.token_validation_cache import TokenValidationCache
+from slices.signup.domain.models.user_model import User
 
 
 class ValidateTokenUseCase:
@@ -15,16 +21,25 @@ class ValidateTokenUseCase:
         self,
         auth_repository: AuthRepository,
         user_session_repository: UserSessionRepository,
-        jwt_service: JWTService
+        jwt_service: JWTService,
+        token_cache: Optional[TokenValidationCache] = None,
+        revocation_list: Optional[SessionRevocationList] = None
     ):
         self.auth_repository = auth_repository
         self.user_session_repository = user_session_repository
         self.jwt_service = jwt_service
+        self.token_cache = token_cache
+        self.revocation_list = revocation_list
 
     async def execute(self, token: str) -> Dict[str, Any]:
         """
         Validate JWT token and return user information
 
+        When a token cache is configured, recently validated tokens are served
+        from it without decoding the JWT or querying the database. When a
+        revocation list is configured (stateless mode), eligible tokens are
+        accepted on signature, expiry and the revocation list alone.
+
         Args:
             token: JWT access token to validate
 
@@ -34,89 +49,74 @@ class ValidateTokenUseCase:
         Raises:
             HTTPException: If token is invalid or expired
         """
-        print(f"🔍 VALIDATE TOKEN DEBUG - Starting validation process:")
-        print(f"   Token length: {len(token)}")
-        print(f"   Token preview: {token[:50]}...")
+        if self.token_cache:
+            cached_user_info = self.token_cache.get(token)
+            if cached_user_info is not None:
+                return cached_user_info
+
+        if self.revocation_list:
+            stateless_user_info = await self._validate_stateless(token)
+            if stateless_user_info is not None:
+                return stateless_user_info
+
+        identity = await self.resolve_identity(token)
+        user_info = identity.to_user_info()
+
+        if self.token_cache:
+            self.token_cache.put(
+                token,
+                user_info,
+                user_id=str(identity.user.id),
+                session_pk=identity.session.id,
+                token_expires_at=identity.session.expires_at
+            )
+
+        return user_info
+
+    async def resolve_identity(self, token: str) -> AuthenticatedIdentity:
+        """
+        Validate JWT token and resolve session, user, lock state and patient
+
+        The session, user, patient and lock state are fetched together in a
+        single joined query.
 
+        Args:
+            token: JWT access token to validate
+
+        Returns:
+            AuthenticatedIdentity for the token owner
+
+        Raises:
+            HTTPException: If token is invalid, expired, revoked or the account is locked
+        """
         # Step 1: Verify and decode JWT token
-        try:
-            print(f"🔍 VALIDATE TOKEN DEBUG - Step 1: Verifying JWT token...")
-            payload = self.jwt_service.verify_token(token)
-            print(f"   ✅ JWT verification successful")
-            print(f"   Payload: {payload}")
-        except HTTPException as e:
-            print(f"   ❌ JWT verification failed: {e.detail}")
-            raise e
+        payload = self.jwt_service.verify_token(token)
 
         # Step 2: Extract user information from token
-        print(f"🔍 VALIDATE TOKEN DEBUG - Step 2: Extracting token payload...")
         user_id = payload.get("sub")
         session_id = payload.get("session_id")
-        print(f"   User ID: {user_id}")
-        print(f"   Session ID: {session_id}")
 
         if not user_id or not session_id:
-            print(f"   ❌ Missing required payload fields")
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid token payload",
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-        # Step 3: Verify session exists and is active
-        print(f"🔍 VALIDATE TOKEN DEBUG - Step 3: Checking session...")
-        session = await self.user_session_repository.get_session_by_token(token)
-        print(f"   Session found: {'Yes' if session else 'No'}")
-        if session:
-            print(f"   Session ID: {session.id}")
-            print(f"   Session user_id: {session.user_id}")
-            print(f"   Session is_active: {session.is_active}")
-            print(f"   Session is_revoked: {getattr(session, 'is_revoked', 'No is_revoked field')}")
-            print(f"   Session expires_at: {session.expires_at}")
-            print(f"   Session created_at: {session.created_at}")
-            print(f"   Session last_accessed: {session.last_accessed}")
-
-        if not session:
-            print(f"   ❌ Session not found")
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Session not found or revoked",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+        # Step 3: Resolve active session, user, patient and lock state in one round trip
+        result = await self.auth_repository.get_identity_by_session_token(token)
 
-        # Check if session has is_revoked attribute and if it's revoked
-        if hasattr(session, 'is_revoked') and session.is_revoked:
-            print(f"   ❌ Session is revoked")
+        if not result:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Session not found or revoked",
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-        # Step 4: Get user from database
-        print(f"🔍 VALIDATE TOKEN DEBUG - Step 4: Getting user from database...")
-        user = await self.auth_repository.get_user_by_id(user_id)
-        print(f"   User found: {'Yes' if user else 'No'}")
-        if user:
-            print(f"   User ID: {user.id}")
-            print(f"   User email: {user.email}")
-            print(f"   User type: {user.user_type}")
-
-        if not user:
-            print(f"   ❌ User not found")
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User not found",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-
-        # Step 5: Check if user account is locked
-        print(f"🔍 VALIDATE TOKEN DEBUG - Step 5: Checking if user is locked...")
-        is_locked = await self.auth_repository.is_user_locked(user.id)
-        print(f"   User is locked: {is_locked}")
+        session, user, patient, is_locked = result
 
+        # Step 4: Reject locked accounts
         if is_locked:
-            print(f"   ❌ User account is locked, revoking session")
             # Revoke session for locked account
             await self.user_session_repository.revoke_session(session.id)
             raise HTTPException(
@@ -125,43 +125,89 @@ class ValidateTokenUseCase:
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-        # Step 6: Return user information
-        print(f"🔍 VALIDATE TOKEN DEBUG - Step 6: Returning user information...")
-        print(f"   User attributes: {[attr for attr in dir(user) if not attr.startswith('_')]}")
-
-        # Get patient/profile data if available
-        first_name = None
-        last_name = None
-        profile_completed = False
-        mandatory_fields_completed = False
-
-        # Try to get patient record for additional fields
-        try:
-            from slices.signup.domain.models.patient_model import Patient
-            from sqlalchemy.orm import Session
-
-            # Get database session from auth_repository
-            db_session = self.auth_repository.db_session if hasattr(self.auth_repository, 'db_session') else None
-            if db_session:
-                patient = db_session.query(Patient).filter(Patient.user_id == user.id).first()
-                if patient:
-                    first_name = patient.first_name
-                    last_name = patient.last_name
-                    profile_completed = True  # If patient record exists, profile is completed
-                    mandatory_fields_completed = bool(patient.first_name and patient.last_name)
-        except Exception as e:
-            print(f"   ⚠️ Could not get patient data: {e}")
-
-        user_info = {
-            "user_id": str(user.id),
-            "email": user.email,
-            "user_type": user.user_type,
-            "first_name": first_name,
-            "last_name": last_name,
-            "is_verified": user.is_verified,
-            "profile_completed": profile_completed,
-            "mandatory_fields_completed": mandatory_fields_completed,
-            "session_id": session_id
-        }
-        print(f"   ✅ Validation successful, returning user info: {user_info}")
-        return user_info
\ No newline at end of file
+        return AuthenticatedIdentity(
+            user=user,
+            session=session,
+            patient=patient,
+            session_id=session_id
+        )
+
+    async def resolve_identity_stateless(self, token: str) -> Optional[AuthenticatedIdentity]:
+        """
+        Resolve the identity from the token claims without a database lookup
+
+        Only available when a revocation list is configured (stateless mode).
+        The identity has no session, its user carries the id, email, user type
+        and verification flag from the claims, and the patient is loaded by
+        AuthenticatedIdentity.get_patient() only if a router asks for it.
+
+        Args:
+            token: JWT access token to validate
+
+        Returns:
+            AuthenticatedIdentity, or None when the token must be resolved with
+            resolve_identity (no revocation list, not eligible, list stale, or revoked)
+
+        Raises:
+            HTTPException: If the token signature or expiry is invalid
+        """
+        if not self.revocation_list:
+            return None
+
+        payload = await self._verify_stateless(token)
+        if payload is None:
+            return None
+
+        user = User(
+            id=UUID(payload["sub"]),
+            email=payload.get("email"),
+            user_type=payload.get("user_type"),
+            is_verified=payload["profile"].get("is_verified")
+        )
+
+        return AuthenticatedIdentity(
+            user=user,
+            session=None,
+            patient=None,
+            session_id=payload["session_id"],
+            patient_loader=lambda: self.auth_repository.get_patient_by_user_id(user.id)
+        )
+
+    async def _validate_stateless(self, token: str) -> Optional[Dict[str, Any]]:
+        """
+        Validate an access token without a database lookup
+
+        Returns:
+            User information from the token claims, or None when the token must
+            be validated against the database (not eligible, revocation list
+            stale, or revoked - the database path produces the final answer)
+
+        Raises:
+            HTTPException: If the token signature or expiry is invalid
+        """
+        payload = await self._verify_stateless(token)
+        if payload is None:
+            return None
+
+        return build_user_info(
+            user_id=payload["sub"],
+            email=payload.get("email"),
+            user_type=payload.get("user_type"),
+            profile=payload["profile"],
+            session_id=payload["session_id"]
+        )
+
+    async def _verify_stateless(self, token: str) -> Optional[Dict[str, Any]]:
+        """Verified claims of a token acceptable without a session lookup (None otherwise)"""
+        payload = self.jwt_service.verify_token(token)
+
+        if not self.jwt_service.is_stateless_eligible(payload):
+            return None
+
+        if not await self.revocation_list.ensure_fresh():
+            return None
+
+        if self.revocation_list.is_revoked(hash_token(token), payload["sub"], payload["iat"]):
+            return None
+
+        return payload
@@ -0,0 +1,91 @@
+"""
+Authenticated identity domain entity
+"""
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from slices.auth.domain.models.user_session_model import UserSession
+from slices.signup.domain.models.user_model import User
+from slices.signup.domain.models.patient_model import Patient
+
+
+@dataclass
+class AuthenticatedIdentity:
+    """
+    Request-scoped identity of an access token owner
+
+    Resolved from the database (session, user, lock state and patient in a
+    single query) or, for stateless tokens, from the token claims alone: then
+    session is None, user only carries the claims, and the patient is loaded
+    by get_patient() the first time a router needs it.
+    """
+    user: User
+    session: Optional[UserSession]
+    patient: Optional[Patient]
+    session_id: str
+    patient_loader: Optional[Callable[[], Awaitable[Optional[Patient]]]] = field(default=None, repr=False)
+
+    async def get_patient(self) -> Optional[Patient]:
+        """Get the patient record, loading it on first use if it was not resolved with the identity"""
+        if self.patient_loader is not None:
+            self.patient = await self.patient_loader()
+            self.patient_loader = None
+        return self.patient
+
+    @property
+    def is_patient(self) -> bool:
+        """Whether the identity belongs to a patient with a patient record"""
+        return self.user.user_type == "patient" and self.patient is not None
+
+    def to_user_info(self) -> Dict[str, Any]:
+        """Build the user information payload returned by /me and /validate"""
+        return build_user_info(
+            user_id=str(self.user.id),
+            email=self.user.email,
+            user_type=self.user.user_type,
+            profile=build_profile_info(self.user, self.patient),
+            session_id=self.session_id
+        )
+
+
+def build_profile_info(user: User, patient: Optional[Patient]) -> Dict[str, Any]:
+    """Profile fields of the user information payload (also embedded in stateless access tokens)"""
+    first_name = None
+    last_name = None
+    profile_completed = False
+    mandatory_fields_completed = False
+
+    if patient:
+        first_name = patient.first_name
+        last_name = patient.last_name
+        profile_completed = True  # If patient record exists, profile is completed
+        mandatory_fields_completed = bool(patient.first_name and patient.last_name)
+
+    return {
+        "first_name": first_name,
+        "last_name": last_name,
+        "is_verified": user.is_verified,
+        "profile_completed": profile_completed,
+        "mandatory_fields_completed": mandatory_fields_completed
+    }
+
+
+def build_user_info(
+    user_id: str,
+    email: str,
+    user_type: str,
+    profile: Dict[str, Any],
+    session_id: str
+) -> Dict[str, Any]:
+    """Assemble the user information payload returned by /me and /validate"""
+    return {
+        "user_id": user_id,
+        "email": email,
+        "user_type": user_type,
+        "first_name": profile.get("first_name"),
+        "last_name": profile.get("last_name"),
+        "is_verified": profile.get("is_verified"),
+        "profile_completed": profile.get("profile_completed"),
+        "mandatory_fields_completed": profile.get("mandatory_fields_completed"),
+        "session_id": session_id
+    }
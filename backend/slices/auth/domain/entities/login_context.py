@@ -0,0 +1,24 @@
+"""
+Login context domain entity
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+from slices.signup.domain.models.user_model import User
+from slices.signup.domain.models.patient_model import Patient
+
+
+@dataclass
+class LoginContext:
+    """User, patient, lock state and subscription status loaded for a login in a single query"""
+    user: User
+    patient: Optional[Patient]
+    is_locked: bool
+    has_active_subscription: bool
+
+    @property
+    def login_patient(self) -> Optional[Patient]:
+        """Patient record used for the login response (only for patient users)"""
+        if self.user.user_type == "patient":
+            return self.patient
+        return None
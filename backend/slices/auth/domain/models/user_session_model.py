@@ -18,8 +18,12 @@ class UserSession(Base):
 
     # Core session data
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
-    session_token = Column(String(1000), nullable=False, unique=True, index=True)
-    refresh_token = Column(String(1000), nullable=True, unique=True, index=True)
+    session_token = Column(String(1000), nullable=False)
+    refresh_token = Column(String(1000), nullable=True)
+
+    # SHA-256 hex digests of the tokens - fixed-width keys for indexed point lookups
+    session_token_digest = Column(String(64), nullable=False, unique=True, index=True)
+    refresh_token_digest = Column(String(64), nullable=True, unique=True, index=True)
 
     # Token expiration management
     expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
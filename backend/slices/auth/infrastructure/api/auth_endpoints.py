@@ -1,11 +1,14 @@
 """
 Authentication API endpoints
 """
+import logging
+
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from typing import Dict, Any, Union
 
+from shared.config.settings import settings
 from shared.database import get_db
 from slices.auth.application.dto import LoginRequestDto, LoginResponseDto, LoginErrorResponseDto
 from slices.auth.application.use_cases import (
@@ -14,6 +17,7 @@ from slices.auth.application.use_cases import (
     LogoutUserUseCase,
     RefreshTokenUseCase
 )
+from slices.auth.domain.entities.authenticated_identity import AuthenticatedIdentity
 from slices.auth.infrastructure.persistence import (
     SQLAlchemyAuthRepository,
     SQLAlchemyLoginAttemptRepository,
@@ -21,7 +25,13 @@ from slices.auth.infrastructure.persistence import (
 )
 from slices.auth.infrastructure.security.password_service import PasswordService
 from slices.auth.infrastructure.security.jwt_service_singleton import get_jwt_service
-from slices.subscriptions.infrastructure.persistence.subscription_repository import SubscriptionRepository
+from slices.auth.infrastructure.security.token_validation_cache import get_token_validation_cache
+from slices.auth.infrastructure.security.session_revocation_list import get_session_revocation_list
+from slices.auth.infrastructure.rate_limiting import get_login_rate_limiter
+from slices.auth.infrastructure.persistence.login_attempt_audit_sink import get_login_attempt_audit_sink
+from slices.signup.domain.models.user_model import User
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/auth", tags=["Authentication"])
 security = HTTPBearer()
@@ -31,9 +41,11 @@ security = HTTPBearer()
 def get_auth_use_case(db: Session = Depends(get_db)) -> AuthenticateUserUseCase:
     """Dependency injection for AuthenticateUserUseCase"""
     auth_repository = SQLAlchemyAuthRepository(db)
-    login_attempt_repository = SQLAlchemyLoginAttemptRepository(db)
+    login_attempt_repository = SQLAlchemyLoginAttemptRepository(
+        db,
+        audit_sink=get_login_attempt_audit_sink() if settings.LOGIN_AUDIT_BUFFERED else None
+    )
     user_session_repository = SQLAlchemyUserSessionRepository(db)
-    subscription_repository = SubscriptionRepository(db)
     password_service = PasswordService()
     jwt_service = get_jwt_service()
 
@@ -43,7 +55,7 @@ def get_auth_use_case(db: Session = Depends(get_db)) -> AuthenticateUserUseCase:
         user_session_repository=user_session_repository,
         password_service=password_service,
         jwt_service=jwt_service,
-        subscription_repository=subscription_repository
+        rate_limiter=get_login_rate_limiter()
     )
 
 
@@ -56,7 +68,11 @@ def get_validate_token_use_case(db: Session = Depends(get_db)) -> ValidateTokenU
     return ValidateTokenUseCase(
         auth_repository=auth_repository,
         user_session_repository=user_session_repository,
-        jwt_service=jwt_service
+        jwt_service=jwt_service,
+        token_cache=get_token_validation_cache(),
+        revocation_list=(
+            get_session_revocation_list() if settings.TOKEN_VALIDATION_MODE == "stateless" else None
+        )
     )
 
 
@@ -257,64 +273,72 @@ async def validate_token(
         return {"valid": False}
 
 
-# Dependency function for authentication
-async def get_current_user(
+# Dependency functions for authentication
+async def get_current_identity(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
-) -> 'User':
+) -> AuthenticatedIdentity:
     """
-    Dependency to get current authenticated user from JWT token
-    Returns User object for use in protected endpoints
+    Dependency to resolve the authenticated identity from the JWT token
+
+    In stateless mode (TOKEN_VALIDATION_MODE=stateless) eligible tokens are
+    resolved from their claims and the revocation list, without a query;
+    routers that need the patient load it with identity.get_patient().
+    Otherwise session, user, lock state and patient are loaded in a single
+    query. FastAPI caches dependencies per request, so every router that
+    depends on this (directly or through get_current_user) reuses the same
+    identity.
     """
     try:
-        print(f"🔍 GET_CURRENT_USER DEBUG - Starting authentication:")
         token = credentials.credentials
-        print(f"   Token length: {len(token)}")
-        print(f"   Token preview: {token[:50]}...")
-
-        # Create use case with proper dependency injection
-        auth_repository = SQLAlchemyAuthRepository(db)
-        user_session_repository = SQLAlchemyUserSessionRepository(db)
-        jwt_service = get_jwt_service()
 
         use_case = ValidateTokenUseCase(
-            auth_repository=auth_repository,
-            user_session_repository=user_session_repository,
-            jwt_service=jwt_service
+            auth_repository=SQLAlchemyAuthRepository(db),
+            user_session_repository=SQLAlchemyUserSessionRepository(db),
+            jwt_service=get_jwt_service(),
+            revocation_list=(
+                get_session_revocation_list() if settings.TOKEN_VALIDATION_MODE == "stateless" else None
+            )
         )
 
-        print(f"🔍 GET_CURRENT_USER DEBUG - About to execute ValidateTokenUseCase...")
-        user_data = await use_case.execute(token)
-        print(f"🔍 GET_CURRENT_USER DEBUG - ValidateTokenUseCase completed successfully")
-        print(f"   User data: {user_data}")
+        identity = await use_case.resolve_identity_stateless(token)
+        if identity is None:
+            identity = await use_case.resolve_identity(token)
+        return identity
 
-        # Import here to avoid circular imports
-        from slices.signup.domain.models.user_model import User
+    except HTTPException:
+        raise
 
-        # Get the actual User object from the database using the validated user_id
-        user_id = user_data["user_id"]
-        print(f"🔍 GET_CURRENT_USER DEBUG - Getting user by ID: {user_id}")
-        user = await auth_repository.get_user_by_id(user_id)
+    except Exception:
+        logger.exception("Unexpected error resolving the authenticated identity")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token"
+        )
 
-        if not user:
-            print(f"🔍 GET_CURRENT_USER DEBUG - ❌ User not found in database")
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User not found"
-            )
 
-        print(f"🔍 GET_CURRENT_USER DEBUG - ✅ Authentication successful for user: {user.email}")
-        return user
+async def get_current_user(
+    identity: AuthenticatedIdentity = Depends(get_current_identity)
+) -> User:
+    """
+    Dependency to get current authenticated user from JWT token
+    Returns User object for use in protected endpoints
+    """
+    return identity.user
 
-    except HTTPException as e:
-        print(f"🔍 GET_CURRENT_USER DEBUG - ❌ HTTPException: {e.detail}")
-        raise
 
-    except Exception as e:
-        print(f"🔍 GET_CURRENT_USER DEBUG - ❌ Unexpected exception: {type(e).__name__}: {str(e)}")
-        import traceback
-        print(f"🔍 GET_CURRENT_USER DEBUG - ❌ Traceback: {traceback.format_exc()}")
+def get_current_admin_user(
+    current_user: User = Depends(get_current_user)
+) -> User:
+    """
+    Dependency to verify user is an admin
+
+    Raises:
+        HTTPException 403: If user is not an admin
+    """
+    if current_user.user_type != "admin":
         raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token"
-        )
\ No newline at end of file
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied. Only admins can access this endpoint."
+        )
+    return current_user
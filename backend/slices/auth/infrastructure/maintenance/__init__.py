@@ -0,0 +1,18 @@
+"""
+Authentication infrastructure maintenance jobs
+"""
+from .session_maintenance import (
+    SessionMaintenanceJob,
+    SessionMaintenanceReport,
+    SessionMaintenanceScheduler,
+    get_session_maintenance_scheduler,
+    reset_session_maintenance_scheduler
+)
+
+__all__ = [
+    "SessionMaintenanceJob",
+    "SessionMaintenanceReport",
+    "SessionMaintenanceScheduler",
+    "get_session_maintenance_scheduler",
+    "reset_session_maintenance_scheduler"
+]
@@ -0,0 +1,325 @@
+"""
+Set-based user_sessions maintenance
+
+Keeps user_sessions bounded without loading rows into Python:
+
+1. deactivate_expired - marks sessions whose access and refresh tokens have
+   both expired as inactive (batched UPDATE)
+2. purge - deletes sessions that expired, or were revoked, more than the
+   retention period ago (batched DELETE)
+
+Each batch addresses at most batch_size rows by ctid and commits on its own,
+so locks are short and autovacuum can keep up. A session-level advisory lock
+ensures only one worker or CLI run does the work at a time.
+
+Usage:
+    # Run once from the command line (from backend/)
+    poetry run python -m slices.auth.infrastructure.maintenance.session_maintenance
+    poetry run python -m slices.auth.infrastructure.maintenance.session_maintenance --batch-size 10000 --retention-days 3
+
+    # Run periodically in-process (started from the application lifespan)
+    scheduler = get_session_maintenance_scheduler()
+    scheduler.start()
+"""
+import asyncio
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import text
+
+from shared.config.settings import settings
+from shared.database import async_engine
+
+# Arbitrary application-wide key for pg_try_advisory_lock
+SESSION_MAINTENANCE_LOCK_KEY = 742001
+
+DEACTIVATE_EXPIRED_SESSIONS_SQL = text("""
+    UPDATE user_sessions
+    SET is_active = false, last_accessed = now()
+    WHERE ctid IN (
+        SELECT ctid FROM user_sessions
+        WHERE is_active = true
+          AND COALESCE(refresh_expires_at, expires_at) < now()
+        LIMIT :batch_size
+    )
+""")
+
+PURGE_SESSIONS_SQL = text("""
+    DELETE FROM user_sessions
+    WHERE ctid IN (
+        SELECT ctid FROM user_sessions
+        WHERE GREATEST(expires_at, COALESCE(refresh_expires_at, expires_at))
+                < now() - make_interval(days => :retention_days)
+           OR (
+                is_active = false
+                AND expires_at < now()
+                AND last_accessed < now() - make_interval(days => :retention_days)
+           )
+        LIMIT :batch_size
+    )
+""")
+
+
+@dataclass
+class MaintenanceBatch:
+    """Result of a single batched statement"""
+    step: str
+    batch: int
+    rows: int
+    elapsed_ms: float
+
+
+@dataclass
+class SessionMaintenanceReport:
+    """Result of a maintenance run"""
+    started_at: str
+    skipped: bool = False
+    deactivated: int = 0
+    purged: int = 0
+    elapsed_ms: float = 0.0
+    batches: List[MaintenanceBatch] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the report (batches included)"""
+        return asdict(self)
+
+
+class SessionMaintenanceJob:
+    """Batched, set-based expiry and purge of user_sessions"""
+
+    def __init__(
+        self,
+        engine=async_engine,
+        batch_size: int = 5000,
+        retention_days: int = 7,
+        max_batches_per_step: Optional[int] = None
+    ):
+        """
+        Args:
+            engine: Async engine to run the statements on
+            batch_size: Rows per UPDATE/DELETE statement
+            retention_days: Days to keep expired or revoked sessions before purging
+            max_batches_per_step: Stop a step after this many batches (None = until done)
+        """
+        self.engine = engine
+        self.batch_size = batch_size
+        self.retention_days = retention_days
+        self.max_batches_per_step = max_batches_per_step
+
+    async def run_once(self, verbose: bool = False) -> SessionMaintenanceReport:
+        """
+        Run every maintenance step
+
+        Args:
+            verbose: Print each batch as it completes
+
+        Returns:
+            SessionMaintenanceReport with rows affected and time per batch
+        """
+        report = SessionMaintenanceReport(started_at=datetime.now(timezone.utc).isoformat())
+        started = time.perf_counter()
+
+        async with self.engine.connect() as conn:
+            locked = (await conn.execute(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": SESSION_MAINTENANCE_LOCK_KEY}
+            )).scalar()
+            await conn.commit()
+
+            if not locked:
+                # Another worker is already running maintenance
+                report.skipped = True
+                return report
+
+            try:
+                report.deactivated = await self._run_step(
+                    conn, report, "deactivate_expired", DEACTIVATE_EXPIRED_SESSIONS_SQL,
+                    {"batch_size": self.batch_size}, verbose
+                )
+                report.purged = await self._run_step(
+                    conn, report, "purge", PURGE_SESSIONS_SQL,
+                    {"batch_size": self.batch_size, "retention_days": self.retention_days}, verbose
+                )
+            finally:
+                # Leave any failed transaction before releasing the lock
+                await conn.rollback()
+                await conn.execute(
+                    text("SELECT pg_advisory_unlock(:key)"), {"key": SESSION_MAINTENANCE_LOCK_KEY}
+                )
+                await conn.commit()
+
+        report.elapsed_ms = round((time.perf_counter() - started) * 1000, 2)
+        return report
+
+    async def _run_step(
+        self,
+        conn,
+        report: SessionMaintenanceReport,
+        step: str,
+        statement,
+        params: Dict[str, Any],
+        verbose: bool
+    ) -> int:
+        """Repeat a batched statement until it affects fewer rows than the batch size"""
+        total = 0
+        batch_number = 0
+
+        while self.max_batches_per_step is None or batch_number < self.max_batches_per_step:
+            batch_number += 1
+            batch_started = time.perf_counter()
+
+            result = await conn.execute(statement, params)
+            await conn.commit()
+
+            batch = MaintenanceBatch(
+                step=step,
+                batch=batch_number,
+                rows=result.rowcount,
+                elapsed_ms=round((time.perf_counter() - batch_started) * 1000, 2)
+            )
+            report.batches.append(batch)
+            total += batch.rows
+
+            if verbose:
+                print(f"🧹 SESSION MAINTENANCE - {step} batch {batch.batch}: {batch.rows} rows in {batch.elapsed_ms} ms")
+
+            if batch.rows < self.batch_size:
+                break
+
+        return total
+
+
+class SessionMaintenanceScheduler:
+    """Runs SessionMaintenanceJob periodically inside a worker process"""
+
+    def __init__(self, job: SessionMaintenanceJob, interval_minutes: int):
+        self.job = job
+        self.interval_minutes = interval_minutes
+
+        self._task: Optional[asyncio.Task] = None
+        self._last_report: Optional[SessionMaintenanceReport] = None
+        self._runs = 0
+        self._failed_runs = 0
+
+    def start(self) -> None:
+        """Start the periodic task (no-op when disabled or already running)"""
+        if self.interval_minutes <= 0 or self._task is not None:
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the periodic task"""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Get run counters and a summary of the last run for this worker"""
+        last_run = None
+        if self._last_report is not None:
+            last_run = {
+                "started_at": self._last_report.started_at,
+                "skipped": self._last_report.skipped,
+                "deactivated": self._last_report.deactivated,
+                "purged": self._last_report.purged,
+                "batches": len(self._last_report.batches),
+                "elapsed_ms": self._last_report.elapsed_ms
+            }
+
+        return {
+            "interval_minutes": self.interval_minutes,
+            "runs": self._runs,
+            "failed_runs": self._failed_runs,
+            "last_run": last_run
+        }
+
+    async def _run(self) -> None:
+        """Run the job, then sleep for the interval, until cancelled"""
+        while True:
+            try:
+                self._last_report = await self.job.run_once()
+                self._runs += 1
+            except Exception as e:
+                self._failed_runs += 1
+                print(f"⚠️ SESSION MAINTENANCE - Run failed: {e}")
+
+            await asyncio.sleep(self.interval_minutes * 60)
+
+
+# Global instance storage
+_session_maintenance_scheduler_instance: Optional[SessionMaintenanceScheduler] = None
+
+
+def get_session_maintenance_scheduler() -> SessionMaintenanceScheduler:
+    """
+    Get or create the per-process session maintenance scheduler
+
+    Returns:
+        SessionMaintenanceScheduler: The singleton scheduler instance
+    """
+    global _session_maintenance_scheduler_instance
+
+    if _session_maintenance_scheduler_instance is None:
+        _session_maintenance_scheduler_instance = SessionMaintenanceScheduler(
+            job=SessionMaintenanceJob(
+                batch_size=settings.SESSION_MAINTENANCE_BATCH_SIZE,
+                retention_days=settings.SESSION_RETENTION_DAYS
+            ),
+            interval_minutes=settings.SESSION_MAINTENANCE_INTERVAL_MINUTES
+        )
+
+    return _session_maintenance_scheduler_instance
+
+
+def reset_session_maintenance_scheduler() -> None:
+    """
+    Reset the singleton instance (useful for testing)
+    """
+    global _session_maintenance_scheduler_instance
+    _session_maintenance_scheduler_instance = None
+
+
+async def _main(batch_size: int, retention_days: int, max_batches: Optional[int]) -> None:
+    """Run maintenance once and print the report"""
+    job = SessionMaintenanceJob(
+        batch_size=batch_size,
+        retention_days=retention_days,
+        max_batches_per_step=max_batches
+    )
+
+    try:
+        report = await job.run_once(verbose=True)
+    finally:
+        await async_engine.dispose()
+
+    if report.skipped:
+        print("⏭️ SESSION MAINTENANCE - Another run holds the maintenance lock, skipped")
+        return
+
+    print(
+        f"✅ SESSION MAINTENANCE - Deactivated {report.deactivated}, purged {report.purged} "
+        f"in {len(report.batches)} batches ({report.elapsed_ms} ms)"
+    )
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Expire and purge user_sessions in batches')
+    parser.add_argument('--batch-size', type=int, default=settings.SESSION_MAINTENANCE_BATCH_SIZE,
+                        help='Rows per UPDATE/DELETE statement')
+    parser.add_argument('--retention-days', type=int, default=settings.SESSION_RETENTION_DAYS,
+                        help='Days to keep expired or revoked sessions')
+    parser.add_argument('--max-batches', type=int, default=None,
+                        help='Maximum batches per step (default: until done)')
+
+    args = parser.parse_args()
+
+    asyncio.run(_main(args.batch_size, args.retention_days, args.max_batches))
@@ -0,0 +1,58 @@
+"""
+Buffered writer for login_attempts audit rows
+
+Login attempts are queued in memory and written in batches with a multi-row
+INSERT over the async engine (see BufferedBatchWriter), so the login path
+does not pay for an INSERT + COMMIT per attempt.
+
+Usage:
+    from slices.auth.infrastructure.persistence.login_attempt_audit_sink import get_login_attempt_audit_sink
+
+    sink = get_login_attempt_audit_sink()
+    sink.enqueue({...})   # non-blocking
+    await sink.close()    # flush remaining rows on shutdown
+"""
+from typing import Optional
+
+from shared.config.settings import settings
+from shared.database.buffered_batch_writer import BufferedBatchWriter
+from slices.auth.domain.models.login_attempt_model import LoginAttempt
+
+
+class LoginAttemptAuditSink(BufferedBatchWriter):
+    """Bounded in-memory queue of login attempts flushed in batches"""
+
+    model = LoginAttempt
+    log_label = "LOGIN AUDIT"
+    row_noun = "login attempts"
+
+
+# Global instance storage
+_login_attempt_audit_sink_instance: Optional[LoginAttemptAuditSink] = None
+
+
+def get_login_attempt_audit_sink() -> LoginAttemptAuditSink:
+    """
+    Get or create the per-process login attempt audit sink
+
+    Returns:
+        LoginAttemptAuditSink: The singleton sink instance
+    """
+    global _login_attempt_audit_sink_instance
+
+    if _login_attempt_audit_sink_instance is None:
+        _login_attempt_audit_sink_instance = LoginAttemptAuditSink(
+            batch_size=settings.LOGIN_AUDIT_BATCH_SIZE,
+            flush_interval_seconds=settings.LOGIN_AUDIT_FLUSH_INTERVAL_SECONDS,
+            max_queue_size=settings.LOGIN_AUDIT_MAX_QUEUE_SIZE
+        )
+
+    return _login_attempt_audit_sink_instance
+
+
+def reset_login_attempt_audit_sink() -> None:
+    """
+    Reset the singleton instance (useful for testing)
+    """
+    global _login_attempt_audit_sink_instance
+    _login_attempt_audit_sink_instance = None
@@ -4,11 +4,18 @@ SQLAlchemy implementation of AuthRepository
 from typing import Optional, Tuple
 from uuid import UUID
 from datetime import datetime, timezone
+from sqlalchemy import exists, func
 from sqlalchemy.orm import Session, joinedload
 
 from slices.auth.application.ports.auth_repository import AuthRepository
+from slices.auth.domain.entities.login_context import LoginContext
+from slices.auth.domain.models.user_session_model import UserSession
+from slices.auth.infrastructure.security.token_digest import hash_token
+from slices.auth.infrastructure.security.token_validation_cache import get_token_validation_cache
+from slices.auth.infrastructure.security.session_revocation_list import get_session_revocation_list
 from slices.signup.domain.models.user_model import User
 from slices.signup.domain.models.patient_model import Patient
+from slices.subscriptions.domain.models import UserSubscription
 
 
 class SQLAlchemyAuthRepository(AuthRepository):
@@ -40,6 +47,62 @@ class SQLAlchemyAuthRepository(AuthRepository):
             return (user, patient)
         return None
 
+    async def get_patient_by_user_id(self, user_id: UUID) -> Optional[Patient]:
+        """Get the patient record of a user (None for non-patient users)"""
+        return self.db_session.query(Patient).filter(Patient.user_id == user_id).first()
+
+    async def get_identity_by_session_token(
+        self,
+        session_token: str
+    ) -> Optional[Tuple[UserSession, User, Optional[Patient], bool]]:
+        """Get active session, user, patient and lock state for an access token in one query"""
+        is_locked = func.coalesce(User.locked_until > func.now(), False).label("is_locked")
+
+        result = self.db_session.query(UserSession, User, Patient, is_locked).join(
+            User, User.id == UserSession.user_id
+        ).outerjoin(
+            Patient, Patient.user_id == User.id
+        ).filter(
+            UserSession.session_token_digest == hash_token(session_token),
+            UserSession.is_active == True
+        ).first()
+
+        if result:
+            session, user, patient, locked = result
+            return (session, user, patient, bool(locked))
+        return None
+
+    async def get_login_context_by_email(self, email: str) -> Optional[LoginContext]:
+        """Get user, patient, lock state and active subscription status by email in one query"""
+        is_locked = func.coalesce(User.locked_until > func.now(), False).label("is_locked")
+        has_active_subscription = exists().where(
+            UserSubscription.user_id == User.id,
+            UserSubscription.status == 'active'
+        ).label("has_active_subscription")
+
+        result = self.db_session.query(User, Patient, is_locked, has_active_subscription).outerjoin(
+            Patient, Patient.user_id == User.id
+        ).filter(
+            User.email == email.lower()
+        ).first()
+
+        if result:
+            user, patient, locked, subscribed = result
+            return LoginContext(
+                user=user,
+                patient=patient,
+                is_locked=bool(locked),
+                has_active_subscription=bool(subscribed)
+            )
+        return None
+
+    async def apply_successful_login(self, user: User) -> None:
+        """Set last login, clear lockout state and commit together with any staged login writes"""
+        user.last_login = datetime.now(timezone.utc)
+        user.failed_login_attempts = 0
+        user.locked_until = None
+        self.db_session.commit()
+
     async def update_last_login(self, user_id: UUID) -> None:
         """Update user's last login timestamp"""
         user = await self.get_user_by_id(user_id)
@@ -80,6 +143,9 @@ class SQLAlchemyAuthRepository(AuthRepository):
                 )
             self.db_session.commit()
 
+        get_token_validation_cache().invalidate_user(user_id)
+        get_session_revocation_list().revoke_user(user_id)
+
     async def is_user_locked(self, user_id: UUID) -> bool:
         """Check if user account is locked"""
         user = await self.get_user_by_id(user_id)
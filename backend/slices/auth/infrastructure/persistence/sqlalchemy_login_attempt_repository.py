@@ -2,19 +2,22 @@
 SQLAlchemy implementation of LoginAttemptRepository
 """
 from typing import List, Optional
-from datetime import datetime
+from uuid import UUID
+from datetime import datetime, timezone
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
 
 from slices.auth.application.ports.login_attempt_repository import LoginAttemptRepository
 from slices.auth.domain.models.login_attempt_model import LoginAttempt
+from slices.auth.infrastructure.persistence.login_attempt_audit_sink import LoginAttemptAuditSink
 
 
 class SQLAlchemyLoginAttemptRepository(LoginAttemptRepository):
     """SQLAlchemy implementation of login attempt repository"""
 
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Session, audit_sink: Optional[LoginAttemptAuditSink] = None):
         self.db_session = db_session
+        self.audit_sink = audit_sink
 
     async def create_attempt(
         self,
@@ -23,9 +26,28 @@ class SQLAlchemyLoginAttemptRepository(LoginAttemptRepository):
         user_agent: str,
         success: bool,
         failure_reason: Optional[str] = None,
-        user_id: Optional[str] = None
+        user_id: Optional[str] = None,
+        commit: bool = True
     ) -> LoginAttempt:
-        """Record a login attempt"""
+        """Record a login attempt
+
+        With an audit sink the row is queued for a batched INSERT and the
+        returned LoginAttempt is not yet persisted. With commit=False the row
+        is staged in the current transaction and written by the caller's commit.
+        """
+        if self.audit_sink is not None:
+            row = {
+                "email": email.lower(),
+                "ip_address": ip_address,
+                "user_agent": user_agent[:500],  # Limit user agent length
+                "success": success,
+                "failure_reason": failure_reason,
+                "user_id": UUID(str(user_id)) if user_id else None,
+                "attempted_at": datetime.now(timezone.utc)
+            }
+            self.audit_sink.enqueue(row)
+            return LoginAttempt(**row)
+
         attempt = LoginAttempt(
             email=email.lower(),
             ip_address=ip_address,
@@ -37,8 +59,9 @@ class SQLAlchemyLoginAttemptRepository(LoginAttemptRepository):
         )
 
         self.db_session.add(attempt)
-        self.db_session.commit()
-        self.db_session.refresh(attempt)
+        if commit:
+            # Not refreshed: the login path never reads the row back
+            self.db_session.commit()
         return attempt
 
     async def get_recent_failures_by_ip(
@@ -4,10 +4,16 @@ SQLAlchemy implementation of UserSessionRepository
 from typing import Optional
 from uuid import UUID
 from datetime import datetime
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
+from shared.config.settings import settings
 from slices.auth.application.ports.user_session_repository import UserSessionRepository
 from slices.auth.domain.models.user_session_model import UserSession
+from slices.auth.infrastructure.maintenance.session_maintenance import PURGE_SESSIONS_SQL
+from slices.auth.infrastructure.security.token_digest import hash_token
+from slices.auth.infrastructure.security.token_validation_cache import get_token_validation_cache
+from slices.auth.infrastructure.security.session_revocation_list import get_session_revocation_list
 
 
 class SQLAlchemyUserSessionRepository(UserSessionRepository):
@@ -24,13 +30,16 @@ class SQLAlchemyUserSessionRepository(UserSessionRepository):
         ip_address: str,
         user_agent: str,
         expires_at: datetime,
-        refresh_expires_at: Optional[datetime] = None
+        refresh_expires_at: Optional[datetime] = None,
+        commit: bool = True
     ) -> UserSession:
-        """Create a new user session"""
+        """Create a new user session (commit=False stages it in the current transaction)"""
         session = UserSession(
             user_id=user_id,
             session_token=session_token,
             refresh_token=refresh_token,
+            session_token_digest=hash_token(session_token),
+            refresh_token_digest=hash_token(refresh_token),
             ip_address=ip_address,
             user_agent=user_agent[:500],  # Limit user agent length
             expires_at=expires_at,
@@ -39,40 +48,22 @@ class SQLAlchemyUserSessionRepository(UserSessionRepository):
         )
 
         self.db_session.add(session)
-        self.db_session.commit()
-        self.db_session.refresh(session)
+        if commit:
+            self.db_session.commit()
+            self.db_session.refresh(session)
         return session
 
     async def get_session_by_token(self, session_token: str) -> Optional[UserSession]:
-        """Get session by access token"""
-        print(f"🔍 SESSION DEBUG - Searching for token:")
-        print(f"   Token length: {len(session_token)}")
-        print(f"   Token preview: {session_token[:50]}...")
-
-        # Get all active sessions to debug
-        all_sessions = self.db_session.query(UserSession).filter(
-            UserSession.is_active == True
-        ).all()
-
-        print(f"   Total active sessions: {len(all_sessions)}")
-        for i, sess in enumerate(all_sessions):
-            print(f"   Session {i+1}: token length={len(sess.session_token or '')}, preview={(sess.session_token or '')[:50]}...")
-            print(f"   Session {i+1}: user_id={sess.user_id}, created={sess.created_at}")
-            if sess.session_token == session_token:
-                print(f"   ✅ FOUND EXACT MATCH at Session {i+1}")
-
-        result = self.db_session.query(UserSession).filter(
-            UserSession.session_token == session_token,
+        """Get session by access token (indexed lookup on the token digest)"""
+        return self.db_session.query(UserSession).filter(
+            UserSession.session_token_digest == hash_token(session_token),
             UserSession.is_active == True
         ).first()
 
-        print(f"   Query result: {'Found' if result else 'Not found'}")
-        return result
-
     async def get_session_by_refresh_token(self, refresh_token: str) -> Optional[UserSession]:
-        """Get session by refresh token"""
+        """Get session by refresh token (indexed lookup on the token digest)"""
         return self.db_session.query(UserSession).filter(
-            UserSession.refresh_token == refresh_token,
+            UserSession.refresh_token_digest == hash_token(refresh_token),
             UserSession.is_active == True
         ).first()
 
@@ -85,20 +76,24 @@ class SQLAlchemyUserSessionRepository(UserSessionRepository):
         refresh_expires_at: Optional[datetime] = None
     ) -> UserSession:
         """Update session tokens after refresh"""
-        session = self.db_session.query(UserSession).filter(
-            UserSession.id == session_id
-        ).first()
-
-        if session:
-            session.session_token = new_session_token
-            session.refresh_token = new_refresh_token
-            session.expires_at = expires_at
-            session.refresh_expires_at = refresh_expires_at
-            session.last_accessed = datetime.utcnow()
-
-            self.db_session.commit()
-            self.db_session.refresh(session)
+        # Single UPDATE ... RETURNING by primary key instead of fetch + commit + refresh
+        session = self.db_session.execute(
+            update(UserSession)
+            .where(UserSession.id == session_id)
+            .values(
+                session_token=new_session_token,
+                refresh_token=new_refresh_token,
+                session_token_digest=hash_token(new_session_token),
+                refresh_token_digest=hash_token(new_refresh_token),
+                expires_at=expires_at,
+                refresh_expires_at=refresh_expires_at,
+                last_accessed=datetime.utcnow()
+            )
+            .returning(UserSession)
+        ).scalar_one_or_none()
 
+        self.db_session.commit()
+        get_token_validation_cache().invalidate_session(session_id)
         return session
 
     async def revoke_session(self, session_id: int) -> None:
@@ -111,34 +106,42 @@ class SQLAlchemyUserSessionRepository(UserSessionRepository):
             session.is_active = False
             session.last_accessed = datetime.utcnow()
             self.db_session.commit()
+            get_session_revocation_list().revoke_token(session.session_token_digest, session.expires_at)
 
-    async def revoke_all_user_sessions(self, user_id: UUID) -> None:
-        """Revoke all sessions for a user"""
-        sessions = self.db_session.query(UserSession).filter(
-            UserSession.user_id == user_id,
-            UserSession.is_active == True
-        ).all()
+        get_token_validation_cache().invalidate_session(session_id)
 
-        for session in sessions:
-            session.is_active = False
-            session.last_accessed = datetime.utcnow()
+    async def revoke_all_user_sessions(self, user_id: UUID) -> None:
+        """Revoke all sessions for a user (single set-based UPDATE)"""
+        self.db_session.execute(
+            update(UserSession)
+            .where(
+                UserSession.user_id == user_id,
+                UserSession.is_active == True
+            )
+            .values(is_active=False, last_accessed=datetime.utcnow())
+        )
 
         self.db_session.commit()
+        get_token_validation_cache().invalidate_user(user_id)
+        get_session_revocation_list().revoke_user(user_id)
 
     async def cleanup_expired_sessions(self) -> int:
-        """Remove expired sessions and return count of removed sessions"""
-        now = datetime.utcnow()
-
-        expired_sessions = self.db_session.query(UserSession).filter(
-            UserSession.expires_at <= now
-        ).all()
-
-        count = len(expired_sessions)
+        """Remove sessions whose access and refresh tokens have expired and return the count"""
+        batch_size = settings.SESSION_MAINTENANCE_BATCH_SIZE
+        count = 0
+
+        # Batched DELETE by ctid; each batch commits so locks stay short
+        while True:
+            result = self.db_session.execute(
+                PURGE_SESSIONS_SQL,
+                {"batch_size": batch_size, "retention_days": 0}
+            )
+            self.db_session.commit()
+            count += result.rowcount
 
-        for session in expired_sessions:
-            self.db_session.delete(session)
+            if result.rowcount < batch_size:
+                break
 
-        self.db_session.commit()
         return count
 
     async def get_active_sessions_count(self, user_id: UUID) -> int:
@@ -0,0 +1,14 @@
+"""
+Authentication rate limiting infrastructure
+"""
+from .login_rate_limiter import LoginRateLimiter, get_login_rate_limiter, reset_login_rate_limiter
+from .memory_rate_limit_backend import InMemoryRateLimitBackend
+from .redis_rate_limit_backend import RedisRateLimitBackend
+
+__all__ = [
+    "LoginRateLimiter",
+    "get_login_rate_limiter",
+    "reset_login_rate_limiter",
+    "InMemoryRateLimitBackend",
+    "RedisRateLimitBackend"
+]
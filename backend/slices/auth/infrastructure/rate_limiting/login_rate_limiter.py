@@ -0,0 +1,142 @@
+"""
+Login rate limiter
+
+Tracks failed login attempts per IP and per email in sliding windows so the
+login path never has to COUNT(*) the login_attempts audit table.
+
+Usage:
+    from slices.auth.infrastructure.rate_limiting import get_login_rate_limiter
+
+    rate_limiter = get_login_rate_limiter()
+    await rate_limiter.check(email, ip_address)           # raises 429 when over the limit
+    await rate_limiter.record_failure(email, ip_address)  # after a failed attempt
+"""
+from typing import Optional
+
+from fastapi import HTTPException, status
+
+from shared.config.settings import settings
+from slices.auth.application.ports.rate_limit_backend import RateLimitBackend
+from .memory_rate_limit_backend import InMemoryRateLimitBackend
+from .redis_rate_limit_backend import RedisRateLimitBackend
+
+
+class LoginRateLimiter:
+    """Sliding-window limits on failed logins by IP and by email"""
+
+    def __init__(
+        self,
+        backend: RateLimitBackend,
+        ip_max_failures: int = 15,
+        ip_window_seconds: int = 60 * 60,
+        email_max_failures: int = 5,
+        email_window_seconds: int = 15 * 60
+    ):
+        self.backend = backend
+        self.ip_max_failures = ip_max_failures
+        self.ip_window_seconds = ip_window_seconds
+        self.email_max_failures = email_max_failures
+        self.email_window_seconds = email_window_seconds
+
+    async def check(self, email: str, ip_address: str) -> None:
+        """
+        Reject the login attempt if the IP or email is over its failure limit
+
+        Args:
+            email: Email used for the login attempt
+            ip_address: Client IP address
+
+        Raises:
+            HTTPException: 429 with Retry-After if too many recent failures
+        """
+        # Check IP-based rate limiting (15 attempts per hour)
+        ip_key = self._ip_key(ip_address)
+        ip_failures = await self.backend.count(ip_key, self.ip_window_seconds)
+        if ip_failures >= self.ip_max_failures:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Demasiados intentos desde esta IP. Intente más tarde.",
+                headers=await self._retry_after_header(ip_key, self.ip_window_seconds, self.ip_max_failures)
+            )
+
+        # Check email-based rate limiting (5 attempts per 15 minutes)
+        email_key = self._email_key(email)
+        email_failures = await self.backend.count(email_key, self.email_window_seconds)
+        if email_failures >= self.email_max_failures:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Demasiados intentos para este email. Intente en 15 minutos.",
+                headers=await self._retry_after_header(email_key, self.email_window_seconds, self.email_max_failures)
+            )
+
+    async def record_failure(self, email: str, ip_address: str) -> None:
+        """
+        Count a failed login attempt against the IP and the email
+
+        Args:
+            email: Email used for the login attempt
+            ip_address: Client IP address
+        """
+        await self.backend.hit(self._ip_key(ip_address), self.ip_window_seconds)
+        await self.backend.hit(self._email_key(email), self.email_window_seconds)
+
+    async def _retry_after_header(self, key: str, window_seconds: int, limit: int) -> dict:
+        """Retry-After header for a key that is over its limit"""
+        retry_after = await self.backend.retry_after(key, window_seconds, limit)
+        return {"Retry-After": str(max(1, retry_after))}
+
+    @staticmethod
+    def _ip_key(ip_address: str) -> str:
+        return f"login:ip:{ip_address}"
+
+    @staticmethod
+    def _email_key(email: str) -> str:
+        return f"login:email:{email.lower()}"
+
+
+def create_rate_limit_backend(backend_name: str) -> RateLimitBackend:
+    """
+    Create the rate limit backend configured by RATE_LIMIT_BACKEND
+
+    Args:
+        backend_name: "memory" (single node) or "redis" (uses REDIS_URL)
+
+    Returns:
+        RateLimitBackend implementation
+    """
+    if backend_name == "redis":
+        return RedisRateLimitBackend.from_url(settings.REDIS_URL)
+    if backend_name == "memory":
+        return InMemoryRateLimitBackend()
+    raise ValueError(f"Unsupported rate limit backend: {backend_name}")
+
+
+# Global instance storage
+_login_rate_limiter_instance: Optional[LoginRateLimiter] = None
+
+
+def get_login_rate_limiter() -> LoginRateLimiter:
+    """
+    Get or create the login rate limiter
+
+    Returns:
+        LoginRateLimiter: The singleton rate limiter instance
+    """
+    global _login_rate_limiter_instance
+
+    if _login_rate_limiter_instance is None:
+        _login_rate_limiter_instance = LoginRateLimiter(
+            backend=create_rate_limit_backend(settings.RATE_LIMIT_BACKEND),
+            ip_max_failures=settings.LOGIN_IP_MAX_FAILURES_PER_HOUR,
+            email_max_failures=settings.LOGIN_EMAIL_MAX_FAILURES_PER_15_MIN
+        )
+
+    return _login_rate_limiter_instance
+
+
+def reset_login_rate_limiter() -> None:
+    """
+    Reset the singleton instance (useful for testing)
+    """
+    global _login_rate_limiter_instance
+    _login_rate_limiter_instance = None
@@ -0,0 +1,81 @@
+"""
+In-memory sliding-window rate limit backend (single node)
+"""
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Callable, Deque
+
+from slices.auth.application.ports.rate_limit_backend import RateLimitBackend
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """Sliding-window counters kept in process memory
+
+    Each key holds the timestamps of its events inside the window. The number
+    of tracked keys is bounded; the least recently used keys are dropped first.
+    Counters are per process, so use the Redis backend when running several
+    workers or nodes.
+    """
+
+    def __init__(self, max_keys: int = 100000, clock: Callable[[], float] = time.monotonic):
+        self.max_keys = max_keys
+        self.clock = clock
+        self._events: "OrderedDict[str, Deque[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def count(self, key: str, window_seconds: int) -> int:
+        """Count events recorded for key within the last window_seconds"""
+        now = self.clock()
+        with self._lock:
+            events = self._events.get(key)
+            if events is None:
+                return 0
+
+            self._prune(events, now - window_seconds)
+            if not events:
+                del self._events[key]
+                return 0
+
+            return len(events)
+
+    async def hit(self, key: str, window_seconds: int) -> int:
+        """Record an event for key and return the count within the window"""
+        now = self.clock()
+        with self._lock:
+            events = self._events.get(key)
+            if events is None:
+                events = deque()
+                self._events[key] = events
+
+            self._prune(events, now - window_seconds)
+            events.append(now)
+            self._events.move_to_end(key)
+
+            while len(self._events) > self.max_keys:
+                self._events.popitem(last=False)
+
+            return len(events)
+
+    async def retry_after(self, key: str, window_seconds: int, limit: int) -> int:
+        """Seconds until fewer than limit events remain for key within the window (0 if already below)"""
+        now = self.clock()
+        with self._lock:
+            events = self._events.get(key)
+            if events is None:
+                return 0
+
+            self._prune(events, now - window_seconds)
+            if len(events) < limit:
+                return 0
+
+            # Once this event leaves the window, limit - 1 events are left
+            expires_at = events[len(events) - limit] + window_seconds
+            return max(1, math.ceil(expires_at - now))
+
+    @staticmethod
+    def _prune(events: Deque[float], cutoff: float) -> None:
+        """Drop timestamps older than the window"""
+        while events and events[0] <= cutoff:
+            events.popleft()
@@ -0,0 +1,83 @@
+"""
+Redis sliding-window rate limit backend (multi-worker / multi-node)
+"""
+import math
+import time
+import uuid
+from typing import Any, Callable
+
+from slices.auth.application.ports.rate_limit_backend import RateLimitBackend
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """Sliding-window counters stored as Redis sorted sets
+
+    Each event is a sorted-set member scored by its timestamp. Trimming,
+    recording and counting run in one MULTI/EXEC pipeline, and keys expire
+    once their window has passed. Any client speaking the Redis protocol with
+    the redis.asyncio API can be injected (e.g. a local stand-in for tests).
+    """
+
+    def __init__(self, client: Any, key_prefix: str = "vitalgo:ratelimit:", clock: Callable[[], float] = time.time):
+        self.client = client
+        self.key_prefix = key_prefix
+        # Wall clock: scores are compared across workers and nodes
+        self.clock = clock
+
+    @classmethod
+    def from_url(cls, redis_url: str) -> "RedisRateLimitBackend":
+        """Create a backend connected to the given Redis URL"""
+        from redis import asyncio as redis_asyncio
+
+        return cls(redis_asyncio.from_url(redis_url))
+
+    async def count(self, key: str, window_seconds: int) -> int:
+        """Count events recorded for key within the last window_seconds"""
+        redis_key = self.key_prefix + key
+        now = self.clock()
+
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.zremrangebyscore(redis_key, 0, now - window_seconds)
+            pipe.zcard(redis_key)
+            _, count = await pipe.execute()
+
+        return int(count)
+
+    async def hit(self, key: str, window_seconds: int) -> int:
+        """Record an event for key and return the count within the window"""
+        redis_key = self.key_prefix + key
+        now = self.clock()
+        member = f"{now}:{uuid.uuid4().hex}"
+
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.zremrangebyscore(redis_key, 0, now - window_seconds)
+            pipe.zadd(redis_key, {member: now})
+            pipe.zcard(redis_key)
+            pipe.expire(redis_key, window_seconds)
+            _, _, count, _ = await pipe.execute()
+
+        return int(count)
+
+    async def retry_after(self, key: str, window_seconds: int, limit: int) -> int:
+        """Seconds until fewer than limit events remain for key within the window (0 if already below)"""
+        redis_key = self.key_prefix + key
+        now = self.clock()
+
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.zremrangebyscore(redis_key, 0, now - window_seconds)
+            pipe.zcard(redis_key)
+            _, count = await pipe.execute()
+
+        count = int(count)
+        if count < limit:
+            return 0
+
+        # Once this event leaves the window, limit - 1 events are left
+        expiring = await self.client.zrange(redis_key, count - limit, count - limit, withscores=True)
+        if not expiring:
+            return 0
+        return max(1, math.ceil(expiring[0][1] + window_seconds - now))
+
+    async def close(self) -> None:
+        """Close the underlying Redis connection pool"""
+        await self.client.aclose()
@@ -3,6 +3,25 @@ Authentication infrastructure security services
 """
 from .jwt_service import JWTService
 from .jwt_service_singleton import get_jwt_service, reset_jwt_service
+from .password_hashing_engine import PasswordHashingEngine, get_password_hashing_engine, reset_password_hashing_engine
 from .password_service import PasswordService
+from .session_revocation_list import SessionRevocationList, get_session_revocation_list, reset_session_revocation_list
+from .token_digest import hash_token
+from .token_validation_cache import TokenValidationCache, get_token_validation_cache, reset_token_validation_cache
 
-__all__ = ["JWTService", "get_jwt_service", "reset_jwt_service", "PasswordService"]
\ No newline at end of file
+__all__ = [
+    "JWTService",
+    "get_jwt_service",
+    "reset_jwt_service",
+    "PasswordHashingEngine",
+    "get_password_hashing_engine",
+    "reset_password_hashing_engine",
+    "PasswordService",
+    "SessionRevocationList",
+    "get_session_revocation_list",
+    "reset_session_revocation_list",
+    "hash_token",
+    "TokenValidationCache",
+    "get_token_validation_cache",
+    "reset_token_validation_cache"
+]
\ No newline at end of file
@@ -18,6 +18,8 @@ class JWTService:
         self.secret_key = settings.JWT_SECRET_KEY
         self.algorithm = settings.JWT_ALGORITHM
         self.access_token_expire_minutes = settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES
+        self.stateless_validation = settings.TOKEN_VALIDATION_MODE == "stateless"
+        self.stateless_max_lifetime_seconds = settings.STATELESS_TOKEN_MAX_LIFETIME_MINUTES * 60
 
     def create_access_token(
         self,
@@ -192,6 +194,32 @@ class JWTService:
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
+    def is_stateless_eligible(self, payload: Dict[str, Any]) -> bool:
+        """
+        Check whether a verified access token can be accepted without a session lookup
+
+        Only short-lived access tokens that carry the profile claim qualify;
+        everything else goes through database validation.
+
+        Args:
+            payload: Payload returned by verify_token
+
+        Returns:
+            True if the token may be validated statelessly
+        """
+        if not self.stateless_validation or payload.get("type") == "refresh":
+            return False
+
+        if not payload.get("session_id") or not isinstance(payload.get("profile"), dict):
+            return False
+
+        issued_at = payload.get("iat")
+        expires_at = payload.get("exp")
+        if issued_at is None or expires_at is None:
+            return False
+
+        return expires_at - issued_at <= self.stateless_max_lifetime_seconds
+
     def verify_refresh_token(self, refresh_token: str) -> Dict[str, Any]:
         """
         Verify and decode refresh token
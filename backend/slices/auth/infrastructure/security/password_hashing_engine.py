@@ -0,0 +1,165 @@
+"""
+Executor-backed bcrypt engine
+
+bcrypt at 12 rounds takes ~250 ms of CPU per call. Running it inside an async
+handler stalls the worker's event loop, so hashing and verification are
+offloaded to a thread or process pool with a bounded backlog. When the backlog
+is full, requests are rejected immediately with 503 instead of queueing
+behind other logins.
+
+Usage:
+    from slices.auth.infrastructure.security.password_hashing_engine import get_password_hashing_engine
+
+    engine = get_password_hashing_engine()
+    password_hash = await engine.hash_password("secret", rounds=12)
+    is_valid = await engine.verify_password("secret", password_hash)
+"""
+import asyncio
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+import bcrypt
+from fastapi import HTTPException, status
+
+from shared.config.settings import settings
+
+
+def _hash_password(password: str, rounds: int) -> str:
+    """Hash a password with bcrypt (runs in the executor)"""
+    salt = bcrypt.gensalt(rounds=rounds)
+    return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+
+
+def _verify_password(password: str, hashed_password: str) -> bool:
+    """Verify a password against a bcrypt hash (runs in the executor)"""
+    try:
+        return bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
+    except Exception:
+        # Return False if any error occurs during verification
+        return False
+
+
+class PasswordHashingEngine:
+    """Runs bcrypt off the event loop with a concurrency cap and fast rejection"""
+
+    def __init__(self, executor_type: str = "thread", max_workers: int = 4, max_queue_depth: int = 32):
+        """
+        Args:
+            executor_type: "thread" (bcrypt releases the GIL) or "process"
+            max_workers: Number of concurrent bcrypt operations
+            max_queue_depth: Operations allowed to wait for a worker before rejecting
+        """
+        if executor_type not in ("thread", "process"):
+            raise ValueError(f"Unsupported executor type: {executor_type}")
+
+        self.executor_type = executor_type
+        self.max_workers = max_workers
+        self.max_queue_depth = max_queue_depth
+
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+
+    async def hash_password(self, password: str, rounds: int) -> str:
+        """Hash a password without blocking the event loop"""
+        return await self._submit(_hash_password, password, rounds)
+
+    async def verify_password(self, password: str, hashed_password: str) -> bool:
+        """Verify a password without blocking the event loop"""
+        return await self._submit(_verify_password, password, hashed_password)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get concurrency and queue-depth counters for this worker"""
+        with self._lock:
+            return {
+                "executor_type": self.executor_type,
+                "max_workers": self.max_workers,
+                "max_queue_depth": self.max_queue_depth,
+                "in_flight": self._in_flight,
+                "queue_depth": max(0, self._in_flight - self.max_workers),
+                "peak_in_flight": self._peak_in_flight,
+                "completed": self._completed,
+                "rejected": self._rejected
+            }
+
+    def shutdown(self) -> None:
+        """Stop the executor (called on application shutdown)"""
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _submit(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a bcrypt call in the executor, rejecting when the backlog is full"""
+        with self._lock:
+            if self._in_flight >= self.max_workers + self.max_queue_depth:
+                self._rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Servidor ocupado. Intente de nuevo en unos segundos.",
+                    headers={"Retry-After": "1"},
+                )
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+            executor = self._get_executor()
+
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, func, *args)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                self._completed += 1
+
+    def _get_executor(self) -> Executor:
+        """Create the executor lazily (caller holds the lock)"""
+        if self._executor is None:
+            if self.executor_type == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="bcrypt"
+                )
+        return self._executor
+
+
+# Global instance storage
+_password_hashing_engine_instance: Optional[PasswordHashingEngine] = None
+
+
+def get_password_hashing_engine() -> PasswordHashingEngine:
+    """
+    Get or create the per-process password hashing engine
+
+    Returns:
+        PasswordHashingEngine: The singleton engine instance
+    """
+    global _password_hashing_engine_instance
+
+    if _password_hashing_engine_instance is None:
+        _password_hashing_engine_instance = PasswordHashingEngine(
+            executor_type=settings.PASSWORD_HASHING_EXECUTOR,
+            max_workers=settings.PASSWORD_HASHING_MAX_WORKERS,
+            max_queue_depth=settings.PASSWORD_HASHING_MAX_QUEUE_DEPTH
+        )
+
+    return _password_hashing_engine_instance
+
+
+def reset_password_hashing_engine() -> None:
+    """
+    Shut down and reset the singleton instance (useful for testing)
+    """
+    global _password_hashing_engine_instance
+
+    if _password_hashing_engine_instance is not None:
+        _password_hashing_engine_instance.shutdown()
+    _password_hashing_engine_instance = None
@@ -1,16 +1,21 @@
 """
 Password Service for secure password hashing and verification
 """
+from typing import Optional
+
 import bcrypt
 
 from shared.config.settings import settings
+from .password_hashing_engine import PasswordHashingEngine, get_password_hashing_engine
 
 
 class PasswordService:
     """Service for password hashing and verification using bcrypt"""
 
-    def __init__(self):
+    def __init__(self, hashing_engine: Optional[PasswordHashingEngine] = None):
         self.rounds = settings.BCRYPT_ROUNDS
+        # Resolved on first async call, so sync-only users never create the executor engine
+        self._hashing_engine = hashing_engine
 
     def hash_password(self, password: str) -> str:
         """
@@ -55,6 +60,47 @@ class PasswordService:
             # Return False if any error occurs during verification
             return False
 
+    async def hash_password_async(self, password: str) -> str:
+        """
+        Hash a password using bcrypt in the hashing executor
+
+        Use this from async handlers so bcrypt does not block the event loop.
+
+        Args:
+            password: Plain text password
+
+        Returns:
+            Hashed password string
+
+        Raises:
+            HTTPException: 503 if the hashing executor is saturated
+        """
+        return await self._get_hashing_engine().hash_password(password, self.rounds)
+
+    async def verify_password_async(self, password: str, hashed_password: str) -> bool:
+        """
+        Verify a password against its hash in the hashing executor
+
+        Use this from async handlers so bcrypt does not block the event loop.
+
+        Args:
+            password: Plain text password to verify
+            hashed_password: Hashed password from database
+
+        Returns:
+            True if password matches, False otherwise
+
+        Raises:
+            HTTPException: 503 if the hashing executor is saturated
+        """
+        return await self._get_hashing_engine().verify_password(password, hashed_password)
+
+    def _get_hashing_engine(self) -> PasswordHashingEngine:
+        """Get the injected engine, or the per-process one on first use"""
+        if self._hashing_engine is None:
+            self._hashing_engine = get_password_hashing_engine()
+        return self._hashing_engine
+
     def is_password_strong(self, password: str) -> tuple[bool, list[str]]:
         """
         Check if password meets security requirements
@@ -0,0 +1,230 @@
+"""
+In-process revocation list for stateless access-token validation
+
+In stateless mode an access token is accepted on its signature, expiry and
+this list, without a database lookup. The list holds:
+
+- digests of revoked sessions whose access tokens have not expired yet
+- per-user revocation epochs; tokens issued at or before the epoch are rejected
+
+Revocations made in this worker are applied immediately by the session and
+auth repositories. Revocations made by other workers are picked up by an
+incremental refresh from user_sessions (rows deactivated since the last
+refresh) and users (accounts currently locked), so the refresh interval
+bounds how long another worker's revocation can go unnoticed. Only tokens
+whose lifetime is at most max_token_lifetime_seconds are validated this way,
+which also bounds how long entries are retained.
+
+Usage:
+    from slices.auth.infrastructure.security.session_revocation_list import get_session_revocation_list
+
+    revocation_list = get_session_revocation_list()
+    if await revocation_list.ensure_fresh():
+        revocation_list.is_revoked(token_digest, user_id, issued_at)
+"""
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from sqlalchemy import func, select
+
+from shared.config.settings import settings
+from shared.database import AsyncSessionLocal
+from slices.auth.domain.models.user_session_model import UserSession
+from slices.signup.domain.models.user_model import User
+
+# Re-read rows deactivated slightly before the watermark to cover commits that
+# land after a refresh but carry an earlier last_accessed timestamp
+_WATERMARK_OVERLAP = timedelta(seconds=60)
+
+
+class SessionRevocationList:
+    """Revoked session digests and per-user revocation epochs for this worker"""
+
+    def __init__(
+        self,
+        session_factory=AsyncSessionLocal,
+        refresh_interval_seconds: int = 5,
+        max_token_lifetime_seconds: int = 1800
+    ):
+        self.session_factory = session_factory
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self.max_token_lifetime_seconds = max_token_lifetime_seconds
+
+        # digest -> retain until (epoch seconds)
+        self._revoked_digests: Dict[str, float] = {}
+        # user_id -> (revocation epoch, retain until)
+        self._user_epochs: Dict[str, tuple] = {}
+        self._watermark: Optional[datetime] = None
+        self._last_refresh: Optional[float] = None
+
+        self._lock = threading.Lock()
+        self._refresh_lock = asyncio.Lock()
+
+        self._refreshes = 0
+        self._failed_refreshes = 0
+
+    def is_revoked(self, token_digest: str, user_id: str, issued_at: float) -> bool:
+        """
+        Check a token against revoked sessions and the owner's revocation epoch
+
+        Args:
+            token_digest: SHA-256 digest of the access token
+            user_id: Token subject
+            issued_at: Token iat claim (epoch seconds)
+        """
+        with self._lock:
+            if token_digest in self._revoked_digests:
+                return True
+
+            user_epoch = self._user_epochs.get(str(user_id))
+            return user_epoch is not None and issued_at <= user_epoch[0]
+
+    def revoke_token(self, token_digest: Optional[str], expires_at: Optional[datetime] = None) -> None:
+        """Revoke a single access token by digest until it expires"""
+        if not token_digest:
+            return
+
+        retain_until = time.time() + self.max_token_lifetime_seconds
+        if expires_at is not None:
+            retain_until = min(retain_until, expires_at.timestamp())
+
+        with self._lock:
+            self._revoked_digests[token_digest] = retain_until
+
+    def revoke_user(self, user_id: Any) -> None:
+        """Reject every token issued to a user up to now"""
+        now = time.time()
+        with self._lock:
+            self._user_epochs[str(user_id)] = (now, now + self.max_token_lifetime_seconds)
+
+    def is_fresh(self) -> bool:
+        """Whether the list was refreshed within the refresh interval"""
+        return (
+            self._last_refresh is not None
+            and time.time() - self._last_refresh < self.refresh_interval_seconds
+        )
+
+    async def ensure_fresh(self) -> bool:
+        """
+        Refresh the list if the interval has elapsed
+
+        Returns:
+            True if the list is usable, False if it is stale and could not be refreshed
+        """
+        if self.is_fresh():
+            return True
+
+        async with self._refresh_lock:
+            # Another request may have refreshed while this one waited
+            if self.is_fresh():
+                return True
+
+            try:
+                await self.refresh()
+                return True
+            except Exception as e:
+                self._failed_refreshes += 1
+                print(f"⚠️ REVOCATION LIST - Refresh failed, falling back to database validation: {e}")
+                return False
+
+    async def refresh(self) -> None:
+        """Load sessions deactivated since the last refresh and currently locked accounts"""
+        max_lifetime = timedelta(seconds=self.max_token_lifetime_seconds)
+
+        sessions_query = select(
+            UserSession.session_token_digest,
+            UserSession.expires_at,
+            UserSession.last_accessed
+        ).where(
+            UserSession.is_active == False,
+            UserSession.expires_at > func.now(),
+            # Longer-lived tokens are never validated statelessly
+            UserSession.expires_at <= func.now() + max_lifetime
+        )
+        if self._watermark is not None:
+            sessions_query = sessions_query.where(
+                UserSession.last_accessed >= self._watermark - _WATERMARK_OVERLAP
+            )
+
+        locked_users_query = select(User.id).where(User.locked_until > func.now())
+
+        async with self.session_factory() as session:
+            revoked_sessions = (await session.execute(sessions_query)).all()
+            locked_user_ids = (await session.execute(locked_users_query)).scalars().all()
+
+        for token_digest, expires_at, last_accessed in revoked_sessions:
+            self.revoke_token(token_digest, expires_at)
+            if last_accessed is not None and (self._watermark is None or last_accessed > self._watermark):
+                self._watermark = last_accessed
+
+        # Logins are refused while locked, so no token can be issued after this epoch until unlock
+        for user_id in locked_user_ids:
+            self.revoke_user(user_id)
+
+        self._prune()
+        self._last_refresh = time.time()
+        self._refreshes += 1
+
+    def clear(self) -> None:
+        """Drop every entry and force a full reload on the next refresh"""
+        with self._lock:
+            self._revoked_digests.clear()
+            self._user_epochs.clear()
+        self._watermark = None
+        self._last_refresh = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Get list sizes and refresh counters for this worker"""
+        with self._lock:
+            return {
+                "revoked_sessions": len(self._revoked_digests),
+                "revoked_users": len(self._user_epochs),
+                "refresh_interval_seconds": self.refresh_interval_seconds,
+                "last_refresh_age_seconds": (
+                    round(time.time() - self._last_refresh, 3) if self._last_refresh is not None else None
+                ),
+                "refreshes": self._refreshes,
+                "failed_refreshes": self._failed_refreshes
+            }
+
+    def _prune(self) -> None:
+        """Drop entries that can no longer match an unexpired token"""
+        now = time.time()
+        with self._lock:
+            for token_digest in [d for d, until in self._revoked_digests.items() if until <= now]:
+                del self._revoked_digests[token_digest]
+            for user_id in [u for u, (_, until) in self._user_epochs.items() if until <= now]:
+                del self._user_epochs[user_id]
+
+
+# Global instance storage
+_session_revocation_list_instance: Optional[SessionRevocationList] = None
+
+
+def get_session_revocation_list() -> SessionRevocationList:
+    """
+    Get or create the per-process session revocation list
+
+    Returns:
+        SessionRevocationList: The singleton revocation list instance
+    """
+    global _session_revocation_list_instance
+
+    if _session_revocation_list_instance is None:
+        _session_revocation_list_instance = SessionRevocationList(
+            refresh_interval_seconds=settings.REVOCATION_REFRESH_INTERVAL_SECONDS,
+            max_token_lifetime_seconds=settings.STATELESS_TOKEN_MAX_LIFETIME_MINUTES * 60
+        )
+
+    return _session_revocation_list_instance
+
+
+def reset_session_revocation_list() -> None:
+    """
+    Reset the singleton instance (useful for testing)
+    """
+    global _session_revocation_list_instance
+    _session_revocation_list_instance = None
@@ -0,0 +1,24 @@
+"""
+Token digest helper for indexed session lookups
+"""
+import hashlib
+from typing import Optional
+
+
+def hash_token(token: Optional[str]) -> Optional[str]:
+    """
+    Compute the fixed-width SHA-256 hex digest of a JWT
+
+    Sessions are keyed by this 64-char digest instead of the raw token so
+    lookups hit a compact unique index rather than a 1000-char column.
+
+    Args:
+        token: Raw JWT (access or refresh token)
+
+    Returns:
+        Hex digest string, or None if no token was given
+    """
+    if token is None:
+        return None
+
+    return hashlib.sha256(token.encode('utf-8')).hexdigest()
@@ -0,0 +1,214 @@
+"""
+In-process token validation cache
+
+Caches the result of ValidateTokenUseCase.execute per uvicorn worker so that
+repeated /api/auth/validate and /api/auth/me calls skip JWT decoding and the
+database round trip.
+
+Entries are keyed by the token's SHA-256 digest and expire at whichever comes
+first: the configured TTL or the token's own expiration. Session revocation,
+logout and account locks invalidate entries through the repositories. Each
+worker holds its own cache, so the TTL bounds how long a revocation made on
+another worker can go unnoticed.
+
+Usage:
+    from slices.auth.infrastructure.security.token_validation_cache import get_token_validation_cache
+
+    cache = get_token_validation_cache()
+    cache.stats()  # {"hits": ..., "misses": ..., "evictions": ..., ...}
+"""
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Optional, Set
+
+from shared.config.settings import settings
+from .token_digest import hash_token
+
+
+@dataclass
+class _CacheEntry:
+    """Cached validation result and the keys used to invalidate it"""
+    user_info: Dict[str, Any]
+    user_id: str
+    session_pk: int
+    expires_at: float
+
+
+class TokenValidationCache:
+    """Bounded LRU + TTL cache of validated access tokens"""
+
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._keys_by_user: Dict[str, Set[str]] = {}
+        self._keys_by_session: Dict[int, Set[str]] = {}
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        """
+        Get cached user information for a token
+
+        Args:
+            token: JWT access token
+
+        Returns:
+            Copy of the cached user information, or None on a miss
+        """
+        key = hash_token(token)
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            if entry.expires_at <= now:
+                self._remove(key)
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return dict(entry.user_info)
+
+    def put(
+        self,
+        token: str,
+        user_info: Dict[str, Any],
+        user_id: str,
+        session_pk: int,
+        token_expires_at: Optional[datetime] = None
+    ) -> None:
+        """
+        Cache user information for a validated token
+
+        Args:
+            token: JWT access token
+            user_info: Validation result to cache
+            user_id: Owner of the token, for per-user invalidation
+            session_pk: user_sessions primary key, for per-session invalidation
+            token_expires_at: Token expiration; entries never outlive it
+        """
+        if self.max_entries <= 0:
+            return
+
+        expires_at = time.time() + self.ttl_seconds
+        if token_expires_at is not None:
+            expires_at = min(expires_at, token_expires_at.timestamp())
+
+        key = hash_token(token)
+        user_id = str(user_id)
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = _CacheEntry(
+                user_info=dict(user_info),
+                user_id=user_id,
+                session_pk=session_pk,
+                expires_at=expires_at
+            )
+            self._keys_by_user.setdefault(user_id, set()).add(key)
+            self._keys_by_session.setdefault(session_pk, set()).add(key)
+
+            while len(self._entries) > self.max_entries:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self._evictions += 1
+
+    def invalidate_session(self, session_pk: int) -> None:
+        """Drop cached tokens belonging to a session"""
+        with self._lock:
+            for key in list(self._keys_by_session.get(session_pk, ())):
+                self._remove(key)
+                self._invalidations += 1
+
+    def invalidate_user(self, user_id: Any) -> None:
+        """Drop cached tokens belonging to any session of a user"""
+        with self._lock:
+            for key in list(self._keys_by_user.get(str(user_id), ())):
+                self._remove(key)
+                self._invalidations += 1
+
+    def clear(self) -> None:
+        """Drop every cached entry"""
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_user.clear()
+            self._keys_by_session.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Get hit/miss/eviction counters and current size for this worker"""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "invalidations": self._invalidations
+            }
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry and its index references (caller holds the lock)"""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+
+        user_keys = self._keys_by_user.get(entry.user_id)
+        if user_keys is not None:
+            user_keys.discard(key)
+            if not user_keys:
+                del self._keys_by_user[entry.user_id]
+
+        session_keys = self._keys_by_session.get(entry.session_pk)
+        if session_keys is not None:
+            session_keys.discard(key)
+            if not session_keys:
+                del self._keys_by_session[entry.session_pk]
+
+
+# Global instance storage
+_token_validation_cache_instance: Optional[TokenValidationCache] = None
+
+
+def get_token_validation_cache() -> TokenValidationCache:
+    """
+    Get or create the per-process token validation cache
+
+    Returns:
+        TokenValidationCache: The singleton cache instance
+    """
+    global _token_validation_cache_instance
+
+    if _token_validation_cache_instance is None:
+        _token_validation_cache_instance = TokenValidationCache(
+            max_entries=settings.TOKEN_CACHE_MAX_ENTRIES,
+            ttl_seconds=settings.TOKEN_CACHE_TTL_SECONDS
+        )
+
+    return _token_validation_cache_instance
+
+
+def reset_token_validation_cache() -> None:
+    """
+    Reset the singleton instance (useful for testing)
+    """
+    global _token_validation_cache_instance
+    _token_validation_cache_instance = None
@@ -4,6 +4,7 @@ Only dashboard summary/statistics operations
 Medical CRUD operations belong in their respective dedicated slices
 """
 from abc import ABC, abstractmethod
+from typing import Tuple
 from uuid import UUID
 
 from slices.dashboard.domain.entities.dashboard_stats import DashboardStats, MedicalDataSummary
@@ -12,6 +13,11 @@ from slices.dashboard.domain.entities.dashboard_stats import DashboardStats, Med
 class DashboardRepositoryPort(ABC):
     """Port interface for dashboard repository operations - ONLY summary/statistics"""
 
+    @abstractmethod
+    async def get_dashboard_overview(self, patient_id: UUID) -> Tuple[DashboardStats, MedicalDataSummary]:
+        """Get dashboard statistics and medical summary for a patient in a single call"""
+        pass
+
     @abstractmethod
     async def get_dashboard_stats(self, patient_id: UUID) -> DashboardStats:
         """Get aggregated dashboard statistics for a patient"""
@@ -24,11 +24,8 @@ class GetDashboardDataUseCase:
         Returns:
             DashboardData: Complete dashboard data including stats and medical summary
         """
-        # Get dashboard statistics
-        stats = await self.dashboard_repository.get_dashboard_stats(patient.id)
-
-        # Get medical data summary
-        medical_summary = await self.dashboard_repository.get_medical_data_summary(patient.id)
+        # Get dashboard statistics and medical data summary (one aggregate query)
+        stats, medical_summary = await self.dashboard_repository.get_dashboard_overview(patient.id)
 
         # Get recent medications (returns empty list for now to avoid conversion issues)
         recent_medications = []
@@ -11,7 +11,7 @@ class DashboardStats:
     """Dashboard statistics entity"""
     active_medications: int
     active_allergies: int
-    allergies_by_severity: Dict[str, int]  # {"leve": 2, "moderada": 1, "severa": 0, "critica": 1}
+    allergies_by_severity: Dict[str, int]  # {"leve": 2, "moderada": 1, "severa": 0, "critica": 1}, plus "other" when present
     active_surgeries: int
     active_illnesses: int
     chronic_illnesses: int
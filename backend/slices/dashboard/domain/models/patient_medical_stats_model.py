@@ -0,0 +1,41 @@
+"""
+Patient medical stats SQLAlchemy model
+"""
+from sqlalchemy import Column, DateTime, ForeignKey, Integer
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+
+from shared.database.database import Base
+
+
+class PatientMedicalStats(Base):
+    """Per-patient medical record counters, refreshed whenever the patient's medical data changes"""
+
+    __tablename__ = "patient_medical_stats"
+
+    patient_id = Column(UUID(as_uuid=True), ForeignKey("patients.id", ondelete="CASCADE"), primary_key=True)
+
+    medications_count = Column(Integer, nullable=False, default=0)
+    active_medications = Column(Integer, nullable=False, default=0)
+
+    allergies_count = Column(Integer, nullable=False, default=0)
+    allergies_leve = Column(Integer, nullable=False, default=0)
+    allergies_moderada = Column(Integer, nullable=False, default=0)
+    allergies_severa = Column(Integer, nullable=False, default=0)
+    allergies_critica = Column(Integer, nullable=False, default=0)
+    # Severity missing or outside ALLERGY_SEVERITY_LEVELS
+    allergies_other = Column(Integer, nullable=False, default=0)
+
+    surgeries_count = Column(Integer, nullable=False, default=0)
+
+    illnesses_count = Column(Integer, nullable=False, default=0)
+    active_illnesses = Column(Integer, nullable=False, default=0)
+    chronic_illnesses = Column(Integer, nullable=False, default=0)
+
+    # Latest updated_at across the four medical tables
+    last_activity_at = Column(DateTime(timezone=True), nullable=True)
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    def __repr__(self):
+        return f"<PatientMedicalStats(patient_id='{self.patient_id}', updated_at='{self.updated_at}')>"
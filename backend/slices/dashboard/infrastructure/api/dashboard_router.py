@@ -7,7 +7,8 @@ from fastapi import APIRouter, Depends, HTTPException, status, Request
 from sqlalchemy.orm import Session
 
 from shared.database.database import get_db
-from slices.auth.infrastructure.api.auth_endpoints import get_current_user
+from slices.auth.domain.entities.authenticated_identity import AuthenticatedIdentity
+from slices.auth.infrastructure.api.auth_endpoints import get_current_user, get_current_identity
 from slices.signup.domain.models.user_model import User
 from slices.signup.domain.models.patient_model import Patient
 
@@ -24,9 +25,9 @@ def get_dashboard_use_case(db: Session = Depends(get_db)) -> GetDashboardDataUse
     return GetDashboardDataUseCase(dashboard_repository)
 
 
-async def get_patient_from_user(user: User, db: Session) -> Patient:
-    """Get patient record from authenticated user"""
-    patient = db.query(Patient).filter(Patient.user_id == user.id).first()
+async def get_patient_from_user(identity: AuthenticatedIdentity) -> Patient:
+    """Get patient record from the identity resolved for this request"""
+    patient = await identity.get_patient()
     if not patient:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -39,7 +40,7 @@ async def get_patient_from_user(user: User, db: Session) -> Patient:
 async def get_dashboard_data(
     current_user: User = Depends(get_current_user),
     dashboard_use_case: GetDashboardDataUseCase = Depends(get_dashboard_use_case),
-    db: Session = Depends(get_db)
+    identity: AuthenticatedIdentity = Depends(get_current_identity)
 ):
     """
     Get complete dashboard data for authenticated patient
@@ -52,7 +53,7 @@ async def get_dashboard_data(
         )
 
     # Get patient record
-    patient = await get_patient_from_user(current_user, db)
+    patient = await get_patient_from_user(identity)
 
     # Get dashboard data
     dashboard_data = await dashboard_use_case.execute(current_user, patient)
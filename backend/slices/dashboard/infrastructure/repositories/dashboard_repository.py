@@ -2,10 +2,10 @@
 Dashboard repository implementation using SQLAlchemy
 """
 from datetime import datetime
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from uuid import UUID
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, func, desc
+from sqlalchemy import Boolean, Row, Select, String, and_, cast, func, desc, literal, null, or_, select, union_all
 from sqlalchemy.exc import SQLAlchemyError
 
 from slices.dashboard.application.ports.dashboard_repository import DashboardRepositoryPort
@@ -17,10 +17,111 @@ from slices.illnesses.domain.models.illness_model import PatientIllness
 
 # Import dashboard-specific models only
 from slices.dashboard.domain.models.medical_models import DashboardActivityLog
+from slices.dashboard.domain.models.patient_medical_stats_model import PatientMedicalStats
 from slices.dashboard.domain.entities.dashboard_stats import DashboardStats, MedicalDataSummary
 from slices.signup.domain.models.patient_model import Patient
 from slices.signup.domain.models.user_model import User
 
+ALLERGY_SEVERITY_LEVELS = ("leve", "moderada", "severa", "critica")
+ACTIVE_ILLNESS_STATUSES = ("activa", "en_tratamiento")
+
+# patient_medical_stats columns, in build_medical_stats_query order
+MEDICAL_STAT_COLUMNS = (
+    "medications_count",
+    "active_medications",
+    "allergies_count",
+    *[f"allergies_{severity}" for severity in ALLERGY_SEVERITY_LEVELS],
+    "allergies_other",
+    "surgeries_count",
+    "illnesses_count",
+    "active_illnesses",
+    "chronic_illnesses",
+    "last_activity_at",
+)
+
+
+def build_medical_stats_query(patient_ids: List[UUID]) -> Select:
+    """
+    Build the statement computing patient_medical_stats values from source
+
+    The four medical tables are combined with UNION ALL (one row per record,
+    tagged with its kind) and aggregated per patient with COUNT(*) FILTER
+    (WHERE ...). Patients without medical records get zero counters.
+
+    Args:
+        patient_ids: Patients to compute
+
+    Returns:
+        Select of patient_id followed by MEDICAL_STAT_COLUMNS, one row per existing patient
+    """
+    no_flag = cast(null(), Boolean)
+    no_text = cast(null(), String)
+
+    medical = union_all(
+        select(
+            PatientMedication.patient_id.label("patient_id"),
+            literal("medication").label("kind"),
+            PatientMedication.is_active.label("is_active"),
+            no_text.label("severity_level"),
+            no_text.label("status"),
+            no_flag.label("is_chronic"),
+            PatientMedication.updated_at.label("updated_at")
+        ).where(PatientMedication.patient_id.in_(patient_ids)),
+        select(
+            PatientAllergy.patient_id, literal("allergy"), no_flag, PatientAllergy.severity_level,
+            no_text, no_flag, PatientAllergy.updated_at
+        ).where(PatientAllergy.patient_id.in_(patient_ids)),
+        select(
+            PatientSurgery.patient_id, literal("surgery"), no_flag, no_text,
+            no_text, no_flag, PatientSurgery.updated_at
+        ).where(PatientSurgery.patient_id.in_(patient_ids)),
+        select(
+            PatientIllness.patient_id, literal("illness"), no_flag, no_text,
+            PatientIllness.status, PatientIllness.is_chronic, PatientIllness.updated_at
+        ).where(PatientIllness.patient_id.in_(patient_ids))
+    ).subquery("medical")
+
+    def count_where(*conditions):
+        return func.count().filter(and_(*conditions))
+
+    is_medication = medical.c.kind == "medication"
+    is_allergy = medical.c.kind == "allergy"
+    is_illness = medical.c.kind == "illness"
+
+    totals = select(
+        medical.c.patient_id,
+        count_where(is_medication).label("medications_count"),
+        count_where(is_medication, medical.c.is_active.is_(True)).label("active_medications"),
+        count_where(is_allergy).label("allergies_count"),
+        *[
+            count_where(is_allergy, medical.c.severity_level == severity).label(f"allergies_{severity}")
+            for severity in ALLERGY_SEVERITY_LEVELS
+        ],
+        count_where(
+            is_allergy,
+            or_(medical.c.severity_level.is_(None), medical.c.severity_level.not_in(ALLERGY_SEVERITY_LEVELS))
+        ).label("allergies_other"),
+        count_where(medical.c.kind == "surgery").label("surgeries_count"),
+        count_where(is_illness).label("illnesses_count"),
+        count_where(is_illness, medical.c.status.in_(ACTIVE_ILLNESS_STATUSES)).label("active_illnesses"),
+        count_where(is_illness, medical.c.is_chronic.is_(True)).label("chronic_illnesses"),
+        func.max(medical.c.updated_at).label("last_activity_at")
+    ).group_by(medical.c.patient_id).subquery("totals")
+
+    return (
+        select(
+            Patient.id.label("patient_id"),
+            *[
+                func.coalesce(totals.c[name], 0).label(name)
+                for name in MEDICAL_STAT_COLUMNS if name != "last_activity_at"
+            ],
+            totals.c.last_activity_at
+        )
+        .select_from(Patient)
+        .outerjoin(totals, totals.c.patient_id == Patient.id)
+        .where(Patient.id.in_(patient_ids))
+    )
+
 
 class DashboardRepository(DashboardRepositoryPort):
     """SQLAlchemy implementation of dashboard repository"""
@@ -29,162 +130,84 @@ class DashboardRepository(DashboardRepositoryPort):
         self.db = db_session
 
     # Dashboard Statistics
-    async def get_dashboard_stats(self, patient_id: UUID) -> DashboardStats:
-        """Get aggregated dashboard statistics for a patient"""
+    async def get_dashboard_overview(self, patient_id: UUID) -> Tuple[DashboardStats, MedicalDataSummary]:
+        """Get dashboard statistics and medical summary for a patient from its patient_medical_stats row"""
         try:
-            # Get active medications count
-            active_medications = self.db.query(PatientMedication).filter(
-                and_(
-                    PatientMedication.patient_id == patient_id,
-                    PatientMedication.is_active == True
-                )
-            ).count()
-
-            # Get allergies counts and severity breakdown
-            allergies_query = self.db.query(PatientAllergy).filter(
-                PatientAllergy.patient_id == patient_id
+            row = self.db.execute(self.build_dashboard_overview_query(patient_id)).first()
+
+            if row is not None and row.stats_patient_id is not None:
+                totals = {name: getattr(row, name) for name in MEDICAL_STAT_COLUMNS}
+            else:
+                # No stats row yet (not backfilled): aggregate from the medical tables
+                totals_row = self.db.execute(build_medical_stats_query([patient_id])).first()
+                totals = {name: getattr(totals_row, name) for name in MEDICAL_STAT_COLUMNS} if totals_row else {
+                    **dict.fromkeys(MEDICAL_STAT_COLUMNS, 0), "last_activity_at": None
+                }
+
+            allergies_by_severity = {
+                severity: totals[f"allergies_{severity}"] for severity in ALLERGY_SEVERITY_LEVELS
+            }
+            # Missing or unrecognized severity levels are still counted
+            if totals["allergies_other"]:
+                allergies_by_severity["other"] = totals["allergies_other"]
+
+            stats = DashboardStats(
+                active_medications=totals["active_medications"],
+                active_allergies=totals["allergies_count"],
+                allergies_by_severity=allergies_by_severity,
+                active_surgeries=totals["surgeries_count"],
+                active_illnesses=totals["active_illnesses"],
+                chronic_illnesses=totals["chronic_illnesses"],
+                profile_completeness=self._calculate_profile_completeness(row),
+                last_login=row.last_login if row else None,
+                last_updated=datetime.utcnow()
             )
-            total_allergies = allergies_query.count()
-
-            # Group allergies by severity
-            allergies_by_severity = {}
-            severity_counts = self.db.query(
-                PatientAllergy.severity_level,
-                func.count(PatientAllergy.id)
-            ).filter(
-                PatientAllergy.patient_id == patient_id
-            ).group_by(PatientAllergy.severity_level).all()
-
-            for severity, count in severity_counts:
-                allergies_by_severity[severity] = count
 
-            # Ensure all severity levels are present
-            for severity in ["leve", "moderada", "severa", "critica"]:
-                if severity not in allergies_by_severity:
-                    allergies_by_severity[severity] = 0
-
-            # Get surgeries count
-            total_surgeries = self.db.query(PatientSurgery).filter(
-                PatientSurgery.patient_id == patient_id
-            ).count()
-
-            # Get illnesses counts
-            active_illnesses = self.db.query(PatientIllness).filter(
-                and_(
-                    PatientIllness.patient_id == patient_id,
-                    PatientIllness.status.in_(["activa", "en_tratamiento"])
-                )
-            ).count()
-
-            chronic_illnesses = self.db.query(PatientIllness).filter(
-                and_(
-                    PatientIllness.patient_id == patient_id,
-                    PatientIllness.is_chronic == True
-                )
-            ).count()
-
-            # Get patient to calculate profile completeness
-            patient = self.db.query(Patient).filter(Patient.id == patient_id).first()
-            profile_completeness = self._calculate_profile_completeness(patient)
-
-            # Get last login from user
-            user = self.db.query(User).filter(User.id == patient.user_id).first() if patient else None
-            last_login = user.last_login if user else None
-
-            # Get last updated timestamp
-            last_updated = datetime.utcnow()
-
-            return DashboardStats(
-                active_medications=active_medications,
-                active_allergies=total_allergies,
-                allergies_by_severity=allergies_by_severity,
-                active_surgeries=total_surgeries,
-                active_illnesses=active_illnesses,
-                chronic_illnesses=chronic_illnesses,
-                profile_completeness=profile_completeness,
-                last_login=last_login,
-                last_updated=last_updated
+            medical_summary = MedicalDataSummary(
+                medications_count=totals["medications_count"],
+                allergies_count=totals["allergies_count"],
+                surgeries_count=totals["surgeries_count"],
+                illnesses_count=totals["illnesses_count"],
+                has_critical_allergies=totals["allergies_critica"] > 0,
+                has_chronic_illnesses=totals["chronic_illnesses"] > 0,
+                recent_activity=totals["last_activity_at"]
             )
 
+            return stats, medical_summary
+
         except SQLAlchemyError as e:
-            raise Exception(f"Database error getting dashboard stats: {str(e)}")
+            raise Exception(f"Database error getting dashboard overview: {str(e)}")
+
+    async def get_dashboard_stats(self, patient_id: UUID) -> DashboardStats:
+        """Get aggregated dashboard statistics for a patient"""
+        stats, _ = await self.get_dashboard_overview(patient_id)
+        return stats
 
     async def get_medical_data_summary(self, patient_id: UUID) -> MedicalDataSummary:
         """Get summary of all medical data for a patient"""
-        try:
-            medications_count = self.db.query(PatientMedication).filter(
-                PatientMedication.patient_id == patient_id
-            ).count()
-
-            allergies_count = self.db.query(PatientAllergy).filter(
-                PatientAllergy.patient_id == patient_id
-            ).count()
-
-            surgeries_count = self.db.query(PatientSurgery).filter(
-                PatientSurgery.patient_id == patient_id
-            ).count()
-
-            illnesses_count = self.db.query(PatientIllness).filter(
-                PatientIllness.patient_id == patient_id
-            ).count()
-
-            # Check for critical allergies
-            has_critical_allergies = self.db.query(PatientAllergy).filter(
-                and_(
-                    PatientAllergy.patient_id == patient_id,
-                    PatientAllergy.severity_level == "critica"
-                )
-            ).first() is not None
-
-            # Check for chronic illnesses
-            has_chronic_illnesses = self.db.query(PatientIllness).filter(
-                and_(
-                    PatientIllness.patient_id == patient_id,
-                    PatientIllness.is_chronic == True
-                )
-            ).first() is not None
-
-            # Get most recent activity across all medical data
-            recent_dates = []
-
-            latest_medication = self.db.query(func.max(PatientMedication.updated_at)).filter(
-                PatientMedication.patient_id == patient_id
-            ).scalar()
-            if latest_medication:
-                recent_dates.append(latest_medication)
-
-            latest_allergy = self.db.query(func.max(PatientAllergy.updated_at)).filter(
-                PatientAllergy.patient_id == patient_id
-            ).scalar()
-            if latest_allergy:
-                recent_dates.append(latest_allergy)
-
-            latest_surgery = self.db.query(func.max(PatientSurgery.updated_at)).filter(
-                PatientSurgery.patient_id == patient_id
-            ).scalar()
-            if latest_surgery:
-                recent_dates.append(latest_surgery)
-
-            latest_illness = self.db.query(func.max(PatientIllness.updated_at)).filter(
-                PatientIllness.patient_id == patient_id
-            ).scalar()
-            if latest_illness:
-                recent_dates.append(latest_illness)
-
-            recent_activity = max(recent_dates) if recent_dates else None
-
-            return MedicalDataSummary(
-                medications_count=medications_count,
-                allergies_count=allergies_count,
-                surgeries_count=surgeries_count,
-                illnesses_count=illnesses_count,
-                has_critical_allergies=has_critical_allergies,
-                has_chronic_illnesses=has_chronic_illnesses,
-                recent_activity=recent_activity
+        _, medical_summary = await self.get_dashboard_overview(patient_id)
+        return medical_summary
+
+    @staticmethod
+    def build_dashboard_overview_query(patient_id: UUID) -> Select:
+        """Build the dashboard statement: patient, user and the patient's stats row"""
+        return (
+            select(
+                PatientMedicalStats.patient_id.label("stats_patient_id"),
+                *[getattr(PatientMedicalStats, name) for name in MEDICAL_STAT_COLUMNS],
+                Patient.first_name,
+                Patient.last_name,
+                Patient.document_type_id,
+                Patient.document_number,
+                Patient.phone_international,
+                Patient.birth_date,
+                User.last_login
             )
-
-        except SQLAlchemyError as e:
-            raise Exception(f"Database error getting medical summary: {str(e)}")
+            .select_from(Patient)
+            .outerjoin(PatientMedicalStats, PatientMedicalStats.patient_id == Patient.id)
+            .outerjoin(User, User.id == Patient.user_id)
+            .where(Patient.id == patient_id)
+        )
 
     # Private helper methods to calculate stats from existing data
     async def get_recent_medications(self, patient_id: UUID, limit: int = 5) -> List[PatientMedication]:
@@ -245,17 +268,17 @@ class DashboardRepository(DashboardRepositoryPort):
             raise Exception(f"Database error getting recent activities: {str(e)}")
 
     # Private helper methods
-    def _calculate_profile_completeness(self, patient: Optional[Patient]) -> float:
-        """Calculate profile completeness percentage"""
-        if not patient:
+    def _calculate_profile_completeness(self, row: Optional[Row]) -> float:
+        """Calculate profile completeness percentage from the overview row's patient columns"""
+        if row is None:
             return 0.0
 
         required_fields = [
-            patient.full_name,
-            patient.document_type,
-            patient.document_number,
-            patient.phone_international,
-            patient.birth_date
+            f"{row.first_name} {row.last_name}",  # Patient.full_name
+            row.document_type_id,
+            row.document_number,
+            row.phone_international,
+            row.birth_date
         ]
 
         completed_fields = sum(1 for field in required_fields if field)
@@ -0,0 +1,146 @@
+"""
+Patient medical stats writer
+
+Keeps patient_medical_stats in step with the medical tables so the dashboard
+reads one row instead of counting patient_medications, patient_allergies,
+patient_surgeries and patient_illnesses. refresh_patient_medical_stats is
+registered in main.py as a listener of the patient data change notifier, which
+writers of medical data call before committing, so the counters change in the
+same transaction as the records they count. The reconciliation job recomputes
+every row from source and reports how many had drifted.
+
+Usage:
+    # Composition root (main.py)
+    configure_patient_data_change_notifier([..., refresh_patient_medical_stats])
+
+    # Backfill / reconcile every patient (from backend/)
+    poetry run python -m slices.dashboard.infrastructure.repositories.patient_medical_stats_writer
+"""
+import time
+from typing import Iterable
+from uuid import UUID
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from shared.database import SessionLocal
+from slices.dashboard.domain.models.patient_medical_stats_model import PatientMedicalStats
+from slices.dashboard.infrastructure.repositories.dashboard_repository import (
+    MEDICAL_STAT_COLUMNS,
+    build_medical_stats_query,
+)
+from slices.signup.domain.models.patient_model import Patient
+
+
+def refresh_patient_medical_stats(db: Session, patient_id: UUID) -> None:
+    """
+    Recompute one patient's counters in the caller's transaction
+
+    The caller must already hold the patient row lock (the patient data change
+    notifier takes it) so concurrent writers for the same patient recompute one after the other
+    and the last commit wins with correct totals. Pending changes are flushed
+    first so the counters reflect them. The caller commits (or rolls back)
+    with its own writes.
+
+    Args:
+        db: Session holding the writer's transaction
+        patient_id: Patient whose medical data changed
+    """
+    db.flush()
+    _upsert_stats(db, [patient_id])
+
+
+def reconcile_patient_medical_stats(db: Session, patient_ids: Iterable[UUID]) -> int:
+    """
+    Recompute counters for several patients with one statement
+
+    Args:
+        db: Session holding the transaction (caller commits)
+        patient_ids: Patients to recompute
+
+    Returns:
+        Number of rows inserted or corrected
+    """
+    patient_ids = list(patient_ids)
+    if not patient_ids:
+        return 0
+    return _upsert_stats(db, patient_ids)
+
+
+def reconcile_all_patient_medical_stats(batch_size: int = 500, verbose: bool = True) -> int:
+    """
+    Recompute counters for every patient, committing per batch
+
+    Args:
+        batch_size: Patients per batch
+        verbose: Print progress per batch
+
+    Returns:
+        Number of rows inserted or corrected
+    """
+    db = SessionLocal()
+    total = 0
+    last_id = None
+
+    try:
+        while True:
+            query = select(Patient.id).order_by(Patient.id).limit(batch_size)
+            if last_id is not None:
+                query = query.where(Patient.id > last_id)
+
+            patient_ids = db.execute(query).scalars().all()
+            if not patient_ids:
+                break
+
+            started = time.perf_counter()
+            corrected = reconcile_patient_medical_stats(db, patient_ids)
+            db.commit()
+
+            total += corrected
+            last_id = patient_ids[-1]
+
+            if verbose:
+                elapsed_ms = round((time.perf_counter() - started) * 1000, 2)
+                print(f"📊 MEDICAL STATS - Checked {len(patient_ids)} patients, {corrected} rows written in {elapsed_ms} ms (total {total})")
+
+            if len(patient_ids) < batch_size:
+                break
+    finally:
+        db.close()
+
+    return total
+
+
+def _upsert_stats(db: Session, patient_ids: list) -> int:
+    """Insert or correct stats rows from source; unchanged rows are left alone"""
+    statement = insert(PatientMedicalStats).from_select(
+        ["patient_id", *MEDICAL_STAT_COLUMNS],
+        build_medical_stats_query(patient_ids)
+    )
+    result = db.execute(
+        statement.on_conflict_do_update(
+            index_elements=[PatientMedicalStats.patient_id],
+            set_={
+                **{name: statement.excluded[name] for name in MEDICAL_STAT_COLUMNS},
+                "updated_at": func.now(),
+            },
+            where=or_(*[
+                getattr(PatientMedicalStats, name).is_distinct_from(statement.excluded[name])
+                for name in MEDICAL_STAT_COLUMNS
+            ])
+        )
+    )
+    return result.rowcount
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Recompute patient_medical_stats for all patients')
+    parser.add_argument('--batch-size', type=int, default=500, help='Patients per batch')
+
+    args = parser.parse_args()
+
+    count = reconcile_all_patient_medical_stats(batch_size=args.batch_size)
+    print(f"✅ MEDICAL STATS - {count} rows inserted or corrected")
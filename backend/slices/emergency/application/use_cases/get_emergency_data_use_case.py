@@ -11,6 +11,10 @@ from slices.emergency.application.dto.emergency_data_dto import (
     EmergencyDataDto, EmergencyContactDto, MedicationDto, AllergyDto,
     DiseaseDto, SurgeryDto, GynecologicalHistoryDto
 )
+from slices.emergency.infrastructure.persistence.emergency_qr_access_counter import (
+    EmergencyQRAccessCounter,
+    get_emergency_qr_access_counter,
+)
 from slices.signup.infrastructure.persistence.patient_repository import PatientRepository
 from sqlalchemy.orm import Session
 
@@ -22,11 +26,13 @@ class GetEmergencyDataUseCase:
         self,
         emergency_qr_repository: EmergencyQRRepositoryPort,
         patient_repository: PatientRepository,
-        db: Session
+        db: Session,
+        access_counter: Optional[EmergencyQRAccessCounter] = None
     ):
         self.emergency_qr_repository = emergency_qr_repository
         self.patient_repository = patient_repository
         self.db = db
+        self.access_counter = access_counter or get_emergency_qr_access_counter()
 
     def execute(self, qr_uuid: UUID, requesting_user_id: UUID) -> EmergencyDataDto:
         """
@@ -56,9 +62,8 @@ class GetEmergencyDataUseCase:
         if patient.user_id != requesting_user_id:
             raise ValueError("Access denied: QR code belongs to different user")
 
-        # Record access
-        emergency_qr.record_access()
-        self.emergency_qr_repository.update(emergency_qr)
+        # Record access (write-behind: flushed in batches, no row write on the read path)
+        self.access_counter.record(emergency_qr.id)
 
         # Build emergency contact DTO
         emergency_contact = EmergencyContactDto(
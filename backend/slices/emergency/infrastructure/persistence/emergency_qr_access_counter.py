@@ -0,0 +1,195 @@
+"""
+Write-behind access counters for emergency_qrs
+
+Reading emergency data used to increment emergency_qrs.access_count and set
+last_accessed_at through the ORM, committing one row write per read and
+turning popular QR codes into hot rows. Accesses are now accumulated in
+memory per worker and applied periodically with a single
+UPDATE ... FROM (VALUES ...) per batch, so the read path performs no writes.
+
+The periodic flush starts on the first access recorded from the event loop.
+Counts pending in a worker are lost if the process is killed before the next
+flush; main.py awaits close() in the application's shutdown hook.
+
+Usage:
+    from slices.emergency.infrastructure.persistence.emergency_qr_access_counter import get_emergency_qr_access_counter
+
+    counter = get_emergency_qr_access_counter()
+    counter.record(emergency_qr.id)   # non-blocking, callable from any thread
+    await counter.close()             # flush pending counts on shutdown
+"""
+import asyncio
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import DateTime, Integer, column, func, update, values
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+
+from shared.config.settings import settings
+from shared.database import async_engine
+from slices.emergency.domain.models.emergency_qr_model import EmergencyQR
+
+
+class EmergencyQRAccessCounter:
+    """Per-worker access counts flushed to emergency_qrs in batches"""
+
+    def __init__(
+        self,
+        engine=async_engine,
+        flush_interval_seconds: float = 5.0,
+        batch_size: int = 500
+    ):
+        self.engine = engine
+        self.flush_interval_seconds = flush_interval_seconds
+        self.batch_size = batch_size
+
+        # emergency_qrs.id -> (pending accesses, latest access time)
+        self._pending: Dict[UUID, Tuple[int, datetime]] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+        self._recorded = 0
+        self._flushed_rows = 0
+        self._flushes = 0
+        self._failed_flushes = 0
+
+    def record(self, emergency_qr_id: UUID) -> None:
+        """Count one access to an emergency QR code"""
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            hits, _ = self._pending.get(emergency_qr_id, (0, now))
+            self._pending[emergency_qr_id] = (hits + 1, now)
+            self._recorded += 1
+
+        if self._task is None:
+            try:
+                self.start()
+            except RuntimeError:
+                # Recorded from a worker thread; flushed once the loop starts the task
+                pass
+
+    async def flush(self) -> int:
+        """
+        Apply every pending count
+
+        Returns:
+            Number of emergency_qrs rows updated
+        """
+        async with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+
+            items = list(pending.items())
+            updated = 0
+
+            for start in range(0, len(items), self.batch_size):
+                batch = items[start:start + self.batch_size]
+                try:
+                    async with self.engine.begin() as conn:
+                        result = await conn.execute(self._build_update(batch))
+                except Exception as e:
+                    self._failed_flushes += 1
+                    print(f"⚠️ EMERGENCY QR ACCESS - Failed to flush {len(batch)} counters: {e}")
+                    # Merge unwritten counts back so they are retried on the next cycle
+                    self._restore(items[start:])
+                    break
+
+                updated += result.rowcount
+                self._flushed_rows += result.rowcount
+
+            if items:
+                self._flushes += 1
+            return updated
+
+    def start(self) -> None:
+        """Start the periodic flush task (no-op when disabled or already running)"""
+        if self.flush_interval_seconds <= 0 or self._task is not None:
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop the periodic task and flush pending counts"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        await self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get pending size and flush counters for this worker"""
+        with self._lock:
+            pending = len(self._pending)
+
+        return {
+            "pending_codes": pending,
+            "recorded": self._recorded,
+            "flushed_rows": self._flushed_rows,
+            "flushes": self._flushes,
+            "failed_flushes": self._failed_flushes
+        }
+
+    def _build_update(self, batch: List[Tuple[UUID, Tuple[int, datetime]]]):
+        """UPDATE emergency_qrs ... FROM (VALUES (id, hits, last_accessed_at), ...)"""
+        pending = values(
+            column("id", PGUUID(as_uuid=True)),
+            column("hits", Integer),
+            column("last_accessed_at", DateTime(timezone=True)),
+            name="pending"
+        ).data([(qr_id, hits, accessed_at) for qr_id, (hits, accessed_at) in batch])
+
+        return update(EmergencyQR).where(
+            EmergencyQR.id == pending.c.id
+        ).values(
+            access_count=EmergencyQR.access_count + pending.c.hits,
+            last_accessed_at=func.greatest(EmergencyQR.last_accessed_at, pending.c.last_accessed_at)
+        )
+
+    def _restore(self, items: List[Tuple[UUID, Tuple[int, datetime]]]) -> None:
+        """Merge counts that could not be written back into the pending map"""
+        with self._lock:
+            for qr_id, (hits, accessed_at) in items:
+                pending_hits, pending_at = self._pending.get(qr_id, (0, accessed_at))
+                self._pending[qr_id] = (pending_hits + hits, max(pending_at, accessed_at))
+
+    async def _run(self) -> None:
+        """Flush every interval until cancelled"""
+        while True:
+            await asyncio.sleep(self.flush_interval_seconds)
+            await self.flush()
+
+
+# Global instance storage
+_emergency_qr_access_counter_instance: Optional[EmergencyQRAccessCounter] = None
+
+
+def get_emergency_qr_access_counter() -> EmergencyQRAccessCounter:
+    """
+    Get or create the per-process emergency QR access counter
+
+    Returns:
+        EmergencyQRAccessCounter: The singleton counter instance
+    """
+    global _emergency_qr_access_counter_instance
+
+    if _emergency_qr_access_counter_instance is None:
+        _emergency_qr_access_counter_instance = EmergencyQRAccessCounter(
+            flush_interval_seconds=settings.EMERGENCY_QR_ACCESS_FLUSH_INTERVAL_SECONDS,
+            batch_size=settings.EMERGENCY_QR_ACCESS_BATCH_SIZE
+        )
+
+    return _emergency_qr_access_counter_instance
+
+
+def reset_emergency_qr_access_counter() -> None:
+    """
+    Reset the singleton instance (useful for testing)
+    """
+    global _emergency_qr_access_counter_instance
+    _emergency_qr_access_counter_instance = None
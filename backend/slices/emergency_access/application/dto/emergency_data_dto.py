@@ -1,9 +1,17 @@
 """
 Emergency Data DTOs for paramedic access
 """
-from pydantic import BaseModel, field_serializer
+from pydantic import BaseModel, Field, field_serializer
 from typing import List, Optional
 from datetime import date
+from enum import Enum
+from uuid import UUID
+
+
+class EmergencyDataTier(str, Enum):
+    """Emergency payload tiers"""
+    FULL = "full"
+    CRITICAL = "critical"
 
 
 class EmergencyMedicationDTO(BaseModel):
@@ -100,3 +108,53 @@ class EmergencyDataResponseDTO(BaseModel):
     @field_serializer('last_menstruation_date', when_used='json')
     def serialize_menstruation_date(self, value: Optional[date], _info) -> Optional[str]:
         return value.isoformat() if value else None
+
+
+class EmergencyCriticalDataResponseDTO(BaseModel):
+    """
+    Critical-first emergency data for paramedics
+
+    Only what is needed in the first seconds of care: blood type, severe and
+    critical allergies, active medications, chronic illnesses and the
+    emergency contact. Served by GET /api/emergency/{qr_code}/critical; the
+    full record is fetched from GET /api/emergency/{qr_code}.
+    """
+    tier: EmergencyDataTier = EmergencyDataTier.CRITICAL
+    full_name: str
+    birth_date: date
+    biological_sex: Optional[str] = None
+    blood_type: Optional[str] = None
+    is_pregnant: Optional[bool] = None
+    pregnancy_weeks: Optional[int] = None
+
+    emergency_contact_name: Optional[str] = None
+    emergency_contact_relationship: Optional[str] = None
+    emergency_contact_phone: Optional[str] = None
+    emergency_contact_phone_alt: Optional[str] = None
+
+    medications: List[EmergencyMedicationDTO] = []
+    allergies: List[EmergencyAllergyDTO] = []
+    illnesses: List[EmergencyIllnessDTO] = []
+
+    @field_serializer('birth_date', when_used='json')
+    def serialize_birth_date(self, value: date, _info) -> str:
+        return value.isoformat() if value else None
+
+
+class EmergencyBatchRequestDTO(BaseModel):
+    """QR codes scanned in a multi-victim incident"""
+    qr_codes: List[UUID] = Field(..., min_length=1)
+
+
+class EmergencyBatchItemDTO(BaseModel):
+    """Emergency data for one scanned QR code (data is None when not found)"""
+    qr_code: UUID
+    found: bool
+    data: Optional[EmergencyDataResponseDTO] = None
+
+
+class EmergencyBatchResponseDTO(BaseModel):
+    """Emergency data for every scanned QR code, in request order"""
+    results: List[EmergencyBatchItemDTO]
+    found_count: int
+    not_found_count: int
@@ -2,25 +2,44 @@
 Get Emergency Data Use Case
 Aggregates all patient information for paramedic emergency access
 """
-from typing import Optional
+import hashlib
+from typing import List, Optional
 from uuid import UUID
 from fastapi import HTTPException, status
 
+from shared.config.settings import settings
 from slices.emergency_access.application.dto.emergency_data_dto import (
+    EmergencyBatchItemDTO,
+    EmergencyBatchResponseDTO,
     EmergencyDataResponseDTO,
-    EmergencyMedicationDTO,
-    EmergencyAllergyDTO,
-    EmergencySurgeryDTO,
-    EmergencyIllnessDTO,
+    EmergencyDataTier,
 )
 from slices.emergency_access.infrastructure.repositories.emergency_data_repository import EmergencyDataRepository
+from slices.emergency_access.infrastructure.services.emergency_response_builder import (
+    build_critical_response,
+    build_emergency_response,
+    payload_digest,
+    serialize_emergency_response,
+)
+from slices.emergency_access.infrastructure.services.critical_payload_cache import (
+    CriticalPayloadCache,
+    get_critical_payload_cache,
+)
+
+# Bump when the serialized payload format changes so cached ETags stop matching
+EMERGENCY_PAYLOAD_VERSION = "1"
 
 
 class GetEmergencyDataUseCase:
     """Use case for fetching patient emergency data by QR code"""
 
-    def __init__(self, repository: EmergencyDataRepository):
+    def __init__(
+        self,
+        repository: EmergencyDataRepository,
+        critical_cache: Optional[CriticalPayloadCache] = None
+    ):
         self.repository = repository
+        self.critical_cache = critical_cache or get_critical_payload_cache()
 
     async def execute(self, qr_code: UUID) -> EmergencyDataResponseDTO:
         """
@@ -35,108 +54,142 @@ class GetEmergencyDataUseCase:
         Raises:
             HTTPException: If patient not found (404)
         """
-        # Get patient by QR code
-        patient = self.repository.get_patient_by_qr_code(qr_code)
+        # Get patient, document type and medical history in one round trip
+        record = await self.repository.get_emergency_record_by_qr_code(qr_code)
 
-        if not patient:
+        if not record:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Patient not found"
             )
 
-        # Get medical data
-        medications = self.repository.get_patient_medications(patient.id)
-        allergies = self.repository.get_patient_allergies(patient.id)
-        surgeries = self.repository.get_patient_surgeries(patient.id)
-        illnesses = self.repository.get_patient_illnesses(patient.id)
-
-        # Build DTOs
-        medication_dtos = [
-            EmergencyMedicationDTO(
-                medication_name=med.medication_name,
-                dosage=med.dosage,
-                frequency=med.frequency,
-                is_active=med.is_active,
-                notes=med.notes,
-                prescribed_by=med.prescribed_by,
-            )
-            for med in medications
-        ]
+        return build_emergency_response(record)
 
-        allergy_dtos = [
-            EmergencyAllergyDTO(
-                allergen=allergy.allergen,
-                severity_level=allergy.severity_level,
-                reaction_description=allergy.reaction_description,
-                notes=allergy.notes,
-            )
-            for allergy in allergies
-        ]
+    async def execute_batch(self, qr_codes: List[UUID]) -> EmergencyBatchResponseDTO:
+        """
+        Get emergency data for several patients scanned in a row
 
-        surgery_dtos = [
-            EmergencySurgeryDTO(
-                procedure_name=surgery.procedure_name,
-                surgery_date=surgery.surgery_date,
-                hospital_name=surgery.hospital_name,
-                complications=surgery.complications,
+        Args:
+            qr_codes: Patients' QR code UUIDs (at most EMERGENCY_BATCH_MAX_CODES)
+
+        Returns:
+            EmergencyBatchResponseDTO with one entry per requested code, in request order
+
+        Raises:
+            HTTPException: If too many codes are requested (400)
+        """
+        if len(qr_codes) > settings.EMERGENCY_BATCH_MAX_CODES:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"A batch can contain at most {settings.EMERGENCY_BATCH_MAX_CODES} QR codes"
             )
-            for surgery in surgeries
+
+        records = await self.repository.get_emergency_records_by_qr_codes(qr_codes)
+
+        # Build each response once even if a code was scanned twice
+        responses = {qr_code: build_emergency_response(record) for qr_code, record in records.items()}
+        results = [
+            EmergencyBatchItemDTO(qr_code=qr_code, found=qr_code in responses, data=responses.get(qr_code))
+            for qr_code in qr_codes
         ]
+        found_count = sum(1 for item in results if item.found)
+
+        return EmergencyBatchResponseDTO(
+            results=results,
+            found_count=found_count,
+            not_found_count=len(results) - found_count
+        )
+
+    async def get_etag(self, qr_code: UUID, tier: EmergencyDataTier = EmergencyDataTier.FULL) -> Optional[str]:
+        """
+        Get a strong ETag for a patient's emergency payload
+
+        Derived from the payload digest stored with the patient's snapshot, a
+        single-row read; the payload itself is not loaded. The digest is
+        rewritten in the same transaction as the data it hashes, so the ETag
+        changes exactly when a committed payload does.
+
+        Args:
+            qr_code: Patient's unique QR code UUID
+            tier: Payload tier the ETag is for
+
+        Returns:
+            Quoted ETag value, or None when the patient has no snapshot (the
+            ETag is then derived from the payload itself with payload_etag)
+        """
+        digests = await self.repository.get_snapshot_digests(qr_code)
+        if digests is None:
+            return None
+
+        full_digest, critical_digest = digests
+        digest = critical_digest if tier == EmergencyDataTier.CRITICAL else full_digest
+        return compute_emergency_etag(digest, tier) if digest else None
+
+    async def execute_serialized(self, qr_code: UUID) -> bytes:
+        """
+        Get the serialized emergency payload for a patient by QR code
+
+        Served from the materialized snapshot (single indexed read) when one
+        exists, otherwise built from the live tables.
 
-        illness_dtos = [
-            EmergencyIllnessDTO(
-                illness_name=illness.illness_name,
-                diagnosis_date=illness.diagnosis_date,
-                status=illness.status,
-                is_chronic=illness.is_chronic,
-                treatment_description=illness.treatment_description,
-                cie10_code=illness.cie10_code,
+        Args:
+            qr_code: Patient's unique QR code UUID
+
+        Returns:
+            UTF-8 JSON of the EmergencyDataResponseDTO
+
+        Raises:
+            HTTPException: If patient not found (404)
+        """
+        payload = await self.repository.get_snapshot_payload_by_qr_code(qr_code)
+        if payload is not None:
+            return payload
+
+        return serialize_emergency_response(await self.execute(qr_code))
+
+    async def execute_critical_serialized(self, qr_code: UUID, etag: Optional[str]) -> bytes:
+        """
+        Get the serialized critical-tier payload for a patient by QR code
+
+        Served from the per-worker cache while the payload's ETag is current,
+        otherwise loaded with a column-projected query and cached. Without an
+        ETag (no snapshot yet) the cache is bypassed.
+
+        Args:
+            qr_code: Patient's unique QR code UUID
+            etag: Current critical-tier ETag (from get_etag), or None
+
+        Returns:
+            UTF-8 JSON of the EmergencyCriticalDataResponseDTO
+
+        Raises:
+            HTTPException: If patient not found (404)
+        """
+        if etag is not None:
+            payload = self.critical_cache.get(qr_code, etag)
+            if payload is not None:
+                return payload
+
+        record = await self.repository.get_critical_record_by_qr_code(qr_code)
+
+        if not record:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Patient not found"
             )
-            for illness in illnesses
-        ]
 
-        # Build response DTO
-        response_data = {
-            # Basic Information
-            "full_name": patient.full_name,
-            "document_type": patient.document_type.name if patient.document_type else "",
-            "document_number": patient.document_number,
-            "birth_date": patient.birth_date,
-            "biological_sex": patient.biological_sex,
-            "gender": patient.gender,
-
-            # Personal Information
-            "blood_type": patient.blood_type,
-            "eps": patient.eps,
-            "occupation": patient.occupation,
-            "residence_address": patient.residence_address,
-            "residence_country": patient.residence_country,
-            "residence_city": patient.residence_city,
-
-            # Emergency Contacts
-            "emergency_contact_name": patient.emergency_contact_name,
-            "emergency_contact_relationship": patient.emergency_contact_relationship,
-            "emergency_contact_phone": patient.emergency_contact_phone,
-            "emergency_contact_phone_alt": patient.emergency_contact_phone_alt,
-
-            # Medical Information
-            "medications": medication_dtos,
-            "allergies": allergy_dtos,
-            "surgeries": surgery_dtos,
-            "illnesses": illness_dtos,
-        }
-
-        # Add gynecological information only if biological_sex is 'F'
-        if patient.biological_sex == 'F':
-            response_data.update({
-                "is_pregnant": patient.is_pregnant,
-                "pregnancy_weeks": patient.pregnancy_weeks,
-                "last_menstruation_date": patient.last_menstruation_date,
-                "pregnancies_count": patient.pregnancies_count,
-                "births_count": patient.births_count,
-                "cesareans_count": patient.cesareans_count,
-                "abortions_count": patient.abortions_count,
-                "contraceptive_method": patient.contraceptive_method,
-            })
-
-        return EmergencyDataResponseDTO(**response_data)
+        payload = serialize_emergency_response(build_critical_response(record))
+        if etag is not None:
+            self.critical_cache.put(qr_code, etag, payload)
+        return payload
+
+
+def compute_emergency_etag(digest: str, tier: EmergencyDataTier = EmergencyDataTier.FULL) -> str:
+    """Build a quoted strong ETag from a payload digest and payload tier"""
+    source = "|".join([EMERGENCY_PAYLOAD_VERSION, tier.value, digest])
+    return '"' + hashlib.sha256(source.encode("utf-8")).hexdigest()[:32] + '"'
+
+
+def payload_etag(payload: bytes, tier: EmergencyDataTier = EmergencyDataTier.FULL) -> str:
+    """Build the ETag of a payload that has no stored digest (patient without a snapshot)"""
+    return compute_emergency_etag(payload_digest(payload), tier)
@@ -1,3 +1,8 @@
 """
 Domain models for emergency access
 """
+from .emergency_access_log_model import EmergencyAccessLog
+from .emergency_record import EmergencyRecord
+from .emergency_snapshot_model import PatientEmergencySnapshot
+
+__all__ = ["EmergencyAccessLog", "EmergencyRecord", "PatientEmergencySnapshot"]
@@ -0,0 +1,43 @@
+"""
+Emergency access log SQLAlchemy model
+"""
+from sqlalchemy import BigInteger, Column, DateTime, Float, Index, SmallInteger, String, Text
+from sqlalchemy.dialects.postgresql import INET, UUID
+from sqlalchemy.sql import func
+
+from shared.database.database import Base
+
+
+class EmergencyAccessLog(Base):
+    """
+    Append-only audit row for every paramedic read of emergency data
+
+    Range-partitioned by month on accessed_at (partitions are created by
+    EmergencyAccessLogSink.ensure_partitions), so the partition key is part of
+    the primary key. No foreign keys: audit rows must outlive the users and
+    patients they mention and inserts must stay cheap.
+    """
+
+    __tablename__ = "emergency_access_logs"
+    __table_args__ = (
+        Index("ix_emergency_access_logs_qr_code_accessed_at", "qr_code", "accessed_at"),
+        Index("ix_emergency_access_logs_patient_id_accessed_at", "patient_id", "accessed_at"),
+        Index("ix_emergency_access_logs_paramedic_user_id_accessed_at", "paramedic_user_id", "accessed_at"),
+        {"postgresql_partition_by": "RANGE (accessed_at)"},
+    )
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    accessed_at = Column(DateTime(timezone=True), primary_key=True, server_default=func.now())
+
+    paramedic_user_id = Column(UUID(as_uuid=True), nullable=False)
+    patient_id = Column(UUID(as_uuid=True), nullable=True)  # NULL when the QR code was not found
+    qr_code = Column(UUID(as_uuid=True), nullable=False)
+
+    access_type = Column(String(20), nullable=False)  # 'full', 'critical', 'batch'
+    status_code = Column(SmallInteger, nullable=False)
+    ip_address = Column(INET, nullable=True)
+    user_agent = Column(Text, nullable=True)
+    latency_ms = Column(Float, nullable=False)
+
+    def __repr__(self):
+        return f"<EmergencyAccessLog(id={self.id}, qr_code='{self.qr_code}', status={self.status_code})>"
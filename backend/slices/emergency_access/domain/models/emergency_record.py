@@ -0,0 +1,18 @@
+"""
+Emergency record loaded in a single round trip
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from slices.signup.domain.models.patient_model import Patient
+
+
+@dataclass
+class EmergencyRecord:
+    """Patient row plus its medical history as JSON-aggregated child rows"""
+    patient: Patient
+    document_type_name: Optional[str]
+    medications: List[Dict[str, Any]] = field(default_factory=list)
+    allergies: List[Dict[str, Any]] = field(default_factory=list)
+    surgeries: List[Dict[str, Any]] = field(default_factory=list)
+    illnesses: List[Dict[str, Any]] = field(default_factory=list)
@@ -0,0 +1,25 @@
+"""
+Patient emergency snapshot SQLAlchemy model
+"""
+from sqlalchemy import Column, DateTime, ForeignKey, LargeBinary, String
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+
+from shared.database.database import Base
+
+
+class PatientEmergencySnapshot(Base):
+    """Serialized EmergencyDataResponseDTO per patient, rebuilt whenever the patient's emergency data changes"""
+
+    __tablename__ = "patient_emergency_snapshots"
+
+    patient_id = Column(UUID(as_uuid=True), ForeignKey("patients.id", ondelete="CASCADE"), primary_key=True)
+    qr_code = Column(UUID(as_uuid=True), nullable=False, unique=True, index=True)
+    payload = Column(LargeBinary, nullable=False)  # UTF-8 JSON, served as-is
+    # SHA-256 hex digests written with the payload; the emergency ETags are derived from them
+    payload_digest = Column(String(64), nullable=False)
+    critical_digest = Column(String(64), nullable=True)  # Critical-tier payload built from the same record
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    def __repr__(self):
+        return f"<PatientEmergencySnapshot(patient_id='{self.patient_id}', updated_at='{self.updated_at}')>"
@@ -2,20 +2,77 @@
 Emergency Access API Router
 Provides paramedic-only access to patient emergency data via QR code
 """
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+import ipaddress
+import time
+from datetime import datetime, timezone
+from typing import Optional, Union
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
-from shared.database import get_db
-from slices.auth.infrastructure.api.auth_endpoints import get_current_user
+from shared.database import get_async_db
+from shared.utils.etag import etag_matches
+from slices.auth.infrastructure.api.auth_endpoints import get_client_ip, get_current_user
 from slices.signup.domain.models.user_model import User
-from slices.emergency_access.application.dto.emergency_data_dto import EmergencyDataResponseDTO
-from slices.emergency_access.application.use_cases.get_emergency_data_use_case import GetEmergencyDataUseCase
+from slices.emergency_access.application.dto.emergency_data_dto import (
+    EmergencyBatchRequestDTO,
+    EmergencyBatchResponseDTO,
+    EmergencyCriticalDataResponseDTO,
+    EmergencyDataResponseDTO,
+    EmergencyDataTier,
+)
+from slices.emergency_access.application.use_cases.get_emergency_data_use_case import (
+    GetEmergencyDataUseCase,
+    payload_etag,
+)
+from slices.emergency_access.infrastructure.persistence.emergency_access_log_sink import get_emergency_access_log_sink
 from slices.emergency_access.infrastructure.repositories.emergency_data_repository import EmergencyDataRepository
+from slices.qr.infrastructure.services.qr_code_resolver import get_qr_code_resolver
 
 
 router = APIRouter(prefix="/api/emergency", tags=["Emergency Access"])
 
+# Paramedic devices may reuse a response only after revalidating it with If-None-Match
+EMERGENCY_CACHE_CONTROL = "private, no-cache"
+
+
+def _cache_headers(etag: str) -> dict:
+    """Validator and revalidation headers of an emergency response"""
+    return {"ETag": etag, "Cache-Control": EMERGENCY_CACHE_CONTROL, "Vary": "Authorization"}
+
+
+def log_emergency_access(
+    request: Request,
+    paramedic_user: User,
+    qr_code: UUID,
+    access_type: str,
+    status_code: int,
+    started: float
+) -> None:
+    """
+    Queue an emergency access audit row (non-blocking, written in batches)
+
+    The patient id comes from the QR resolver cache, which the lookup that
+    served the request has just populated, so no query is needed.
+    """
+    client_ip = get_client_ip(request)
+    try:
+        ipaddress.ip_address(client_ip)
+    except ValueError:
+        client_ip = None
+
+    get_emergency_access_log_sink().enqueue({
+        "accessed_at": datetime.now(timezone.utc),
+        "paramedic_user_id": paramedic_user.id,
+        "patient_id": get_qr_code_resolver().get_patient_id(qr_code) if status_code < 400 else None,
+        "qr_code": qr_code,
+        "access_type": access_type,
+        "status_code": status_code,
+        "ip_address": client_ip,
+        "user_agent": request.headers.get("User-Agent"),
+        "latency_ms": round((time.perf_counter() - started) * 1000, 3)
+    })
+
 
 def get_current_paramedic_user(
     current_user: User = Depends(get_current_user)
@@ -40,12 +97,155 @@ def get_current_paramedic_user(
     return current_user
 
 
-@router.get("/{qr_code}", response_model=EmergencyDataResponseDTO)
+@router.post("/batch", response_model=EmergencyBatchResponseDTO)
+async def get_emergency_data_batch(
+    batch_request: EmergencyBatchRequestDTO,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    paramedic_user: User = Depends(get_current_paramedic_user)
+) -> EmergencyBatchResponseDTO:
+    """
+    Get emergency data for several patients by QR code
+
+    **Paramedic-only endpoint** - For multi-victim incidents where many QR
+    codes are scanned in a row. All records are loaded in a single query;
+    codes that do not match a patient are returned with found=false instead
+    of failing the whole request.
+
+    Every requested code is recorded in the emergency access log.
+
+    Args:
+        batch_request: QR codes to resolve (at most EMERGENCY_BATCH_MAX_CODES)
+        request: HTTP request (client IP and User-Agent for the access log)
+        db: Async database session
+        paramedic_user: Current authenticated paramedic user
+
+    Returns:
+        EmergencyBatchResponseDTO with one entry per requested code
+
+    Raises:
+        HTTPException 400: If too many codes are requested
+        HTTPException 401: If user is not authenticated
+        HTTPException 403: If user is not a paramedic
+    """
+    started = time.perf_counter()
+    repository = EmergencyDataRepository(db, get_qr_code_resolver())
+    use_case = GetEmergencyDataUseCase(repository)
+
+    response = await use_case.execute_batch(batch_request.qr_codes)
+
+    for item in response.results:
+        log_emergency_access(
+            request, paramedic_user, item.qr_code, "batch",
+            status.HTTP_200_OK if item.found else status.HTTP_404_NOT_FOUND, started
+        )
+
+    return response
+
+
+async def serve_emergency_data(
+    qr_code: UUID,
+    tier: EmergencyDataTier,
+    request: Request,
+    if_none_match: Optional[str],
+    db: AsyncSession,
+    paramedic_user: User
+) -> Response:
+    """
+    Serve one tier of a patient's emergency data as a conditional GET
+
+    The tier's ETag, derived from the payload digest stored with the
+    patient's snapshot, is compared before the payload is loaded (304 on a
+    match). Every request, including 304 and 404 responses, is recorded in
+    the emergency access log without adding a database round trip.
+    """
+    started = time.perf_counter()
+    status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+
+    try:
+        # Initialize repository and use case
+        repository = EmergencyDataRepository(db, get_qr_code_resolver())
+        use_case = GetEmergencyDataUseCase(repository)
+
+        # Conditional GET: compare the snapshot's payload digest before loading the record
+        etag = await use_case.get_etag(qr_code, tier)
+
+        if etag is not None and etag_matches(if_none_match, etag):
+            status_code = status.HTTP_304_NOT_MODIFIED
+            return Response(status_code=status_code, headers=_cache_headers(etag))
+
+        if tier == EmergencyDataTier.CRITICAL:
+            payload = await use_case.execute_critical_serialized(qr_code, etag)
+        else:
+            # Execute use case (stored snapshot bytes are returned without re-validation)
+            payload = await use_case.execute_serialized(qr_code)
+
+        if etag is None:
+            # No snapshot yet: the ETag is the digest of the payload just built
+            etag = payload_etag(payload, tier)
+            if etag_matches(if_none_match, etag):
+                status_code = status.HTTP_304_NOT_MODIFIED
+                return Response(status_code=status_code, headers=_cache_headers(etag))
+
+        status_code = status.HTTP_200_OK
+        return Response(content=payload, media_type="application/json", headers=_cache_headers(etag))
+    except HTTPException as e:
+        status_code = e.status_code
+        raise
+    finally:
+        log_emergency_access(request, paramedic_user, qr_code, tier.value, status_code, started)
+
+
+@router.get("/{qr_code}/critical", response_model=EmergencyCriticalDataResponseDTO)
+async def get_emergency_critical_data(
+    qr_code: UUID,
+    request: Request,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+    paramedic_user: User = Depends(get_current_paramedic_user)
+) -> Response:
+    """
+    Get the critical subset of patient emergency data by QR code
+
+    **Paramedic-only endpoint** - Requires authentication with user_type='paramedic'
+
+    Returns only blood type, severe/critical allergies, active medications,
+    chronic illnesses and the emergency contact, from a small per-worker
+    cache; the client then fetches GET /api/emergency/{qr_code} for the full
+    record. The ETag is computed from the critical rows only, so changes to
+    surgeries or non-critical rows do not invalidate it.
+
+    Same response as GET /api/emergency/{qr_code}?tier=critical.
+
+    Args:
+        qr_code: Patient's unique QR code UUID
+        request: HTTP request (client IP and User-Agent for the access log)
+        if_none_match: ETag(s) of a previously received payload
+        db: Async database session
+        paramedic_user: Current authenticated paramedic user
+
+    Returns:
+        EmergencyCriticalDataResponseDTO JSON
+
+    Raises:
+        HTTPException 401: If user is not authenticated
+        HTTPException 403: If user is not a paramedic
+        HTTPException 404: If patient not found
+    """
+    return await serve_emergency_data(
+        qr_code, EmergencyDataTier.CRITICAL, request, if_none_match, db, paramedic_user
+    )
+
+
+@router.get("/{qr_code}", response_model=Union[EmergencyDataResponseDTO, EmergencyCriticalDataResponseDTO])
 async def get_emergency_data(
     qr_code: UUID,
-    db: Session = Depends(get_db),
+    request: Request,
+    tier: EmergencyDataTier = Query(EmergencyDataTier.FULL, description="Payload tier (critical = first-seconds subset)"),
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
     paramedic_user: User = Depends(get_current_paramedic_user)
-) -> EmergencyDataResponseDTO:
+) -> Response:
     """
     Get patient emergency data by QR code
 
@@ -58,24 +258,30 @@ async def get_emergency_data(
     - Medical history (medications, allergies, surgeries, illnesses)
     - Gynecological information (if biological_sex='F')
 
+    With tier=critical only the critical subset is returned, exactly as
+    GET /api/emergency/{qr_code}/critical serves it.
+
+    Supports conditional requests: the response carries a strong ETag and
+    a matching If-None-Match returns 304 without building the payload.
+
+    Every request, including 304 and 404 responses, is recorded in the
+    emergency access log without adding a database round trip.
+
     Args:
         qr_code: Patient's unique QR code UUID
-        db: Database session
+        request: HTTP request (client IP and User-Agent for the access log)
+        tier: Payload tier, full (default) or critical
+        if_none_match: ETag(s) of a previously received payload
+        db: Async database session
         paramedic_user: Current authenticated paramedic user
 
     Returns:
-        EmergencyDataResponseDTO with all patient emergency information
+        EmergencyDataResponseDTO JSON, served from the patient's materialized snapshot when available
+        (EmergencyCriticalDataResponseDTO JSON for tier=critical)
 
     Raises:
         HTTPException 401: If user is not authenticated
         HTTPException 403: If user is not a paramedic
         HTTPException 404: If patient not found
     """
-    # Initialize repository and use case
-    repository = EmergencyDataRepository(db)
-    use_case = GetEmergencyDataUseCase(repository)
-
-    # Execute use case
-    result = await use_case.execute(qr_code)
-
-    return result
+    return await serve_emergency_data(qr_code, tier, request, if_none_match, db, paramedic_user)
@@ -0,0 +1,3 @@
+"""
+Persistence for emergency access infrastructure layer
+"""
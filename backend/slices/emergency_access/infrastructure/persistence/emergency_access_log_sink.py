@@ -0,0 +1,131 @@
+"""
+Buffered writer for emergency_access_logs audit rows
+
+Every paramedic read of emergency data is audited (paramedic, patient, QR
+code, time, IP and latency). Rows are queued in memory and written in
+batches with a multi-row INSERT over the async engine (see
+BufferedBatchWriter), so auditing adds no round trip to the emergency path.
+
+emergency_access_logs is range-partitioned by month. ensure_partitions()
+creates the partitions for the current and upcoming months. It runs at
+startup and again before the first flush of each new month, so a
+long-running worker keeps creating partitions ahead of time; rows outside
+them land in the default partition.
+
+Usage:
+    from slices.emergency_access.infrastructure.persistence.emergency_access_log_sink import get_emergency_access_log_sink
+
+    sink = get_emergency_access_log_sink()
+    sink.enqueue({...})   # non-blocking
+    await sink.close()    # flush remaining rows on shutdown
+"""
+from datetime import datetime, timezone
+from typing import Optional, Tuple
+
+from sqlalchemy import text
+
+from shared.config.settings import settings
+from shared.database import AsyncSessionLocal, async_engine
+from shared.database.buffered_batch_writer import BufferedBatchWriter
+from slices.emergency_access.domain.models.emergency_access_log_model import EmergencyAccessLog
+
+
+def _month_start(year: int, month: int) -> datetime:
+    """First instant of a month in UTC, normalizing month overflow"""
+    year += (month - 1) // 12
+    month = (month - 1) % 12 + 1
+    return datetime(year, month, 1, tzinfo=timezone.utc)
+
+
+class EmergencyAccessLogSink(BufferedBatchWriter):
+    """Bounded in-memory queue of emergency access audit rows flushed in batches"""
+
+    model = EmergencyAccessLog
+    log_label = "EMERGENCY ACCESS LOG"
+    row_noun = "access rows"
+
+    def __init__(
+        self,
+        session_factory=AsyncSessionLocal,
+        engine=async_engine,
+        batch_size: int = 500,
+        flush_interval_seconds: float = 1.0,
+        max_queue_size: int = 20000,
+        partition_months_ahead: int = 2
+    ):
+        super().__init__(
+            session_factory=session_factory,
+            batch_size=batch_size,
+            flush_interval_seconds=flush_interval_seconds,
+            max_queue_size=max_queue_size
+        )
+        self.engine = engine
+        self.partition_months_ahead = partition_months_ahead
+
+        # (year, month) ensure_partitions last ran for
+        self._partitions_month: Optional[Tuple[int, int]] = None
+
+    async def ensure_partitions(self, months_ahead: Optional[int] = None) -> None:
+        """
+        Create monthly partitions from the current month through months_ahead
+
+        A partition whose range already has rows in the default partition
+        cannot be created; that month keeps using the default partition.
+        """
+        if months_ahead is None:
+            months_ahead = self.partition_months_ahead
+
+        now = datetime.now(timezone.utc)
+        self._partitions_month = (now.year, now.month)
+
+        for offset in range(months_ahead + 1):
+            start = _month_start(now.year, now.month + offset)
+            end = _month_start(now.year, now.month + offset + 1)
+            name = f"emergency_access_logs_y{start.year}m{start.month:02d}"
+
+            try:
+                async with self.engine.begin() as conn:
+                    await conn.execute(text(
+                        f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF emergency_access_logs "
+                        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+                    ))
+            except Exception as e:
+                print(f"⚠️ EMERGENCY ACCESS LOG - Could not create partition {name}: {e}")
+
+    async def _before_flush(self) -> None:
+        """Roll the partition window forward when the month changed since the last check"""
+        now = datetime.now(timezone.utc)
+        if self._partitions_month != (now.year, now.month):
+            await self.ensure_partitions()
+
+
+# Global instance storage
+_emergency_access_log_sink_instance: Optional[EmergencyAccessLogSink] = None
+
+
+def get_emergency_access_log_sink() -> EmergencyAccessLogSink:
+    """
+    Get or create the per-process emergency access log sink
+
+    Returns:
+        EmergencyAccessLogSink: The singleton sink instance
+    """
+    global _emergency_access_log_sink_instance
+
+    if _emergency_access_log_sink_instance is None:
+        _emergency_access_log_sink_instance = EmergencyAccessLogSink(
+            batch_size=settings.EMERGENCY_ACCESS_LOG_BATCH_SIZE,
+            flush_interval_seconds=settings.EMERGENCY_ACCESS_LOG_FLUSH_INTERVAL_SECONDS,
+            max_queue_size=settings.EMERGENCY_ACCESS_LOG_MAX_QUEUE_SIZE,
+            partition_months_ahead=settings.EMERGENCY_ACCESS_LOG_PARTITION_MONTHS_AHEAD
+        )
+
+    return _emergency_access_log_sink_instance
+
+
+def reset_emergency_access_log_sink() -> None:
+    """
+    Reset the singleton instance (useful for testing)
+    """
+    global _emergency_access_log_sink_instance
+    _emergency_access_log_sink_instance = None
@@ -2,24 +2,240 @@
 Emergency Data Repository for paramedic access
 Aggregates patient data from multiple tables
 """
-from typing import Optional, List
+from typing import Dict, Optional, List, Sequence, Tuple
 from uuid import UUID
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import JSON, func, literal_column, select, type_coerce
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, load_only
 
+from slices.emergency_access.domain.models.emergency_record import EmergencyRecord
+from slices.emergency_access.domain.models.emergency_snapshot_model import PatientEmergencySnapshot
 from slices.signup.domain.models.patient_model import Patient
+from slices.signup.domain.models.document_type_model import DocumentType
 from slices.medications.domain.models.medication_model import PatientMedication
 from slices.allergies.domain.models.allergy_model import PatientAllergy
 from slices.surgeries.domain.models.surgery_model import PatientSurgery
 from slices.illnesses.domain.models.illness_model import PatientIllness
+from slices.qr.application.ports.qr_code_resolver_port import QRCodeResolverPort
+
+
+def _json_rows(columns, where, order_by):
+    """
+    Correlated subquery returning child rows as a JSON array (empty array when none)
+
+    Args:
+        columns: Model columns to include, keyed by their attribute name
+        where: Filter criteria correlating the child table with Patient
+        order_by: Ordering applied inside the aggregate
+    """
+    row = func.json_build_object(*[
+        part for column in columns for part in (column.key, column)
+    ])
+    return type_coerce(
+        select(
+            func.coalesce(
+                func.json_agg(aggregate_order_by(row, *order_by)),
+                literal_column("'[]'::json")
+            )
+        ).where(*where).scalar_subquery(),
+        JSON
+    )
+
+
+def build_emergency_record_query(*criteria):
+    """
+    Statement selecting patient, document type and medical history in one round trip
+
+    Medications, allergies, surgeries and illnesses are aggregated into JSON
+    arrays by correlated subqueries, keeping the ordering of the per-table
+    queries. Shared by the async read path and the sync snapshot writer.
+
+    Args:
+        criteria: Filter criteria on Patient (e.g. Patient.qr_code == qr_code)
+    """
+    medications = _json_rows(
+        [
+            PatientMedication.medication_name,
+            PatientMedication.dosage,
+            PatientMedication.frequency,
+            PatientMedication.is_active,
+            PatientMedication.notes,
+            PatientMedication.prescribed_by,
+        ],
+        where=[PatientMedication.patient_id == Patient.id, PatientMedication.is_active == True],
+        order_by=[PatientMedication.created_at.desc()]
+    )
+    allergies = _json_rows(
+        [
+            PatientAllergy.allergen,
+            PatientAllergy.severity_level,
+            PatientAllergy.reaction_description,
+            PatientAllergy.notes,
+        ],
+        where=[PatientAllergy.patient_id == Patient.id],
+        order_by=[PatientAllergy.severity_level.desc()]
+    )
+    surgeries = _json_rows(
+        [
+            PatientSurgery.procedure_name,
+            PatientSurgery.surgery_date,
+            PatientSurgery.hospital_name,
+            PatientSurgery.complications,
+        ],
+        where=[PatientSurgery.patient_id == Patient.id],
+        order_by=[PatientSurgery.surgery_date.desc()]
+    )
+    illnesses = _json_rows(
+        [
+            PatientIllness.illness_name,
+            PatientIllness.diagnosis_date,
+            PatientIllness.status,
+            PatientIllness.is_chronic,
+            PatientIllness.treatment_description,
+            PatientIllness.cie10_code,
+        ],
+        where=[PatientIllness.patient_id == Patient.id],
+        order_by=[PatientIllness.is_chronic.desc(), PatientIllness.diagnosis_date.desc()]
+    )
+
+    return select(
+        Patient,
+        DocumentType.name,
+        medications,
+        allergies,
+        surgeries,
+        illnesses
+    ).outerjoin(
+        DocumentType, DocumentType.id == Patient.document_type_id
+    ).where(*criteria)
+
+
+# Allergy severities included in the critical tier
+CRITICAL_ALLERGY_SEVERITIES = ("severa", "critica")
+
+
+def _critical_row_filters():
+    """Per-table filters selecting the medical rows shown in the critical tier"""
+    return {
+        PatientMedication: [PatientMedication.is_active == True],
+        PatientAllergy: [PatientAllergy.severity_level.in_(CRITICAL_ALLERGY_SEVERITIES)],
+        PatientIllness: [PatientIllness.is_chronic == True],
+    }
+
+
+def critical_subset(record: EmergencyRecord) -> EmergencyRecord:
+    """
+    Narrow a full emergency record to the critical-tier rows
+
+    Python counterpart of _critical_row_filters, for writers that already
+    hold the full record (medications are already limited to active ones).
+    """
+    return EmergencyRecord(
+        patient=record.patient,
+        document_type_name=record.document_type_name,
+        medications=[row for row in record.medications if row["is_active"]],
+        allergies=[row for row in record.allergies if row["severity_level"] in CRITICAL_ALLERGY_SEVERITIES],
+        illnesses=[row for row in record.illnesses if row["is_chronic"]]
+    )
+
+
+def build_critical_record_query(*criteria):
+    """
+    Statement selecting only the critical-tier columns in one round trip
+
+    The patient is loaded with load_only (every other column stays deferred
+    and must not be accessed), active medications, severe/critical
+    allergies and chronic illnesses are aggregated as JSON, and surgeries are
+    not read at all.
+
+    Args:
+        criteria: Filter criteria on Patient (e.g. Patient.qr_code == qr_code)
+    """
+    filters = _critical_row_filters()
+    medications = _json_rows(
+        [
+            PatientMedication.medication_name,
+            PatientMedication.dosage,
+            PatientMedication.frequency,
+            PatientMedication.is_active,
+            PatientMedication.notes,
+            PatientMedication.prescribed_by,
+        ],
+        where=[PatientMedication.patient_id == Patient.id, *filters[PatientMedication]],
+        order_by=[PatientMedication.created_at.desc()]
+    )
+    allergies = _json_rows(
+        [
+            PatientAllergy.allergen,
+            PatientAllergy.severity_level,
+            PatientAllergy.reaction_description,
+            PatientAllergy.notes,
+        ],
+        where=[PatientAllergy.patient_id == Patient.id, *filters[PatientAllergy]],
+        order_by=[PatientAllergy.severity_level.desc()]
+    )
+    illnesses = _json_rows(
+        [
+            PatientIllness.illness_name,
+            PatientIllness.diagnosis_date,
+            PatientIllness.status,
+            PatientIllness.is_chronic,
+            PatientIllness.treatment_description,
+            PatientIllness.cie10_code,
+        ],
+        where=[PatientIllness.patient_id == Patient.id, *filters[PatientIllness]],
+        order_by=[PatientIllness.diagnosis_date.desc()]
+    )
+
+    return select(
+        Patient,
+        medications,
+        allergies,
+        illnesses
+    ).options(
+        load_only(
+            Patient.id,
+            Patient.qr_code,
+            Patient.first_name,
+            Patient.last_name,
+            Patient.birth_date,
+            Patient.biological_sex,
+            Patient.blood_type,
+            Patient.is_pregnant,
+            Patient.pregnancy_weeks,
+            Patient.emergency_contact_name,
+            Patient.emergency_contact_relationship,
+            Patient.emergency_contact_phone,
+            Patient.emergency_contact_phone_alt,
+        )
+    ).where(*criteria)
+
+
+def emergency_record_from_row(row) -> Optional[EmergencyRecord]:
+    """Map a build_emergency_record_query row to an EmergencyRecord"""
+    if not row:
+        return None
+
+    patient, document_type_name, medication_rows, allergy_rows, surgery_rows, illness_rows = row
+    return EmergencyRecord(
+        patient=patient,
+        document_type_name=document_type_name,
+        medications=medication_rows,
+        allergies=allergy_rows,
+        surgeries=surgery_rows,
+        illnesses=illness_rows
+    )
 
 
 class EmergencyDataRepository:
-    """Repository for fetching emergency patient data"""
+    """Repository for fetching emergency patient data (AsyncSession / asyncpg)"""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession, qr_resolver: QRCodeResolverPort):
         self.db = db
+        self.qr_resolver = qr_resolver
 
-    def get_patient_by_qr_code(self, qr_code: UUID) -> Optional[Patient]:
+    async def get_patient_by_qr_code(self, qr_code: UUID) -> Optional[Patient]:
         """
         Get patient by QR code
 
@@ -29,13 +245,159 @@ class EmergencyDataRepository:
         Returns:
             Patient object or None if not found
         """
-        return self.db.query(Patient).filter(
-            Patient.qr_code == qr_code
-        ).options(
-            joinedload(Patient.document_type)
-        ).first()
+        if not await self.qr_resolver.might_exist(qr_code):
+            return None
+
+        result = await self.db.execute(
+            select(Patient).where(
+                Patient.qr_code == qr_code
+            ).options(
+                joinedload(Patient.document_type)
+            )
+        )
+        patient = result.scalars().first()
+        self._remember_resolution(qr_code, patient)
+        return patient
 
-    def get_patient_medications(self, patient_id: UUID) -> List[PatientMedication]:
+    async def get_emergency_record_by_qr_code(self, qr_code: UUID) -> Optional[EmergencyRecord]:
+        """
+        Get patient, document type and medical history by QR code in one statement
+
+        Args:
+            qr_code: Patient's unique QR code UUID
+
+        Returns:
+            EmergencyRecord or None if not found
+        """
+        if not await self.qr_resolver.might_exist(qr_code):
+            return None
+
+        result = await self.db.execute(
+            build_emergency_record_query(Patient.qr_code == qr_code)
+        )
+        record = emergency_record_from_row(result.first())
+        self._remember_resolution(qr_code, record.patient if record else None)
+        return record
+
+    async def get_critical_record_by_qr_code(self, qr_code: UUID) -> Optional[EmergencyRecord]:
+        """
+        Get the critical-tier subset of a patient's emergency data by QR code
+
+        Args:
+            qr_code: Patient's unique QR code UUID
+
+        Returns:
+            EmergencyRecord with a partially loaded patient and no surgeries, or None if not found
+        """
+        if not await self.qr_resolver.might_exist(qr_code):
+            return None
+
+        result = await self.db.execute(
+            build_critical_record_query(Patient.qr_code == qr_code)
+        )
+        row = result.first()
+        if not row:
+            self._remember_resolution(qr_code, None)
+            return None
+
+        patient, medication_rows, allergy_rows, illness_rows = row
+        self._remember_resolution(qr_code, patient)
+        return EmergencyRecord(
+            patient=patient,
+            document_type_name=None,
+            medications=medication_rows,
+            allergies=allergy_rows,
+            illnesses=illness_rows
+        )
+
+    async def get_emergency_records_by_qr_codes(
+        self,
+        qr_codes: Sequence[UUID]
+    ) -> Dict[UUID, EmergencyRecord]:
+        """
+        Get emergency records for several QR codes in one statement
+
+        Patients are selected with qr_code IN (...) and each medical table is
+        aggregated per patient, so the cost is one round trip regardless of
+        how many codes are scanned. Codes the QR resolver knows to be unknown
+        are not sent to the database.
+
+        Args:
+            qr_codes: Patients' QR code UUIDs
+
+        Returns:
+            Dict of qr_code -> EmergencyRecord (codes not found are absent)
+        """
+        candidates = [qr_code for qr_code in dict.fromkeys(qr_codes) if await self.qr_resolver.might_exist(qr_code)]
+        if not candidates:
+            return {}
+
+        result = await self.db.execute(
+            build_emergency_record_query(Patient.qr_code.in_(candidates))
+        )
+        records = {}
+        for row in result.all():
+            record = emergency_record_from_row(row)
+            records[record.patient.qr_code] = record
+
+        for qr_code in candidates:
+            record = records.get(qr_code)
+            self._remember_resolution(qr_code, record.patient if record else None)
+
+        return records
+
+    async def get_snapshot_digests(self, qr_code: UUID) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        Get the payload digests of a patient's materialized snapshot
+
+        One indexed read of a single row. The digests are written in the same
+        transaction as the data they hash (under the patient row lock), so
+        unlike timestamps they change exactly when a committed payload does.
+
+        Args:
+            qr_code: Patient's unique QR code UUID
+
+        Returns:
+            (full payload digest, critical payload digest or None), or None if no snapshot exists
+        """
+        if not await self.qr_resolver.might_exist(qr_code):
+            return None
+
+        result = await self.db.execute(
+            select(
+                PatientEmergencySnapshot.patient_id,
+                PatientEmergencySnapshot.payload_digest,
+                PatientEmergencySnapshot.critical_digest
+            ).where(PatientEmergencySnapshot.qr_code == qr_code)
+        )
+        row = result.first()
+        if not row:
+            return None
+
+        self.qr_resolver.remember(qr_code, row.patient_id)
+        return row.payload_digest, row.critical_digest
+
+    async def get_snapshot_payload_by_qr_code(self, qr_code: UUID) -> Optional[bytes]:
+        """
+        Get the materialized emergency payload by QR code
+
+        Args:
+            qr_code: Patient's unique QR code UUID
+
+        Returns:
+            Serialized EmergencyDataResponseDTO, or None if no snapshot exists
+        """
+        if not await self.qr_resolver.might_exist(qr_code):
+            return None
+
+        result = await self.db.execute(
+            select(PatientEmergencySnapshot.payload).where(
+                PatientEmergencySnapshot.qr_code == qr_code
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def get_patient_medications(self, patient_id: UUID) -> List[PatientMedication]:
         """
         Get all active medications for a patient
 
@@ -45,12 +407,15 @@ class EmergencyDataRepository:
         Returns:
             List of active medications
         """
-        return self.db.query(PatientMedication).filter(
-            PatientMedication.patient_id == patient_id,
-            PatientMedication.is_active == True
-        ).order_by(PatientMedication.created_at.desc()).all()
+        result = await self.db.execute(
+            select(PatientMedication).where(
+                PatientMedication.patient_id == patient_id,
+                PatientMedication.is_active == True
+            ).order_by(PatientMedication.created_at.desc())
+        )
+        return list(result.scalars().all())
 
-    def get_patient_allergies(self, patient_id: UUID) -> List[PatientAllergy]:
+    async def get_patient_allergies(self, patient_id: UUID) -> List[PatientAllergy]:
         """
         Get all allergies for a patient
 
@@ -60,11 +425,14 @@ class EmergencyDataRepository:
         Returns:
             List of allergies
         """
-        return self.db.query(PatientAllergy).filter(
-            PatientAllergy.patient_id == patient_id
-        ).order_by(PatientAllergy.severity_level.desc()).all()
+        result = await self.db.execute(
+            select(PatientAllergy).where(
+                PatientAllergy.patient_id == patient_id
+            ).order_by(PatientAllergy.severity_level.desc())
+        )
+        return list(result.scalars().all())
 
-    def get_patient_surgeries(self, patient_id: UUID) -> List[PatientSurgery]:
+    async def get_patient_surgeries(self, patient_id: UUID) -> List[PatientSurgery]:
         """
         Get all surgeries for a patient
 
@@ -74,11 +442,14 @@ class EmergencyDataRepository:
         Returns:
             List of surgeries ordered by date (most recent first)
         """
-        return self.db.query(PatientSurgery).filter(
-            PatientSurgery.patient_id == patient_id
-        ).order_by(PatientSurgery.surgery_date.desc()).all()
+        result = await self.db.execute(
+            select(PatientSurgery).where(
+                PatientSurgery.patient_id == patient_id
+            ).order_by(PatientSurgery.surgery_date.desc())
+        )
+        return list(result.scalars().all())
 
-    def get_patient_illnesses(self, patient_id: UUID) -> List[PatientIllness]:
+    async def get_patient_illnesses(self, patient_id: UUID) -> List[PatientIllness]:
         """
         Get all active/chronic illnesses for a patient
 
@@ -88,9 +459,19 @@ class EmergencyDataRepository:
         Returns:
             List of illnesses (chronic conditions first)
         """
-        return self.db.query(PatientIllness).filter(
-            PatientIllness.patient_id == patient_id
-        ).order_by(
-            PatientIllness.is_chronic.desc(),
-            PatientIllness.diagnosis_date.desc()
-        ).all()
+        result = await self.db.execute(
+            select(PatientIllness).where(
+                PatientIllness.patient_id == patient_id
+            ).order_by(
+                PatientIllness.is_chronic.desc(),
+                PatientIllness.diagnosis_date.desc()
+            )
+        )
+        return list(result.scalars().all())
+
+    def _remember_resolution(self, qr_code: UUID, patient: Optional[Patient]) -> None:
+        """Feed a database lookup result back into the QR resolver caches"""
+        if patient is None:
+            self.qr_resolver.remember_missing(qr_code)
+        else:
+            self.qr_resolver.remember(qr_code, patient.id)
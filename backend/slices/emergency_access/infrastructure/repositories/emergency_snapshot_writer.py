@@ -0,0 +1,181 @@
+"""
+Emergency snapshot writer
+
+Rebuilds patient_emergency_snapshots rows from the same single-statement
+emergency record query used by the read path. rebuild_emergency_snapshot is
+registered in main.py as a listener of the patient data change notifier, which
+writers of emergency data (medications, allergies, surgeries, illnesses and
+profile updates) call before committing, so the snapshot changes in the same
+transaction as the data it is built from. Each row also stores digests of the
+full and critical payloads, from which the emergency ETags are derived.
+
+Usage:
+    # Composition root (main.py)
+    configure_patient_data_change_notifier([rebuild_emergency_snapshot, ...])
+
+    # Backfill every patient (from backend/)
+    poetry run python -m slices.emergency_access.infrastructure.repositories.emergency_snapshot_writer
+"""
+import time
+from typing import Iterable, List
+from uuid import UUID
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from shared.database import SessionLocal
+from slices.emergency_access.domain.models.emergency_record import EmergencyRecord
+from slices.emergency_access.domain.models.emergency_snapshot_model import PatientEmergencySnapshot
+from slices.emergency_access.infrastructure.repositories.emergency_data_repository import (
+    build_emergency_record_query,
+    critical_subset,
+    emergency_record_from_row,
+)
+from slices.emergency_access.infrastructure.services.emergency_response_builder import (
+    build_critical_response,
+    build_emergency_response,
+    payload_digest,
+    serialize_emergency_response,
+)
+from slices.signup.domain.models.patient_model import Patient
+
+
+def rebuild_emergency_snapshot(db: Session, patient_id: UUID) -> None:
+    """
+    Rebuild one patient's emergency snapshot in the caller's transaction
+
+    The caller must already hold the patient row lock (the patient data change
+    notifier takes it) so concurrent writers for the same patient rebuild one
+    after the other.
+    Pending changes are flushed first so the snapshot reflects them. The
+    caller commits (or rolls back) together with its own writes.
+
+    Args:
+        db: Session holding the writer's transaction
+        patient_id: Patient whose emergency data changed
+    """
+    db.flush()
+
+    record = emergency_record_from_row(
+        db.execute(build_emergency_record_query(Patient.id == patient_id)).first()
+    )
+
+    if record is None:
+        db.execute(
+            delete(PatientEmergencySnapshot).where(PatientEmergencySnapshot.patient_id == patient_id)
+        )
+        return
+
+    _upsert_snapshots(db, [record])
+
+
+def rebuild_patient_emergency_snapshots(db: Session, patient_ids: Iterable[UUID]) -> int:
+    """
+    Rebuild snapshots for several patients with one read and one upsert
+
+    Args:
+        db: Session holding the transaction (caller commits)
+        patient_ids: Patients to rebuild
+
+    Returns:
+        Number of snapshots written
+    """
+    patient_ids = list(patient_ids)
+    if not patient_ids:
+        return 0
+
+    rows = db.execute(build_emergency_record_query(Patient.id.in_(patient_ids))).all()
+    records = [emergency_record_from_row(row) for row in rows]
+    _upsert_snapshots(db, records)
+    return len(records)
+
+
+def rebuild_all_emergency_snapshots(batch_size: int = 500, verbose: bool = True) -> int:
+    """
+    Backfill snapshots for every patient, committing per batch
+
+    Args:
+        batch_size: Patients per read/upsert batch
+        verbose: Print progress per batch
+
+    Returns:
+        Number of snapshots written
+    """
+    db = SessionLocal()
+    total = 0
+    last_id = None
+
+    try:
+        while True:
+            query = select(Patient.id).order_by(Patient.id).limit(batch_size)
+            if last_id is not None:
+                query = query.where(Patient.id > last_id)
+
+            patient_ids = db.execute(query).scalars().all()
+            if not patient_ids:
+                break
+
+            started = time.perf_counter()
+            written = rebuild_patient_emergency_snapshots(db, patient_ids)
+            db.commit()
+            db.expunge_all()
+
+            total += written
+            last_id = patient_ids[-1]
+
+            if verbose:
+                elapsed_ms = round((time.perf_counter() - started) * 1000, 2)
+                print(f"🩺 EMERGENCY SNAPSHOTS - Rebuilt {written} snapshots in {elapsed_ms} ms (total {total})")
+
+            if len(patient_ids) < batch_size:
+                break
+    finally:
+        db.close()
+
+    return total
+
+
+def _upsert_snapshots(db: Session, records: List[EmergencyRecord]) -> None:
+    """Insert or replace serialized snapshots (and their payload digests) for the given records"""
+    if not records:
+        return
+
+    statement = insert(PatientEmergencySnapshot).values([_snapshot_row(record) for record in records])
+    db.execute(
+        statement.on_conflict_do_update(
+            index_elements=[PatientEmergencySnapshot.patient_id],
+            set_={
+                "qr_code": statement.excluded.qr_code,
+                "payload": statement.excluded.payload,
+                "payload_digest": statement.excluded.payload_digest,
+                "critical_digest": statement.excluded.critical_digest,
+                "updated_at": func.now(),
+            }
+        )
+    )
+
+
+def _snapshot_row(record: EmergencyRecord) -> dict:
+    """Snapshot column values for one record"""
+    payload = serialize_emergency_response(build_emergency_response(record))
+    critical_payload = serialize_emergency_response(build_critical_response(critical_subset(record)))
+    return {
+        "patient_id": record.patient.id,
+        "qr_code": record.patient.qr_code,
+        "payload": payload,
+        "payload_digest": payload_digest(payload),
+        "critical_digest": payload_digest(critical_payload),
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Rebuild materialized emergency snapshots for all patients')
+    parser.add_argument('--batch-size', type=int, default=500, help='Patients per batch')
+
+    args = parser.parse_args()
+
+    count = rebuild_all_emergency_snapshots(batch_size=args.batch_size)
+    print(f"✅ EMERGENCY SNAPSHOTS - Rebuilt {count} snapshots")
@@ -0,0 +1,3 @@
+"""
+Services for emergency access infrastructure layer
+"""
@@ -0,0 +1,122 @@
+"""
+In-process cache of critical-tier emergency payloads
+
+Holds the serialized critical payload (blood type, critical allergies, active
+medications, chronic illnesses, emergency contact) per QR code together with
+the ETag it was built for. A request first reads the current ETag from the
+critical digest stored with the patient's snapshot, so a cached payload is
+served only while the patient's critical data is unchanged; a stale entry is
+simply rebuilt and replaced.
+
+Usage:
+    from slices.emergency_access.infrastructure.services.critical_payload_cache import get_critical_payload_cache
+
+    cache = get_critical_payload_cache()
+    payload = cache.get(qr_code, etag)
+"""
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+
+from shared.config.settings import settings
+
+
+class CriticalPayloadCache:
+    """Bounded LRU of qr_code -> (etag, critical payload bytes)"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+
+        self._entries: "OrderedDict[UUID, Tuple[str, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._stale = 0
+        self._evictions = 0
+
+    def get(self, qr_code: UUID, etag: str) -> Optional[bytes]:
+        """
+        Get the cached payload if it was built for the current ETag
+
+        Args:
+            qr_code: Patient's QR code UUID
+            etag: Current ETag of the critical payload
+
+        Returns:
+            Serialized payload, or None on a miss or stale entry
+        """
+        with self._lock:
+            entry = self._entries.get(qr_code)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            if entry[0] != etag:
+                del self._entries[qr_code]
+                self._stale += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(qr_code)
+            self._hits += 1
+            return entry[1]
+
+    def put(self, qr_code: UUID, etag: str, payload: bytes) -> None:
+        """Cache a payload built for the given ETag"""
+        if self.max_entries <= 0:
+            return
+
+        with self._lock:
+            self._entries[qr_code] = (etag, payload)
+            self._entries.move_to_end(qr_code)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Drop every cached entry"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters and current size for this worker"""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "stale": self._stale,
+                "evictions": self._evictions
+            }
+
+
+# Global instance storage
+_critical_payload_cache_instance: Optional[CriticalPayloadCache] = None
+
+
+def get_critical_payload_cache() -> CriticalPayloadCache:
+    """
+    Get or create the per-process critical payload cache
+
+    Returns:
+        CriticalPayloadCache: The singleton cache instance
+    """
+    global _critical_payload_cache_instance
+
+    if _critical_payload_cache_instance is None:
+        _critical_payload_cache_instance = CriticalPayloadCache(
+            max_entries=settings.EMERGENCY_CRITICAL_CACHE_SIZE
+        )
+
+    return _critical_payload_cache_instance
+
+
+def reset_critical_payload_cache() -> None:
+    """
+    Reset the singleton instance (useful for testing)
+    """
+    global _critical_payload_cache_instance
+    _critical_payload_cache_instance = None
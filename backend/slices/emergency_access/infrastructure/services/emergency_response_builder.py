@@ -0,0 +1,132 @@
+"""
+Emergency response builder
+
+Maps emergency records (patient row with JSON-aggregated medical history, as
+loaded by the emergency data repository) to the response DTOs, and serializes
+them to the JSON bytes stored in snapshots and sent to clients. Shared by the
+read path and the snapshot writer.
+"""
+import hashlib
+
+from pydantic import BaseModel
+
+from slices.emergency_access.application.dto.emergency_data_dto import (
+    EmergencyAllergyDTO,
+    EmergencyCriticalDataResponseDTO,
+    EmergencyDataResponseDTO,
+    EmergencyIllnessDTO,
+    EmergencyMedicationDTO,
+    EmergencySurgeryDTO,
+)
+from slices.emergency_access.domain.models.emergency_record import EmergencyRecord
+
+
+def build_emergency_response(record: EmergencyRecord) -> EmergencyDataResponseDTO:
+    """
+    Build the emergency response from a single-statement emergency record
+
+    Args:
+        record: Patient row with JSON-aggregated medical history
+
+    Returns:
+        EmergencyDataResponseDTO with all patient information
+    """
+    patient = record.patient
+
+    # Build response DTO
+    response_data = {
+        # Basic Information
+        "full_name": patient.full_name,
+        "document_type": record.document_type_name or "",
+        "document_number": patient.document_number,
+        "birth_date": patient.birth_date,
+        "biological_sex": patient.biological_sex,
+        "gender": patient.gender,
+
+        # Personal Information
+        "blood_type": patient.blood_type,
+        "eps": patient.eps,
+        "occupation": patient.occupation,
+        "residence_address": patient.residence_address,
+        "residence_country": patient.residence_country,
+        "residence_city": patient.residence_city,
+
+        # Emergency Contacts
+        "emergency_contact_name": patient.emergency_contact_name,
+        "emergency_contact_relationship": patient.emergency_contact_relationship,
+        "emergency_contact_phone": patient.emergency_contact_phone,
+        "emergency_contact_phone_alt": patient.emergency_contact_phone_alt,
+
+        # Medical Information (JSON rows validate straight into the DTOs)
+        "medications": [EmergencyMedicationDTO.model_validate(row) for row in record.medications],
+        "allergies": [EmergencyAllergyDTO.model_validate(row) for row in record.allergies],
+        "surgeries": [EmergencySurgeryDTO.model_validate(row) for row in record.surgeries],
+        "illnesses": [EmergencyIllnessDTO.model_validate(row) for row in record.illnesses],
+    }
+
+    # Add gynecological information only if biological_sex is 'F'
+    if patient.biological_sex == 'F':
+        response_data.update({
+            "is_pregnant": patient.is_pregnant,
+            "pregnancy_weeks": patient.pregnancy_weeks,
+            "last_menstruation_date": patient.last_menstruation_date,
+            "pregnancies_count": patient.pregnancies_count,
+            "births_count": patient.births_count,
+            "cesareans_count": patient.cesareans_count,
+            "abortions_count": patient.abortions_count,
+            "contraceptive_method": patient.contraceptive_method,
+        })
+
+    return EmergencyDataResponseDTO(**response_data)
+
+
+def build_critical_response(record: EmergencyRecord) -> EmergencyCriticalDataResponseDTO:
+    """
+    Build the critical-tier response from a column-projected emergency record
+
+    Only the columns loaded by build_critical_record_query may be read here.
+
+    Args:
+        record: Partially loaded patient with critical medical rows
+
+    Returns:
+        EmergencyCriticalDataResponseDTO
+    """
+    patient = record.patient
+
+    response_data = {
+        "full_name": patient.full_name,
+        "birth_date": patient.birth_date,
+        "biological_sex": patient.biological_sex,
+        "blood_type": patient.blood_type,
+
+        # Emergency Contacts
+        "emergency_contact_name": patient.emergency_contact_name,
+        "emergency_contact_relationship": patient.emergency_contact_relationship,
+        "emergency_contact_phone": patient.emergency_contact_phone,
+        "emergency_contact_phone_alt": patient.emergency_contact_phone_alt,
+
+        # Critical Medical Information
+        "medications": [EmergencyMedicationDTO.model_validate(row) for row in record.medications],
+        "allergies": [EmergencyAllergyDTO.model_validate(row) for row in record.allergies],
+        "illnesses": [EmergencyIllnessDTO.model_validate(row) for row in record.illnesses],
+    }
+
+    # Pregnancy changes treatment; the rest of the gynecological history is full-tier only
+    if patient.biological_sex == 'F':
+        response_data.update({
+            "is_pregnant": patient.is_pregnant,
+            "pregnancy_weeks": patient.pregnancy_weeks,
+        })
+
+    return EmergencyCriticalDataResponseDTO(**response_data)
+
+
+def serialize_emergency_response(response: BaseModel) -> bytes:
+    """Serialize an emergency response to the JSON bytes stored in snapshots and sent to clients"""
+    return response.model_dump_json().encode("utf-8")
+
+
+def payload_digest(payload: bytes) -> str:
+    """SHA-256 hex digest of a serialized payload (stored with snapshots, source of the ETags)"""
+    return hashlib.sha256(payload).hexdigest()
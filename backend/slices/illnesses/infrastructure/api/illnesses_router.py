@@ -6,9 +6,11 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from shared.database.database import get_db
-from slices.auth.infrastructure.api.auth_endpoints import get_current_user
+from slices.auth.domain.entities.authenticated_identity import AuthenticatedIdentity
+from slices.auth.infrastructure.api.auth_endpoints import get_current_user, get_current_identity
 from slices.signup.domain.models.user_model import User
 from slices.signup.domain.models.patient_model import Patient
+from slices.signup.infrastructure.persistence.patient_data_change_notifier import get_patient_data_change_notifier
 
 from slices.illnesses.application.use_cases.manage_illnesses import ManageIllnessesUseCase
 from slices.illnesses.infrastructure.repositories.illness_repository import IllnessRepository
@@ -23,13 +25,13 @@ router = APIRouter(prefix="/api/illnesses", tags=["Illnesses"])
 
 def get_illness_use_case(db: Session = Depends(get_db)) -> ManageIllnessesUseCase:
     """Dependency to get illness use case"""
-    illness_repository = IllnessRepository(db)
+    illness_repository = IllnessRepository(db, get_patient_data_change_notifier())
     return ManageIllnessesUseCase(illness_repository)
 
 
-async def get_patient_from_user(user: User, db: Session) -> Patient:
-    """Get patient record from authenticated user"""
-    patient = db.query(Patient).filter(Patient.user_id == user.id).first()
+async def get_patient_from_user(identity: AuthenticatedIdentity) -> Patient:
+    """Get patient record from the identity resolved for this request"""
+    patient = await identity.get_patient()
     if not patient:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -42,7 +44,7 @@ async def get_patient_from_user(user: User, db: Session) -> Patient:
 async def get_illnesses(
     current_user: User = Depends(get_current_user),
     illness_use_case: ManageIllnessesUseCase = Depends(get_illness_use_case),
-    db: Session = Depends(get_db)
+    identity: AuthenticatedIdentity = Depends(get_current_identity)
 ):
     """Get all illnesses for authenticated patient"""
     if current_user.user_type != "patient":
@@ -51,7 +53,7 @@ async def get_illnesses(
             detail="Only patients can access illness data"
         )
 
-    patient = await get_patient_from_user(current_user, db)
+    patient = await get_patient_from_user(identity)
     return await illness_use_case.get_patient_illnesses(patient.id)
 
 
@@ -60,7 +62,7 @@ async def get_illness(
     illness_id: int,
     current_user: User = Depends(get_current_user),
     illness_use_case: ManageIllnessesUseCase = Depends(get_illness_use_case),
-    db: Session = Depends(get_db)
+    identity: AuthenticatedIdentity = Depends(get_current_identity)
 ):
     """Get a specific illness by ID"""
     if current_user.user_type != "patient":
@@ -69,7 +71,7 @@ async def get_illness(
             detail="Only patients can access illness data"
         )
 
-    patient = await get_patient_from_user(current_user, db)
+    patient = await get_patient_from_user(identity)
     illness = await illness_use_case.get_illness_by_id(illness_id, patient.id)
 
     if not illness:
@@ -86,7 +88,7 @@ async def create_illness(
     illness_data: CreateIllnessDTO,
     current_user: User = Depends(get_current_user),
     illness_use_case: ManageIllnessesUseCase = Depends(get_illness_use_case),
-    db: Session = Depends(get_db)
+    identity: AuthenticatedIdentity = Depends(get_current_identity)
 ):
     """Create a new illness record"""
     if current_user.user_type != "patient":
@@ -95,7 +97,7 @@ async def create_illness(
             detail="Only patients can create illness records"
         )
 
-    patient = await get_patient_from_user(current_user, db)
+    patient = await get_patient_from_user(identity)
     return await illness_use_case.create_illness(illness_data, patient.id)
 
 
@@ -105,7 +107,7 @@ async def update_illness(
     illness_data: UpdateIllnessDTO,
     current_user: User = Depends(get_current_user),
     illness_use_case: ManageIllnessesUseCase = Depends(get_illness_use_case),
-    db: Session = Depends(get_db)
+    identity: AuthenticatedIdentity = Depends(get_current_identity)
 ):
     """Update an existing illness record"""
     if current_user.user_type != "patient":
@@ -114,7 +116,7 @@ async def update_illness(
             detail="Only patients can update illness records"
         )
 
-    patient = await get_patient_from_user(current_user, db)
+    patient = await get_patient_from_user(identity)
     updated_illness = await illness_use_case.update_illness(illness_id, illness_data, patient.id)
 
     if not updated_illness:
@@ -131,7 +133,7 @@ async def delete_illness(
     illness_id: int,
     current_user: User = Depends(get_current_user),
     illness_use_case: ManageIllnessesUseCase = Depends(get_illness_use_case),
-    db: Session = Depends(get_db)
+    identity: AuthenticatedIdentity = Depends(get_current_identity)
 ):
     """Delete an illness record"""
     if current_user.user_type != "patient":
@@ -140,7 +142,7 @@ async def delete_illness(
             detail="Only patients can delete illness records"
         )
 
-    patient = await get_patient_from_user(current_user, db)
+    patient = await get_patient_from_user(identity)
     success = await illness_use_case.delete_illness(illness_id, patient.id)
 
     if not success:
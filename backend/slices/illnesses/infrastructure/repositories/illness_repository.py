@@ -9,13 +9,15 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from slices.illnesses.application.ports.illness_repository import IllnessRepositoryPort
 from slices.illnesses.domain.models.illness_model import PatientIllness
+from slices.signup.application.ports.patient_data_change_port import PatientDataChangePort
 
 
 class IllnessRepository(IllnessRepositoryPort):
     """SQLAlchemy implementation of illness repository"""
 
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Session, patient_data_changes: PatientDataChangePort):
         self.db = db_session
+        self.patient_data_changes = patient_data_changes
 
     async def get_illnesses_by_patient_id(self, patient_id: UUID) -> List[PatientIllness]:
         """Get all illnesses for a specific patient"""
@@ -42,6 +44,7 @@ class IllnessRepository(IllnessRepositoryPort):
         """Create a new illness record"""
         try:
             self.db.add(illness)
+            self.patient_data_changes.patient_data_changed(self.db, illness.patient_id)
             self.db.commit()
             self.db.refresh(illness)
             return illness
@@ -66,6 +69,7 @@ class IllnessRepository(IllnessRepositoryPort):
                 if hasattr(illness, key):
                     setattr(illness, key, value)
 
+            self.patient_data_changes.patient_data_changed(self.db, patient_id)
             self.db.commit()
             self.db.refresh(illness)
             return illness
@@ -87,6 +91,7 @@ class IllnessRepository(IllnessRepositoryPort):
                 return False
 
             self.db.delete(illness)
+            self.patient_data_changes.patient_data_changed(self.db, patient_id)
             self.db.commit()
             return True
         except SQLAlchemyError as e:
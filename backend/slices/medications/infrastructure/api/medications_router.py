@@ -9,9 +9,11 @@ from sqlalchemy.orm import Session
 from pydantic import ValidationError
 
 from shared.database.database import get_db
-from slices.auth.infrastructure.api.auth_endpoints import get_current_user
+from slices.auth.domain.entities.authenticated_identity import AuthenticatedIdentity
+from slices.auth.infrastructure.api.auth_endpoints import get_current_user, get_current_identity
 from slices.signup.domain.models.user_model import User
 from slices.signup.domain.models.patient_model import Patient
+from slices.signup.infrastructure.persistence.patient_data_change_notifier import get_patient_data_change_notifier
 
 from slices.medications.application.use_cases.manage_medications import ManageMedicationsUseCase
 from slices.medications.infrastructure.repositories.medication_repository import MedicationRepository
@@ -29,13 +31,13 @@ router = APIRouter(prefix="/api/medications", tags=["Medications"])
 
 def get_medications_use_case(db: Session = Depends(get_db)) -> ManageMedicationsUseCase:
     """Dependency to get medications use case"""
-    medication_repository = MedicationRepository(db)
+    medication_repository = MedicationRepository(db, get_patient_data_change_notifier())
     return ManageMedicationsUseCase(medication_repository)
 
 
-async def get_patient_from_user(user: User, db: Session) -> Patient:
-    """Get patient record from authenticated user"""
-    patient = db.query(Patient).filter(Patient.user_id == user.id).first()
+async def get_patient_from_user(identity: AuthenticatedIdentity) -> Patient:
+    """Get patient record from the identity resolved for this request"""
+    patient = await identity.get_patient()
     if not patient:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -48,7 +50,7 @@ async def get_patient_from_user(user: User, db: Session) -> Patient:
 async def get_medications(
     current_user: User = Depends(get_current_user),
     medications_use_case: ManageMedicationsUseCase = Depends(get_medications_use_case),
-    db: Session = Depends(get_db)
+    identity: AuthenticatedIdentity = Depends(get_current_identity)
 ):
     """Get all medications for authenticated patient"""
     # Ensure user is a patient
@@ -58,7 +60,7 @@ async def get_medications(
             detail="Only patients can access medication data"
         )
 
-    patient = await get_patient_from_user(current_user, db)
+    patient = await get_patient_from_user(identity)
     return await medications_use_case.get_medications(patient.id)
 
 
@@ -67,7 +69,7 @@ async def create_medication(
     medication_data: CreateMedicationDTO,
     current_user: User = Depends(get_current_user),
     medications_use_case: ManageMedicationsUseCase = Depends(get_medications_use_case),
-    db: Session = Depends(get_db)
+    identity: AuthenticatedIdentity = Depends(get_current_identity)
 ):
     """Create new medication record"""
     # Ensure user is a patient
@@ -77,7 +79,7 @@ async def create_medication(
             detail="Only patients can create medication records"
         )
 
-    patient = await get_patient_from_user(current_user, db)
+    patient = await get_patient_from_user(identity)
     return await medications_use_case.create_medication(
         medication_data,
         patient.id,
@@ -91,7 +93,7 @@ async def update_medication(
     request: Request,
     current_user: User = Depends(get_current_user),
     medications_use_case: ManageMedicationsUseCase = Depends(get_medications_use_case),
-    db: Session = Depends(get_db)
+    identity: AuthenticatedIdentity = Depends(get_current_identity)
 ):
     """Update medication record with detailed validation logging"""
     # Ensure user is a patient
@@ -146,7 +148,7 @@ async def update_medication(
             detail="Internal server error during validation"
         )
 
-    patient = await get_patient_from_user(current_user, db)
+    patient = await get_patient_from_user(identity)
 
     try:
         updated = await medications_use_case.update_medication(
@@ -177,7 +179,7 @@ async def delete_medication(
     medication_id: int,
     current_user: User = Depends(get_current_user),
     medications_use_case: ManageMedicationsUseCase = Depends(get_medications_use_case),
-    db: Session = Depends(get_db)
+    identity: AuthenticatedIdentity = Depends(get_current_identity)
 ):
     """Delete medication record"""
     # Ensure user is a patient
@@ -187,7 +189,7 @@ async def delete_medication(
             detail="Only patients can delete medication records"
         )
 
-    patient = await get_patient_from_user(current_user, db)
+    patient = await get_patient_from_user(identity)
     success = await medications_use_case.delete_medication(
         medication_id,
         patient.id,
@@ -206,7 +208,7 @@ async def get_medication_by_id(
     medication_id: int,
     current_user: User = Depends(get_current_user),
     medications_use_case: ManageMedicationsUseCase = Depends(get_medications_use_case),
-    db: Session = Depends(get_db)
+    identity: AuthenticatedIdentity = Depends(get_current_identity)
 ):
     """Get specific medication by ID"""
     # Ensure user is a patient
@@ -216,7 +218,7 @@ async def get_medication_by_id(
             detail="Only patients can access medication data"
         )
 
-    patient = await get_patient_from_user(current_user, db)
+    patient = await get_patient_from_user(identity)
     medication = await medications_use_case.get_medication_by_id(medication_id, patient.id)
     if not medication:
         raise HTTPException(
@@ -232,7 +234,7 @@ async def toggle_medication_status(
     is_active: bool,
     current_user: User = Depends(get_current_user),
     medications_use_case: ManageMedicationsUseCase = Depends(get_medications_use_case),
-    db: Session = Depends(get_db)
+    identity: AuthenticatedIdentity = Depends(get_current_identity)
 ):
     """Toggle medication active status"""
     # Ensure user is a patient
@@ -242,7 +244,7 @@ async def toggle_medication_status(
             detail="Only patients can update medication status"
         )
 
-    patient = await get_patient_from_user(current_user, db)
+    patient = await get_patient_from_user(identity)
     updated = await medications_use_case.toggle_medication_status(
         medication_id,
         is_active,
@@ -9,13 +9,15 @@ from sqlalchemy import and_
 
 from slices.medications.application.ports.medication_repository import MedicationRepositoryPort
 from slices.medications.domain.models.medication_model import PatientMedication
+from slices.signup.application.ports.patient_data_change_port import PatientDataChangePort
 
 
 class MedicationRepository(MedicationRepositoryPort):
     """SQLAlchemy implementation of medication repository"""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, patient_data_changes: PatientDataChangePort):
         self.db = db
+        self.patient_data_changes = patient_data_changes
 
     async def get_medications(self, patient_id: UUID) -> List[PatientMedication]:
         """Get all medications for a patient"""
@@ -26,6 +28,7 @@ class MedicationRepository(MedicationRepositoryPort):
     async def create_medication(self, medication: PatientMedication) -> PatientMedication:
         """Create a new medication record"""
         self.db.add(medication)
+        self.patient_data_changes.patient_data_changed(self.db, medication.patient_id)
         self.db.commit()
         self.db.refresh(medication)
         return medication
@@ -44,6 +47,7 @@ class MedicationRepository(MedicationRepositoryPort):
             if hasattr(medication, field):
                 setattr(medication, field, value)
 
+        self.patient_data_changes.patient_data_changed(self.db, medication.patient_id)
         self.db.commit()
         self.db.refresh(medication)
         return medication
@@ -61,6 +65,7 @@ class MedicationRepository(MedicationRepositoryPort):
             return False
 
         self.db.delete(medication)
+        self.patient_data_changes.patient_data_changed(self.db, patient_id)
         self.db.commit()
         return True
 
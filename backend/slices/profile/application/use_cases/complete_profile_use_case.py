@@ -11,6 +11,7 @@ logger = logging.getLogger(__name__)
 from slices.signup.domain.models.patient_model import Patient
 from slices.signup.domain.models.user_model import User
 from slices.signup.domain.models.document_type_model import DocumentType
+from slices.signup.application.ports.patient_data_change_port import PatientDataChangePort
 # TODO: Add back profile domain models when they are available
 # from slices.profile.domain.models import Medication, Allergy, Disease, Surgery, GynecologicalHistory
 # from slices.profile.domain.models.allergy_model import AllergySeverity
@@ -35,8 +36,9 @@ from slices.profile.application.dto.basic_patient_dto import (
 class CompleteProfileUseCase:
     """Use case for RF002 profile completion functionality"""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, patient_data_changes: PatientDataChangePort):
         self.db = db
+        self.patient_data_changes = patient_data_changes
 
     def get_profile_completeness(self, user_id: str) -> ProfileCompletenessResponse:
         """
@@ -280,6 +282,7 @@ class CompleteProfileUseCase:
                 logger.info(f"✅ Setting preferred_unit_system to: {profile_data.preferred_unit_system}")
                 patient.preferred_unit_system = profile_data.preferred_unit_system
 
+            self.patient_data_changes.patient_data_changed(self.db, patient.id)
             self.db.commit()
 
             # TODO: Check updated completeness once completeness calculation is implemented
@@ -451,6 +454,7 @@ class CompleteProfileUseCase:
                     return {"success": False, "message": "Email already exists"}
                 patient.user.email = update_data.email
 
+            self.patient_data_changes.patient_data_changed(self.db, patient.id)
             self.db.commit()
 
             return {
@@ -8,6 +8,7 @@ from typing import List
 from shared.database import get_db
 from slices.auth.infrastructure.api.auth_endpoints import get_current_user
 from slices.signup.domain.models.user_model import User
+from slices.signup.infrastructure.persistence.patient_data_change_notifier import get_patient_data_change_notifier
 from slices.profile.application.use_cases.complete_profile_use_case import CompleteProfileUseCase
 from slices.profile.application.use_cases.update_language_use_case import UpdateLanguagePreferenceUseCase
 from slices.profile.application.dto.profile_completion_dto import (
@@ -40,7 +41,7 @@ async def get_profile_completeness(
     """
     Get profile completeness status for RF002 validation
     """
-    use_case = CompleteProfileUseCase(db)
+    use_case = CompleteProfileUseCase(db, get_patient_data_change_notifier())
     return use_case.get_profile_completeness(current_user.id)
 
 
@@ -52,7 +53,7 @@ async def get_extended_profile(
     """
     Get extended patient profile data (RF002 fields)
     """
-    use_case = CompleteProfileUseCase(db)
+    use_case = CompleteProfileUseCase(db, get_patient_data_change_notifier())
     profile = use_case.get_extended_profile(current_user.id)
 
     if not profile:
@@ -78,7 +79,7 @@ async def update_extended_profile(
     logger.info(f"🔵 ENDPOINT: Received profile_data with fields: organ_donor_preference={profile_data.organ_donor_preference}, height={profile_data.height}, weight={profile_data.weight}")
     logger.info(f"📦 ENDPOINT: Full profile_data: {profile_data.model_dump()}")
 
-    use_case = CompleteProfileUseCase(db)
+    use_case = CompleteProfileUseCase(db, get_patient_data_change_notifier())
     result = use_case.update_extended_profile(current_user.id, profile_data)
 
     if not result["success"]:
@@ -98,7 +99,7 @@ async def get_basic_patient_info(
     """
     Get basic patient information (from signup)
     """
-    use_case = CompleteProfileUseCase(db)
+    use_case = CompleteProfileUseCase(db, get_patient_data_change_notifier())
     basic_info = use_case.get_basic_patient_info(current_user.id)
 
     if not basic_info:
@@ -119,7 +120,7 @@ async def update_basic_patient_info(
     """
     Update basic patient information
     """
-    use_case = CompleteProfileUseCase(db)
+    use_case = CompleteProfileUseCase(db, get_patient_data_change_notifier())
     result = use_case.update_basic_patient_info(current_user.id, update_data)
 
     if not result["success"]:
@@ -139,7 +140,7 @@ async def get_medications(
     """
     Get patient medications
     """
-    use_case = CompleteProfileUseCase(db)
+    use_case = CompleteProfileUseCase(db, get_patient_data_change_notifier())
     return use_case.get_medications(current_user.id)
 
 
@@ -152,7 +153,7 @@ async def add_medication(
     """
     Add new medication
     """
-    use_case = CompleteProfileUseCase(db)
+    use_case = CompleteProfileUseCase(db, get_patient_data_change_notifier())
     result = use_case.add_medication(current_user.id, medication_data)
 
     if not result["success"]:
@@ -174,7 +175,7 @@ async def update_medication(
     """
     Update existing medication
     """
-    use_case = CompleteProfileUseCase(db)
+    use_case = CompleteProfileUseCase(db, get_patient_data_change_notifier())
     result = use_case.update_medication(current_user.id, medication_id, medication_data)
 
     if not result["success"]:
@@ -195,7 +196,7 @@ async def delete_medication(
     """
     Delete medication
     """
-    use_case = CompleteProfileUseCase(db)
+    use_case = CompleteProfileUseCase(db, get_patient_data_change_notifier())
     result = use_case.delete_medication(current_user.id, medication_id)
 
     if not result["success"]:
@@ -215,7 +216,7 @@ async def get_allergies(
     """
     Get patient allergies
     """
-    use_case = CompleteProfileUseCase(db)
+    use_case = CompleteProfileUseCase(db, get_patient_data_change_notifier())
     return use_case.get_allergies(current_user.id)
 
 
@@ -228,7 +229,7 @@ async def add_allergy(
     """
     Add new allergy
     """
-    use_case = CompleteProfileUseCase(db)
+    use_case = CompleteProfileUseCase(db, get_patient_data_change_notifier())
     result = use_case.add_allergy(current_user.id, allergy_data)
 
     if not result["success"]:
@@ -250,7 +251,7 @@ async def update_allergy(
     """
     Update existing allergy
     """
-    use_case = CompleteProfileUseCase(db)
+    use_case = CompleteProfileUseCase(db, get_patient_data_change_notifier())
     result = use_case.update_allergy(current_user.id, allergy_id, allergy_data)
 
     if not result["success"]:
@@ -271,7 +272,7 @@ async def delete_allergy(
     """
     Delete allergy
     """
-    use_case = CompleteProfileUseCase(db)
+    use_case = CompleteProfileUseCase(db, get_patient_data_change_notifier())
     result = use_case.delete_allergy(current_user.id, allergy_id)
 
     if not result["success"]:
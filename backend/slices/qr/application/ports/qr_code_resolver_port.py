@@ -0,0 +1,36 @@
+"""
+QR code resolver port interface
+Interface for the per-worker QR code existence filter and patient_id cache
+"""
+from abc import ABC, abstractmethod
+from uuid import UUID
+from typing import Optional
+
+
+class QRCodeResolverPort(ABC):
+    """Port interface for resolving QR codes without a database round trip"""
+
+    @abstractmethod
+    async def might_exist(self, qr_code: UUID) -> bool:
+        """Check whether a QR code can belong to a patient (False means certainly unknown)"""
+        pass
+
+    @abstractmethod
+    def get_patient_id(self, qr_code: UUID) -> Optional[UUID]:
+        """Get a cached patient_id for a QR code"""
+        pass
+
+    @abstractmethod
+    def remember(self, qr_code: UUID, patient_id: UUID) -> None:
+        """Cache a QR code resolved by the database"""
+        pass
+
+    @abstractmethod
+    def remember_missing(self, qr_code: UUID) -> None:
+        """Cache a QR code the database did not find"""
+        pass
+
+    @abstractmethod
+    def register(self, qr_code: UUID, patient_id: UUID) -> None:
+        """Add a new or regenerated QR code (called by patient writers after commit)"""
+        pass
@@ -7,7 +7,8 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from shared.database.database import get_db
-from slices.auth.infrastructure.api.auth_endpoints import get_current_user
+from slices.auth.domain.entities.authenticated_identity import AuthenticatedIdentity
+from slices.auth.infrastructure.api.auth_endpoints import get_current_user, get_current_identity
 from slices.signup.domain.models.user_model import User
 from slices.signup.domain.models.patient_model import Patient
 from shared.exceptions.application_exceptions import NotFoundException
@@ -33,9 +34,9 @@ def get_emergency_data_use_case(db: Session = Depends(get_db)) -> GetEmergencyDa
     return GetEmergencyDataUseCase(qr_repository)
 
 
-async def get_patient_from_user(user: User, db: Session) -> Patient:
-    """Get patient record from authenticated user"""
-    patient = db.query(Patient).filter(Patient.user_id == user.id).first()
+async def get_patient_from_user(identity: AuthenticatedIdentity) -> Patient:
+    """Get patient record from the identity resolved for this request"""
+    patient = await identity.get_patient()
     if not patient:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -48,7 +49,7 @@ async def get_patient_from_user(user: User, db: Session) -> Patient:
 async def generate_patient_qr_code(
     current_user: User = Depends(get_current_user),
     generate_qr_use_case: GenerateQRCodeUseCase = Depends(get_generate_qr_use_case),
-    db: Session = Depends(get_db)
+    identity: AuthenticatedIdentity = Depends(get_current_identity)
 ):
     """
     Generate QR code with VitalGo logo for authenticated patient
@@ -62,7 +63,7 @@ async def generate_patient_qr_code(
         )
 
     # Get patient record
-    patient = await get_patient_from_user(current_user, db)
+    patient = await get_patient_from_user(identity)
 
     try:
         # Generate QR code
@@ -123,7 +124,7 @@ async def get_emergency_patient_data(
 @router.get("/data", response_model=dict)
 async def get_patient_qr_data(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    identity: AuthenticatedIdentity = Depends(get_current_identity)
 ):
     """
     Get patient's QR code metadata (without generating image)
@@ -137,7 +138,7 @@ async def get_patient_qr_data(
         )
 
     # Get patient record
-    patient = await get_patient_from_user(current_user, db)
+    patient = await get_patient_from_user(identity)
 
     if not patient.qr_code:
         raise HTTPException(
@@ -2,22 +2,28 @@
 QR API endpoints - Simplified version for patient QR display
 Uses existing patients.qr_code field instead of separate table
 """
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from starlette.concurrency import run_in_threadpool
 
-from shared.database.database import get_db
 from shared.config.settings import settings
-from slices.auth.infrastructure.api.auth_endpoints import get_current_user
+from shared.utils.etag import etag_matches
+from slices.auth.domain.entities.authenticated_identity import AuthenticatedIdentity
+from slices.auth.infrastructure.api.auth_endpoints import get_current_user, get_current_identity
 from slices.signup.domain.models.user_model import User
 from slices.signup.domain.models.patient_model import Patient
 from slices.qr.application.dto import QRResponseDTO
+from slices.qr.infrastructure.services.rendered_qr_cache import DEFAULT_BOX_SIZE, MAX_BOX_SIZE, MIN_BOX_SIZE
 
 router = APIRouter(prefix="/api/qr", tags=["qr"])
 
+# Rendered images only change with the QR code, so clients may keep them but must revalidate
+QR_IMAGE_CACHE_CONTROL = "private, no-cache"
 
-async def get_patient_from_user(user: User, db: Session) -> Patient:
-    """Get patient record from authenticated user"""
-    patient = db.query(Patient).filter(Patient.user_id == user.id).first()
+
+async def get_patient_from_user(identity: AuthenticatedIdentity) -> Patient:
+    """Get patient record from the identity resolved for this request"""
+    patient = await identity.get_patient()
     if not patient:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -26,10 +32,51 @@ async def get_patient_from_user(user: User, db: Session) -> Patient:
     return patient
 
 
+async def get_qr_patient(
+    current_user: User = Depends(get_current_user),
+    identity: AuthenticatedIdentity = Depends(get_current_identity)
+) -> Patient:
+    """Dependency returning the authenticated patient (403 for other user types)"""
+    if current_user.user_type != "patient":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only patients can access QR codes"
+        )
+    return await get_patient_from_user(identity)
+
+
+async def qr_image_response(
+    patient: Patient,
+    image_format: str,
+    box_size: int,
+    if_none_match: Optional[str]
+) -> Response:
+    """Serve a rendered QR image with ETag, answering 304 without rendering"""
+    # qrcode/Pillow are only imported once an image endpoint is used
+    from slices.qr.infrastructure.services.qr_generator_service import QRGeneratorService
+
+    qr_generator = QRGeneratorService()
+    etag = qr_generator.image_etag(patient.qr_code, box_size, image_format)
+    headers = {"ETag": etag, "Cache-Control": QR_IMAGE_CACHE_CONTROL}
+
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    # Rendering is CPU-bound; cache hits return immediately
+    if image_format == "svg":
+        image = await run_in_threadpool(qr_generator.render_svg, patient.qr_code)
+        media_type = "image/svg+xml"
+    else:
+        image = await run_in_threadpool(qr_generator.render_png, patient.qr_code, box_size)
+        media_type = "image/png"
+
+    return Response(content=image, media_type=media_type, headers=headers)
+
+
 @router.get("/", response_model=QRResponseDTO)
 async def get_patient_qr(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    identity: AuthenticatedIdentity = Depends(get_current_identity)
 ):
     """
     Get patient's QR code information
@@ -44,7 +91,7 @@ async def get_patient_qr(
         )
 
     # Get patient record
-    patient = await get_patient_from_user(current_user, db)
+    patient = await get_patient_from_user(identity)
 
     # Every patient already has a qr_code UUID (auto-generated on creation)
     # Build the QR URL using the patient's qr_code field and frontend URL from settings
@@ -56,3 +103,30 @@ async def get_patient_qr(
         created_at=patient.created_at,
         expires_at=None  # No expiration for patient QR codes
     )
+
+
+@router.get("/image.png")
+async def get_patient_qr_png(
+    box_size: int = Query(DEFAULT_BOX_SIZE, ge=MIN_BOX_SIZE, le=MAX_BOX_SIZE, description="Pixels per QR module"),
+    if_none_match: Optional[str] = Header(None),
+    patient: Patient = Depends(get_qr_patient)
+) -> Response:
+    """
+    Get patient's QR code with VitalGo logo as a PNG image
+    Requires authentication - patient only
+    Raw bytes (no base64) with a strong ETag; served from the rendered QR cache
+    """
+    return await qr_image_response(patient, "png", box_size, if_none_match)
+
+
+@router.get("/image.svg")
+async def get_patient_qr_svg(
+    if_none_match: Optional[str] = Header(None),
+    patient: Patient = Depends(get_qr_patient)
+) -> Response:
+    """
+    Get patient's QR code with VitalGo logo as an SVG image
+    Requires authentication - patient only
+    Resolution-independent variant of /image.png
+    """
+    return await qr_image_response(patient, "svg", 0, if_none_match)
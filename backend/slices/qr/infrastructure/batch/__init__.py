@@ -0,0 +1,3 @@
+"""
+QR infrastructure batch jobs
+"""
@@ -0,0 +1,260 @@
+"""
+Bulk QR card generation
+
+Renders the logo-embedded QR PNG of many patients at once (e.g. printable
+cards requested by corporate or EPS partners) without going through
+/api/qr/generate one authenticated request at a time:
+
+1. patients are streamed from the database ordered by id with a server-side
+   cursor (optionally restricted to a list of QR codes)
+2. images are rendered by QRGeneratorService in a multiprocessing pool
+3. the main process writes them either as one PNG per patient, sharded into
+   <output>/<first two hex digits of qr_code>/<qr_code>.png, or tiled into
+   printable sheet images <output>/sheet-00001.png, ...
+
+Progress is printed as it goes and a checkpoint (<output>/checkpoint.json,
+last patient id written) is saved periodically, so an interrupted run resumes
+where it stopped when started again with the same output directory.
+
+Usage (from backend/):
+    poetry run python -m slices.qr.infrastructure.batch.bulk_qr_cards --output ./qr-cards
+    poetry run python -m slices.qr.infrastructure.batch.bulk_qr_cards --output ./qr-sheets --layout sheets --columns 4 --rows 5
+    poetry run python -m slices.qr.infrastructure.batch.bulk_qr_cards --output ./partner --qr-codes-file partner_codes.txt --workers 8
+"""
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+from io import BytesIO
+from multiprocessing import Pool
+from typing import Iterator, List, Optional, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import select
+
+from shared.database import engine
+from slices.signup.domain.models.patient_model import Patient
+
+CHECKPOINT_FILE = "checkpoint.json"
+
+# Per worker process, created by _init_worker
+_worker_generator = None
+
+
+@dataclass
+class BulkQRCheckpoint:
+    """Resumable progress of a bulk run"""
+    last_patient_id: Optional[str] = None
+    rendered: int = 0
+    sheets: int = 0
+
+
+def _init_worker(box_size: int) -> None:
+    """Create one QRGeneratorService per worker process"""
+    global _worker_generator
+    from shared.config.settings import settings
+    from slices.qr.infrastructure.services.qr_generator_service import QRGeneratorService
+    from slices.qr.infrastructure.services.rendered_qr_cache import RenderedQRCache
+
+    # Nothing is reused within a run, so skip the memory tier (the shared disk tier still applies)
+    _worker_generator = (
+        QRGeneratorService(image_cache=RenderedQRCache(max_bytes=0, cache_dir=settings.QR_IMAGE_CACHE_DIR)),
+        box_size
+    )
+
+
+def _render(patient: Tuple[str, str]) -> Tuple[str, str, bytes]:
+    """Render one patient's QR (runs in a worker process)"""
+    patient_id, qr_code = patient
+    generator, box_size = _worker_generator
+    return patient_id, qr_code, generator.render_png(UUID(qr_code), box_size)
+
+
+class BulkQRCardJob:
+    """Streams patients, renders their QR codes in a process pool and writes files or sheets"""
+
+    def __init__(
+        self,
+        output_dir: str,
+        layout: str = "files",
+        workers: Optional[int] = None,
+        box_size: int = 10,
+        columns: int = 4,
+        rows: int = 5,
+        checkpoint_every: int = 500,
+        qr_codes: Optional[Set[UUID]] = None,
+        db_engine=engine
+    ):
+        """
+        Args:
+            output_dir: Directory for images and the checkpoint
+            layout: "files" (one PNG per patient, sharded) or "sheets" (tiled pages)
+            workers: Worker processes (default: CPU count)
+            box_size: Pixels per QR module
+            columns: QR codes per sheet row
+            rows: QR codes per sheet column
+            checkpoint_every: Images between checkpoints (files layout; sheets checkpoint per sheet)
+            qr_codes: Only render these QR codes (None = every patient)
+            db_engine: Sync engine to stream patients from
+        """
+        if layout not in ("files", "sheets"):
+            raise ValueError(f"Unsupported layout: {layout}")
+
+        self.output_dir = output_dir
+        self.layout = layout
+        self.workers = workers or os.cpu_count() or 1
+        self.box_size = box_size
+        self.columns = columns
+        self.rows = rows
+        self.checkpoint_every = checkpoint_every
+        self.qr_codes = qr_codes
+        self.db_engine = db_engine
+
+    def run(self) -> BulkQRCheckpoint:
+        """
+        Render every remaining patient
+
+        Returns:
+            Final checkpoint (totals include previous runs)
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        checkpoint = self._load_checkpoint()
+        if checkpoint.last_patient_id:
+            print(f"↩️ BULK QR - Resuming after patient {checkpoint.last_patient_id} ({checkpoint.rendered} already rendered)")
+
+        started = time.perf_counter()
+        rendered_this_run = 0
+        sheet: List[bytes] = []
+
+        with Pool(self.workers, initializer=_init_worker, initargs=(self.box_size,)) as pool:
+            # imap keeps input order, so the checkpoint always covers a contiguous prefix
+            for patient_id, qr_code, image in pool.imap(_render, self._stream_patients(checkpoint), chunksize=16):
+                rendered_this_run += 1
+                checkpoint.rendered += 1
+
+                if self.layout == "files":
+                    self._write_file(qr_code, image)
+                    checkpoint.last_patient_id = patient_id
+                    if rendered_this_run % self.checkpoint_every == 0:
+                        self._save_checkpoint(checkpoint)
+                else:
+                    sheet.append(image)
+                    if len(sheet) == self.columns * self.rows:
+                        checkpoint.sheets += 1
+                        self._write_sheet(checkpoint.sheets, sheet)
+                        sheet = []
+                        checkpoint.last_patient_id = patient_id
+                        self._save_checkpoint(checkpoint)
+
+                if rendered_this_run % 100 == 0:
+                    self._report(rendered_this_run, checkpoint.rendered, started)
+
+                last_seen_patient_id = patient_id
+
+            # Until it is written, a partial sheet is rendered again on resume
+            if sheet:
+                checkpoint.sheets += 1
+                self._write_sheet(checkpoint.sheets, sheet)
+                checkpoint.last_patient_id = last_seen_patient_id
+
+        self._save_checkpoint(checkpoint)
+        self._report(rendered_this_run, checkpoint.rendered, started)
+        return checkpoint
+
+    def _stream_patients(self, checkpoint: BulkQRCheckpoint) -> Iterator[Tuple[str, str]]:
+        """Yield (patient_id, qr_code) ordered by id through a server-side cursor"""
+        query = select(Patient.id, Patient.qr_code).order_by(Patient.id)
+        if checkpoint.last_patient_id:
+            query = query.where(Patient.id > UUID(checkpoint.last_patient_id))
+        if self.qr_codes is not None:
+            query = query.where(Patient.qr_code.in_(self.qr_codes))
+
+        with self.db_engine.connect() as conn:
+            result = conn.execution_options(stream_results=True, yield_per=1000).execute(query)
+            for patient_id, qr_code in result:
+                yield str(patient_id), str(qr_code)
+
+    def _write_file(self, qr_code: str, image: bytes) -> None:
+        """Write one PNG into its shard directory"""
+        shard_dir = os.path.join(self.output_dir, qr_code[:2])
+        os.makedirs(shard_dir, exist_ok=True)
+        with open(os.path.join(shard_dir, f"{qr_code}.png"), "wb") as image_file:
+            image_file.write(image)
+
+    def _write_sheet(self, number: int, images: List[bytes]) -> None:
+        """Tile QR images (columns x rows, white gutters) into one sheet PNG"""
+        from PIL import Image
+
+        tiles = [Image.open(BytesIO(image)) for image in images]
+        tile_width, tile_height = tiles[0].size
+        gutter = tile_width // 10
+
+        sheet = Image.new(
+            "RGB",
+            (self.columns * (tile_width + gutter) + gutter, self.rows * (tile_height + gutter) + gutter),
+            "white"
+        )
+        for index, tile in enumerate(tiles):
+            row, column = divmod(index, self.columns)
+            sheet.paste(tile, (gutter + column * (tile_width + gutter), gutter + row * (tile_height + gutter)))
+
+        sheet.save(os.path.join(self.output_dir, f"sheet-{number:05d}.png"), format="PNG")
+
+    def _load_checkpoint(self) -> BulkQRCheckpoint:
+        path = os.path.join(self.output_dir, CHECKPOINT_FILE)
+        if not os.path.exists(path):
+            return BulkQRCheckpoint()
+        with open(path) as checkpoint_file:
+            return BulkQRCheckpoint(**json.load(checkpoint_file))
+
+    def _save_checkpoint(self, checkpoint: BulkQRCheckpoint) -> None:
+        """Write the checkpoint atomically"""
+        path = os.path.join(self.output_dir, CHECKPOINT_FILE)
+        with open(path + ".tmp", "w") as checkpoint_file:
+            json.dump(asdict(checkpoint), checkpoint_file)
+        os.replace(path + ".tmp", path)
+
+    def _report(self, rendered_this_run: int, rendered_total: int, started: float) -> None:
+        elapsed = time.perf_counter() - started
+        rate = rendered_this_run / elapsed if elapsed > 0 else 0.0
+        print(f"🖨️ BULK QR - {rendered_total} rendered ({rendered_this_run} this run, {rate:.1f}/s)")
+
+
+def _read_qr_codes(path: str) -> Set[UUID]:
+    """Read one QR code UUID per line (blank lines and # comments ignored)"""
+    with open(path) as codes_file:
+        return {
+            UUID(line.strip()) for line in codes_file
+            if line.strip() and not line.strip().startswith("#")
+        }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Render QR cards for many patients')
+    parser.add_argument('--output', required=True, help='Output directory (also holds the resume checkpoint)')
+    parser.add_argument('--layout', choices=['files', 'sheets'], default='files',
+                        help='One sharded PNG per patient or tiled sheet images')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: CPU count)')
+    parser.add_argument('--box-size', type=int, default=10, help='Pixels per QR module')
+    parser.add_argument('--columns', type=int, default=4, help='QR codes per sheet row')
+    parser.add_argument('--rows', type=int, default=5, help='QR codes per sheet column')
+    parser.add_argument('--checkpoint-every', type=int, default=500, help='Images between checkpoints')
+    parser.add_argument('--qr-codes-file', default=None, help='Only render the QR codes listed in this file')
+
+    args = parser.parse_args()
+
+    job = BulkQRCardJob(
+        output_dir=args.output,
+        layout=args.layout,
+        workers=args.workers,
+        box_size=args.box_size,
+        columns=args.columns,
+        rows=args.rows,
+        checkpoint_every=args.checkpoint_every,
+        qr_codes=_read_qr_codes(args.qr_codes_file) if args.qr_codes_file else None
+    )
+    result = job.run()
+
+    print(f"✅ BULK QR - {result.rendered} QR codes rendered into {args.output} ({result.sheets} sheets)")
@@ -10,13 +10,16 @@ from sqlalchemy.exc import SQLAlchemyError
 from slices.qr.application.ports.qr_repository import QRRepositoryPort
 from slices.qr.domain.models import EmergencyPatientInfo
 from slices.signup.domain.models.patient_model import Patient
+from slices.qr.application.ports.qr_code_resolver_port import QRCodeResolverPort
+from slices.qr.infrastructure.services.qr_code_resolver import get_qr_code_resolver
 
 
 class QRRepository(QRRepositoryPort):
     """SQLAlchemy implementation of QR repository"""
 
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Session, qr_resolver: Optional[QRCodeResolverPort] = None):
         self.db = db_session
+        self.qr_resolver = qr_resolver or get_qr_code_resolver()
 
     async def get_patient_qr_code(self, patient_id: UUID) -> Optional[UUID]:
         """Get patient's QR code UUID"""
@@ -28,12 +31,18 @@ class QRRepository(QRRepositoryPort):
 
     async def get_emergency_patient_info(self, qr_uuid: UUID) -> Optional[EmergencyPatientInfo]:
         """Get emergency patient information by QR code UUID"""
+        if not await self.qr_resolver.might_exist(qr_uuid):
+            return None
+
         try:
             patient = self.db.query(Patient).filter(Patient.qr_code == qr_uuid).first()
 
             if not patient:
+                self.qr_resolver.remember_missing(qr_uuid)
                 return None
 
+            self.qr_resolver.remember(qr_uuid, patient.id)
+
             # Get critical allergies (high severity)
             critical_allergies = []
             try:
@@ -98,8 +107,20 @@ class QRRepository(QRRepositoryPort):
 
     async def get_patient_id_by_qr_code(self, qr_uuid: UUID) -> Optional[UUID]:
         """Get patient ID by QR code UUID"""
+        if not await self.qr_resolver.might_exist(qr_uuid):
+            return None
+
+        cached_patient_id = self.qr_resolver.get_patient_id(qr_uuid)
+        if cached_patient_id is not None:
+            return cached_patient_id
+
         try:
-            patient = self.db.query(Patient).filter(Patient.qr_code == qr_uuid).first()
-            return patient.id if patient else None
+            patient_id = self.db.query(Patient.id).filter(Patient.qr_code == qr_uuid).scalar()
         except SQLAlchemyError:
-            return None
\ No newline at end of file
+            return None
+
+        if patient_id is None:
+            self.qr_resolver.remember_missing(qr_uuid)
+        else:
+            self.qr_resolver.remember(qr_uuid, patient_id)
+        return patient_id
\ No newline at end of file
@@ -0,0 +1,179 @@
+"""
+Process-wide cache of the QR logo assets
+
+The VitalGo logo is located and decoded once per process. For each QR image
+size the resized logo and its circular white background are prepared once,
+so generating a QR code performs no file I/O, resampling or mask drawing.
+
+Usage:
+    from slices.qr.infrastructure.services.logo_asset_cache import get_logo_asset_cache
+
+    overlay = get_logo_asset_cache().get_overlay(qr_img.size)
+    if overlay:
+        qr_img.paste(overlay.background, overlay.background_position, overlay.background)
+"""
+import hashlib
+import os
+import threading
+from dataclasses import dataclass
+from io import BytesIO
+from typing import Dict, List, Optional, Tuple
+
+from PIL import Image, ImageDraw
+
+LOGO_FILE = "frontend/public/assets/images/logos/logos-blue-light-background.png"
+
+# Searched in order (relative to the working directory, then to this file)
+LOGO_PATHS = [
+    os.path.join("..", LOGO_FILE),
+    LOGO_FILE,
+    os.path.join(os.path.dirname(__file__), "../../../../../../", LOGO_FILE),
+]
+
+
+@dataclass(frozen=True)
+class LogoOverlay:
+    """Logo and circular background prepared for one QR image size"""
+    logo: Image.Image
+    logo_position: Tuple[int, int]
+    background: Image.Image
+    background_position: Tuple[int, int]
+
+
+class LogoAssetCache:
+    """Decoded logo plus per-size overlays, shared by every QRGeneratorService"""
+
+    def __init__(self, logo_paths: List[str], logo_size_ratio: float = 0.2):
+        self.logo_paths = logo_paths
+        self.logo_size_ratio = logo_size_ratio
+
+        self._logo: Optional[Image.Image] = None
+        self._version = "none"
+        self._loaded = False
+        self._overlays: Dict[Tuple[int, int], LogoOverlay] = {}
+        self._pngs: Dict[int, bytes] = {}
+        self._lock = threading.Lock()
+
+    def get_logo(self) -> Optional[Image.Image]:
+        """Get the decoded RGBA logo (None if no logo file is found)"""
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self._logo = self._load_logo()
+                    self._loaded = True
+        return self._logo
+
+    @property
+    def version(self) -> str:
+        """Content hash of the logo file ("none" without a logo); part of rendered QR cache keys"""
+        self.get_logo()
+        return self._version
+
+    def get_logo_png(self, size: int) -> Optional[bytes]:
+        """Get the logo resized to size x size and encoded as PNG (for SVG embedding)"""
+        png = self._pngs.get(size)
+        if png is not None:
+            return png
+
+        logo = self.get_logo()
+        if logo is None:
+            return None
+
+        buffer = BytesIO()
+        logo.resize((size, size), Image.Resampling.LANCZOS).save(buffer, format='PNG')
+        png = buffer.getvalue()
+        with self._lock:
+            self._pngs.setdefault(size, png)
+        return png
+
+    def get_overlay(self, qr_size: Tuple[int, int]) -> Optional[LogoOverlay]:
+        """
+        Get the logo overlay for a QR image size
+
+        Args:
+            qr_size: (width, height) of the QR image
+
+        Returns:
+            LogoOverlay, or None if no logo file is found
+        """
+        overlay = self._overlays.get(qr_size)
+        if overlay is not None:
+            return overlay
+
+        logo = self.get_logo()
+        if logo is None:
+            return None
+
+        overlay = self._build_overlay(logo, qr_size)
+        with self._lock:
+            self._overlays.setdefault(qr_size, overlay)
+        return overlay
+
+    def _load_logo(self) -> Optional[Image.Image]:
+        """Load VitalGo logo image"""
+        try:
+            for path in self.logo_paths:
+                if os.path.exists(path):
+                    with open(path, 'rb') as logo_file:
+                        data = logo_file.read()
+                    self._version = hashlib.sha256(data).hexdigest()[:16]
+                    with Image.open(BytesIO(data)) as image:
+                        return image.convert('RGBA')
+
+            # If no logo found, return None (QR will be generated without logo)
+            return None
+
+        except Exception as e:
+            print(f"Warning: Could not load logo: {e}")
+            return None
+
+    def _build_overlay(self, logo: Image.Image, qr_size: Tuple[int, int]) -> LogoOverlay:
+        """Resize the logo and draw its circular white background for a QR size"""
+        qr_width, qr_height = qr_size
+
+        # Calculate logo size (20% of QR code)
+        logo_size = int(min(qr_width, qr_height) * self.logo_size_ratio)
+        resized_logo = logo.resize((logo_size, logo_size), Image.Resampling.LANCZOS)
+
+        # Create white background circle for logo, 20% larger than the logo
+        background_size = int(logo_size * 1.2)
+        background = Image.new('RGBA', (background_size, background_size), (255, 255, 255, 255))
+
+        mask = Image.new('L', (background_size, background_size), 0)
+        draw = ImageDraw.Draw(mask)
+        draw.ellipse([(0, 0), (background_size, background_size)], fill=255)
+        background.putalpha(mask)
+
+        return LogoOverlay(
+            logo=resized_logo,
+            logo_position=((qr_width - logo_size) // 2, (qr_height - logo_size) // 2),
+            background=background,
+            background_position=((qr_width - background_size) // 2, (qr_height - background_size) // 2)
+        )
+
+
+# Global instance storage
+_logo_asset_cache_instance: Optional[LogoAssetCache] = None
+
+
+def get_logo_asset_cache() -> LogoAssetCache:
+    """
+    Get or create the per-process logo asset cache
+
+    Returns:
+        LogoAssetCache: The singleton cache instance
+    """
+    global _logo_asset_cache_instance
+
+    if _logo_asset_cache_instance is None:
+        _logo_asset_cache_instance = LogoAssetCache(logo_paths=LOGO_PATHS)
+
+    return _logo_asset_cache_instance
+
+
+def reset_logo_asset_cache() -> None:
+    """
+    Reset the singleton instance (useful for testing)
+    """
+    global _logo_asset_cache_instance
+    _logo_asset_cache_instance = None
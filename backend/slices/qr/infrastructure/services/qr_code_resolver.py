@@ -0,0 +1,292 @@
+"""
+QR code resolver (patients.qr_code -> patients.id)
+
+Scanned QR codes are checked here before any database lookup:
+
+- a Bloom filter of every known qr_code, rebuilt at startup and refreshed
+  incrementally from patients created or updated since the last refresh
+- an LRU of resolved qr_code -> patient_id pairs
+- a TTL cache of codes the database reported as unknown
+
+A code the Bloom filter has never seen is unknown for certain, so random or
+garbage UUIDs are answered without touching Postgres. Before answering "unknown"
+the resolver refreshes itself if the refresh interval has elapsed, which
+bounds how long a patient created on another worker can go unseen. Until the
+first rebuild succeeds every code is passed through to the database.
+
+Usage:
+    from slices.qr.infrastructure.services.qr_code_resolver import get_qr_code_resolver
+
+    resolver = get_qr_code_resolver()
+    if not await resolver.might_exist(qr_code):
+        raise HTTPException(status_code=404, detail="Patient not found")
+"""
+import asyncio
+import math
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from sqlalchemy import Select, func, or_, select
+
+from shared.config.settings import settings
+from shared.database import async_engine
+from slices.qr.application.ports.qr_code_resolver_port import QRCodeResolverPort
+from slices.signup.domain.models.patient_model import Patient
+
+# Re-read rows changed slightly before the watermark to cover late commits
+_WATERMARK_OVERLAP = timedelta(seconds=60)
+
+
+def build_refresh_query(since: Optional[datetime]) -> Select:
+    """Patients created or updated at or after since (served by ix_patients_created_at/updated_at)"""
+    query = select(Patient.qr_code, Patient.id, Patient.created_at, Patient.updated_at)
+    if since is not None:
+        query = query.where(or_(Patient.created_at >= since, Patient.updated_at >= since))
+    return query
+
+
+class _UUIDBloomFilter:
+    """Bloom filter over UUIDs using double hashing of the two 64-bit halves"""
+
+    def __init__(self, capacity: int, false_positive_rate: float):
+        capacity = max(capacity, 1000)
+        self.capacity = capacity
+        self.size_bits = max(8, int(-capacity * math.log(false_positive_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size_bits / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size_bits + 7) // 8)
+
+    def add(self, value: UUID) -> None:
+        for position in self._positions(value):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, value: UUID) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+    def _positions(self, value: UUID):
+        high, low = value.int >> 64, value.int & 0xFFFFFFFFFFFFFFFF
+        for i in range(self.hash_count):
+            yield (high + i * low) % self.size_bits
+
+
+class QRCodeResolver(QRCodeResolverPort):
+    """Per-worker QR code existence filter with positive and negative caches"""
+
+    def __init__(
+        self,
+        engine=async_engine,
+        max_entries: int = 10000,
+        negative_ttl_seconds: int = 60,
+        refresh_interval_seconds: int = 5,
+        false_positive_rate: float = 0.001
+    ):
+        self.engine = engine
+        self.max_entries = max_entries
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self.false_positive_rate = false_positive_rate
+
+        self._bloom: Optional[_UUIDBloomFilter] = None
+        self._positive: "OrderedDict[UUID, UUID]" = OrderedDict()
+        self._negative: "OrderedDict[UUID, float]" = OrderedDict()
+        self._watermark: Optional[datetime] = None
+        self._last_refresh: Optional[float] = None
+
+        self._lock = threading.Lock()
+        self._refresh_lock = asyncio.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._rejected = 0
+        self._rebuilds = 0
+        self._refreshes = 0
+
+    async def might_exist(self, qr_code: UUID) -> bool:
+        """
+        Check whether a QR code can belong to a patient
+
+        Returns:
+            False only if the code is certainly unknown (no database lookup needed)
+        """
+        with self._lock:
+            if self._bloom is None or qr_code in self._positive:
+                return True
+
+            expires_at = self._negative.get(qr_code)
+            if expires_at is not None:
+                if expires_at > time.time():
+                    self._rejected += 1
+                    return False
+                del self._negative[qr_code]
+
+            if qr_code in self._bloom:
+                return True
+
+        # The code may belong to a patient created on another worker
+        await self.ensure_fresh()
+
+        with self._lock:
+            if qr_code in self._bloom:
+                return True
+            self._rejected += 1
+            return False
+
+    def get_patient_id(self, qr_code: UUID) -> Optional[UUID]:
+        """Get a cached patient_id for a QR code"""
+        with self._lock:
+            patient_id = self._positive.get(qr_code)
+            if patient_id is None:
+                self._misses += 1
+                return None
+
+            self._positive.move_to_end(qr_code)
+            self._hits += 1
+            return patient_id
+
+    def remember(self, qr_code: UUID, patient_id: UUID) -> None:
+        """Cache a QR code resolved by the database"""
+        with self._lock:
+            self._negative.pop(qr_code, None)
+            self._positive[qr_code] = patient_id
+            self._positive.move_to_end(qr_code)
+            while len(self._positive) > self.max_entries:
+                self._positive.popitem(last=False)
+
+    def remember_missing(self, qr_code: UUID) -> None:
+        """Cache a QR code the database did not find (Bloom filter false positive)"""
+        with self._lock:
+            self._positive.pop(qr_code, None)
+            self._negative[qr_code] = time.time() + self.negative_ttl_seconds
+            self._negative.move_to_end(qr_code)
+            while len(self._negative) > self.max_entries:
+                self._negative.popitem(last=False)
+
+    def register(self, qr_code: UUID, patient_id: UUID) -> None:
+        """Add a new or regenerated QR code (called by patient writers after commit)"""
+        with self._lock:
+            if self._bloom is not None:
+                self._bloom.add(qr_code)
+        self.remember(qr_code, patient_id)
+
+    def forget(self, qr_code: UUID) -> None:
+        """Drop a replaced QR code from the positive cache"""
+        with self._lock:
+            self._positive.pop(qr_code, None)
+
+    async def rebuild(self) -> None:
+        """Load every patients.qr_code into a new Bloom filter (startup and on growth)"""
+        async with self.engine.connect() as conn:
+            patient_count = (await conn.execute(select(func.count(Patient.id)))).scalar() or 0
+            bloom = _UUIDBloomFilter(capacity=patient_count * 2, false_positive_rate=self.false_positive_rate)
+            watermark = (await conn.execute(
+                select(func.greatest(func.max(Patient.created_at), func.max(Patient.updated_at)))
+            )).scalar()
+
+            result = await conn.stream(select(Patient.qr_code))
+            async for partition in result.partitions(10000):
+                for (qr_code,) in partition:
+                    bloom.add(qr_code)
+
+        with self._lock:
+            self._bloom = bloom
+            self._negative.clear()
+        self._watermark = watermark
+        self._last_refresh = time.time()
+        self._rebuilds += 1
+
+    async def ensure_fresh(self) -> None:
+        """Refresh from recently created/updated patients if the interval has elapsed"""
+        if self._is_fresh():
+            return
+
+        async with self._refresh_lock:
+            if self._is_fresh():
+                return
+
+            try:
+                await self.refresh()
+            except Exception as e:
+                print(f"⚠️ QR RESOLVER - Refresh failed: {e}")
+                # Do not retry on every scan while the database is unavailable
+                self._last_refresh = time.time()
+
+    async def refresh(self) -> None:
+        """Add QR codes of patients created or updated since the last refresh"""
+        if self._bloom is None or self._bloom.count >= self._bloom.capacity:
+            await self.rebuild()
+            return
+
+        since = self._watermark - _WATERMARK_OVERLAP if self._watermark is not None else None
+        query = build_refresh_query(since)
+
+        async with self.engine.connect() as conn:
+            rows = (await conn.execute(query)).all()
+
+        with self._lock:
+            for qr_code, _, created_at, updated_at in rows:
+                self._bloom.add(qr_code)
+                self._negative.pop(qr_code, None)
+                for changed_at in (created_at, updated_at):
+                    if changed_at is not None and (self._watermark is None or changed_at > self._watermark):
+                        self._watermark = changed_at
+
+        self._last_refresh = time.time()
+        self._refreshes += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache sizes and counters for this worker"""
+        with self._lock:
+            return {
+                "ready": self._bloom is not None,
+                "known_codes": self._bloom.count if self._bloom is not None else 0,
+                "bloom_bits": self._bloom.size_bits if self._bloom is not None else 0,
+                "cached": len(self._positive),
+                "negative_cached": len(self._negative),
+                "hits": self._hits,
+                "misses": self._misses,
+                "rejected": self._rejected,
+                "rebuilds": self._rebuilds,
+                "refreshes": self._refreshes
+            }
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._last_refresh is not None
+            and time.time() - self._last_refresh < self.refresh_interval_seconds
+        )
+
+
+# Global instance storage
+_qr_code_resolver_instance: Optional[QRCodeResolver] = None
+
+
+def get_qr_code_resolver() -> QRCodeResolver:
+    """
+    Get or create the per-process QR code resolver
+
+    Returns:
+        QRCodeResolver: The singleton resolver instance
+    """
+    global _qr_code_resolver_instance
+
+    if _qr_code_resolver_instance is None:
+        _qr_code_resolver_instance = QRCodeResolver(
+            max_entries=settings.QR_RESOLVER_CACHE_SIZE,
+            negative_ttl_seconds=settings.QR_RESOLVER_NEGATIVE_TTL_SECONDS,
+            refresh_interval_seconds=settings.QR_RESOLVER_REFRESH_INTERVAL_SECONDS
+        )
+
+    return _qr_code_resolver_instance
+
+
+def reset_qr_code_resolver() -> None:
+    """
+    Reset the singleton instance (useful for testing)
+    """
+    global _qr_code_resolver_instance
+    _qr_code_resolver_instance = None
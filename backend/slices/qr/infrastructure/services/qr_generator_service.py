@@ -3,21 +3,41 @@ QR Code Generation Service
 Service for generating QR codes with VitalGo logo embedding
 """
 import qrcode
-from PIL import Image, ImageDraw
-from io import BytesIO
 import base64
 from uuid import UUID
-from typing import Optional
-import os
+from typing import Any, List, Optional
 from shared.config.settings import settings
+from slices.qr.infrastructure.services.logo_asset_cache import LogoAssetCache, get_logo_asset_cache
+from slices.qr.infrastructure.services.qr_rasterizer import get_qr_rasterizer
+from slices.qr.infrastructure.services.rendered_qr_cache import (
+    DEFAULT_BOX_SIZE,
+    RenderedQRCache,
+    get_rendered_qr_cache,
+    rendered_qr_key,
+)
+
+# Quiet zone in modules
+QR_BORDER = 4
+
+# Logo PNG embedded in SVG output (scaled by the SVG viewer)
+SVG_LOGO_PIXELS = 256
 
 
 class QRGeneratorService:
     """Service for generating QR codes with logo embedding"""
 
-    def __init__(self):
-        self.logo_path = "../frontend/public/assets/images/logos/logos-blue-light-background.png"
-        self.logo_size_ratio = 0.2  # Logo will be 20% of QR code size
+    def __init__(
+        self,
+        logo_assets: Optional[LogoAssetCache] = None,
+        image_cache: Optional[RenderedQRCache] = None,
+        rasterizer: Optional[Any] = None
+    ):
+        # Logo decoding, resizing and masks are cached per process
+        self.logo_assets = logo_assets or get_logo_asset_cache()
+        # Rendered images are cached by content address
+        self.image_cache = image_cache or get_rendered_qr_cache()
+        # Matrix -> PNG engine selected by QR_RASTERIZER
+        self.rasterizer = rasterizer or get_qr_rasterizer()
 
     def generate_qr_with_logo(self, qr_uuid: UUID) -> str:
         """
@@ -29,102 +49,110 @@ class QRGeneratorService:
         Returns:
             Base64 encoded PNG image of the QR code
         """
-        # Create emergency URL
-        emergency_url = f"{settings.FRONTEND_URL}/qr/{str(qr_uuid)}"
-
-        # Generate QR code
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_H,  # High error correction for logo overlay
-            box_size=10,
-            border=4,
-        )
-        qr.add_data(emergency_url)
-        qr.make(fit=True)
-
-        # Create QR code image
-        qr_img = qr.make_image(fill_color="black", back_color="white").convert('RGB')
-
-        # Add logo if it exists
-        logo_img = self._load_logo()
-        if logo_img:
-            qr_img = self._add_logo_to_qr(qr_img, logo_img)
+        return base64.b64encode(self.render_png(qr_uuid)).decode('utf-8')
 
-        # Convert to base64
-        return self._image_to_base64(qr_img)
-
-    def _load_logo(self) -> Optional[Image.Image]:
-        """Load VitalGo logo image"""
-        try:
-            # Try to load from multiple possible paths
-            possible_paths = [
-                self.logo_path,
-                "frontend/public/assets/images/logos/logos-blue-light-background.png",
-                os.path.join(os.path.dirname(__file__), "../../../../../../frontend/public/assets/images/logos/logos-blue-light-background.png")
-            ]
-
-            for path in possible_paths:
-                if os.path.exists(path):
-                    return Image.open(path).convert('RGBA')
-
-            # If no logo found, return None (QR will be generated without logo)
-            return None
-
-        except Exception as e:
-            print(f"Warning: Could not load logo: {e}")
-            return None
-
-    def _add_logo_to_qr(self, qr_img: Image.Image, logo_img: Image.Image) -> Image.Image:
-        """Add logo to the center of QR code with white background"""
-        qr_width, qr_height = qr_img.size
-
-        # Calculate logo size (20% of QR code)
-        logo_size = int(min(qr_width, qr_height) * self.logo_size_ratio)
-
-        # Resize logo
-        logo_img = logo_img.resize((logo_size, logo_size), Image.Resampling.LANCZOS)
-
-        # Create white background circle for logo
-        background_size = int(logo_size * 1.2)  # 20% larger than logo
-        background = Image.new('RGBA', (background_size, background_size), (255, 255, 255, 255))
+    def render_png(self, qr_uuid: UUID, box_size: int = DEFAULT_BOX_SIZE) -> bytes:
+        """
+        Get the logo-embedded QR code as PNG bytes (cached)
 
-        # Create circular mask for background
-        mask = Image.new('L', (background_size, background_size), 0)
-        draw = ImageDraw.Draw(mask)
-        draw.ellipse([(0, 0), (background_size, background_size)], fill=255)
+        Args:
+            qr_uuid: The UUID for the QR code
+            box_size: Pixels per QR module
 
-        # Apply circular mask to background
-        background.putalpha(mask)
+        Returns:
+            PNG image bytes
+        """
+        key = self.image_key(qr_uuid, box_size, "png")
+        image = self.image_cache.get(key, "png")
+        if image is None:
+            image = self._render_png(qr_uuid, box_size)
+            self.image_cache.put(key, image, "png")
+        return image
+
+    def render_svg(self, qr_uuid: UUID) -> bytes:
+        """
+        Get the logo-embedded QR code as SVG bytes (cached)
 
-        # Calculate positions for centering
-        bg_pos = (
-            (qr_width - background_size) // 2,
-            (qr_height - background_size) // 2
-        )
+        Args:
+            qr_uuid: The UUID for the QR code
 
-        logo_pos = (
-            (qr_width - logo_size) // 2,
-            (qr_height - logo_size) // 2
+        Returns:
+            UTF-8 SVG document bytes
+        """
+        key = self.image_key(qr_uuid, 0, "svg")
+        image = self.image_cache.get(key, "svg")
+        if image is None:
+            image = self._render_svg(qr_uuid)
+            self.image_cache.put(key, image, "svg")
+        return image
+
+    def image_key(self, qr_uuid: UUID, box_size: int, image_format: str) -> str:
+        """Content address of a rendered image (no rendering needed)"""
+        return rendered_qr_key(settings.FRONTEND_URL, qr_uuid, self.logo_assets.version, box_size, image_format)
+
+    def image_etag(self, qr_uuid: UUID, box_size: int, image_format: str) -> str:
+        """Quoted strong ETag of a rendered image"""
+        return '"' + self.image_key(qr_uuid, box_size, image_format)[:32] + '"'
+
+    def build_matrix(self, qr_uuid: UUID) -> List[List[bool]]:
+        """Get the QR module matrix (quiet zone included) for a QR code UUID"""
+        return self._build_qr(qr_uuid, DEFAULT_BOX_SIZE).get_matrix()
+
+    def _build_qr(self, qr_uuid: UUID, box_size: int) -> qrcode.QRCode:
+        """Encode the emergency URL for a QR code UUID"""
+        qr = qrcode.QRCode(
+            version=1,
+            error_correction=qrcode.constants.ERROR_CORRECT_H,  # High error correction for logo overlay
+            box_size=box_size,
+            border=QR_BORDER,
         )
-
-        # Convert QR to RGBA for compositing
-        qr_img = qr_img.convert('RGBA')
-
-        # Paste white background first
-        qr_img.paste(background, bg_pos, background)
-
-        # Paste logo on top
-        qr_img.paste(logo_img, logo_pos, logo_img)
-
-        return qr_img.convert('RGB')
-
-    def _image_to_base64(self, img: Image.Image) -> str:
-        """Convert PIL Image to base64 string"""
-        buffer = BytesIO()
-        img.save(buffer, format='PNG')
-        img_bytes = buffer.getvalue()
-        return base64.b64encode(img_bytes).decode('utf-8')
+        qr.add_data(self.get_emergency_url(qr_uuid))
+        qr.make(fit=True)
+        return qr
+
+    def _render_png(self, qr_uuid: UUID, box_size: int) -> bytes:
+        """Render the QR code with logo to PNG bytes"""
+        return self.rasterizer.render(self._build_qr(qr_uuid, box_size))
+
+    def _render_svg(self, qr_uuid: UUID) -> bytes:
+        """Render the QR code as an SVG path in module units, with the logo embedded as PNG"""
+        matrix = self.build_matrix(qr_uuid)
+        size = len(matrix)
+
+        # One horizontal run per sequence of dark modules
+        runs = []
+        for y, row in enumerate(matrix):
+            x = 0
+            while x < size:
+                if row[x]:
+                    start = x
+                    while x < size and row[x]:
+                        x += 1
+                    runs.append(f"M{start} {y}h{x - start}v1h-{x - start}z")
+                else:
+                    x += 1
+
+        parts = [
+            f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {size} {size}" shape-rendering="crispEdges">',
+            f'<rect width="{size}" height="{size}" fill="#fff"/>',
+            f'<path d="{"".join(runs)}" fill="#000"/>',
+        ]
+
+        # Same layout as the PNG: logo is 20% of the image, on a circle 20% larger
+        logo_png = self.logo_assets.get_logo_png(SVG_LOGO_PIXELS)
+        if logo_png:
+            logo_size = size * self.logo_assets.logo_size_ratio
+            offset = (size - logo_size) / 2
+            logo_data = base64.b64encode(logo_png).decode('ascii')
+            parts.append(f'<circle cx="{size / 2}" cy="{size / 2}" r="{logo_size * 0.6:.3f}" fill="#fff"/>')
+            parts.append(
+                f'<image x="{offset:.3f}" y="{offset:.3f}" width="{logo_size:.3f}" height="{logo_size:.3f}" '
+                f'href="data:image/png;base64,{logo_data}"/>'
+            )
+
+        parts.append('</svg>')
+        return "".join(parts).encode('utf-8')
 
     def get_emergency_url(self, qr_uuid: UUID) -> str:
         """Get the emergency URL for a QR code UUID"""
-        return f"{settings.FRONTEND_URL}/qr/{str(qr_uuid)}"
\ No newline at end of file
+        return f"{settings.FRONTEND_URL}/qr/{str(qr_uuid)}"
@@ -0,0 +1,183 @@
+"""
+Background QR pre-rendering
+
+A new (or regenerated) QR code is rendered into the rendered QR image cache
+right away, in every configured size (QR_PRERENDER_BOX_SIZES: on-screen,
+print, lock-screen wallpaper), so the first /api/qr/image.png or
+/api/qr/generate call after signup is a cache hit instead of a full render.
+
+Renders run on a small thread pool owned by this worker, never on the request
+path. The backlog is bounded: when it is full new jobs are dropped (the image
+is simply rendered on first fetch, as before). Shutdown waits for the backlog
+to drain. With QR_IMAGE_CACHE_DIR set the renders land on disk and are shared
+by every worker; otherwise they warm this worker's memory tier only.
+
+Usage:
+    from slices.qr.infrastructure.services.qr_prerenderer import get_qr_prerenderer
+
+    get_qr_prerenderer().schedule(patient.qr_code)
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from shared.config.settings import settings
+from slices.signup.application.ports.qr_prerender_port import QRPrerenderPort
+from slices.qr.infrastructure.services.rendered_qr_cache import MAX_BOX_SIZE, MIN_BOX_SIZE
+
+
+class QRPrerenderer(QRPrerenderPort):
+    """Renders QR images into the rendered QR cache off the request path"""
+
+    def __init__(
+        self,
+        box_sizes: List[int],
+        max_workers: int = 1,
+        max_pending: int = 100,
+        enabled: bool = True,
+        generator: Optional[Any] = None
+    ):
+        """
+        Args:
+            box_sizes: Pixels per module of every PNG to pre-render
+            max_workers: Concurrent render threads
+            max_pending: Jobs allowed to wait before new ones are dropped
+            enabled: False turns schedule() into a no-op
+            generator: QRGeneratorService to render with (created on first job if omitted)
+        """
+        self.box_sizes = box_sizes
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.enabled = enabled
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._generator = generator
+        self._lock = threading.Lock()
+
+        self._pending = 0
+        self._scheduled = 0
+        self._rendered = 0
+        self._dropped = 0
+        self._failed = 0
+
+    def schedule(self, qr_uuid: UUID) -> bool:
+        """
+        Queue every configured size of a QR code for rendering
+
+        Args:
+            qr_uuid: The patient's QR code UUID
+
+        Returns:
+            True if queued, False if disabled or the backlog is full
+        """
+        if not self.enabled or not qr_uuid:
+            return False
+
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._dropped += 1
+                return False
+            self._pending += 1
+            self._scheduled += 1
+            executor = self._get_executor()
+
+        executor.submit(self._render, qr_uuid)
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """Get scheduling counters for this worker"""
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "box_sizes": self.box_sizes,
+                "pending": self._pending,
+                "scheduled": self._scheduled,
+                "rendered": self._rendered,
+                "dropped": self._dropped,
+                "failed": self._failed
+            }
+
+    def shutdown(self) -> None:
+        """Stop the executor once queued jobs are rendered (called on application shutdown)"""
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _render(self, qr_uuid: UUID) -> None:
+        """Render every size through QRGeneratorService (runs in the executor)"""
+        try:
+            generator = self._get_generator()
+            for box_size in self.box_sizes:
+                generator.render_png(qr_uuid, box_size)
+            with self._lock:
+                self._rendered += 1
+        except Exception as e:
+            with self._lock:
+                self._failed += 1
+            print(f"⚠️ QR PRERENDER - Could not render {qr_uuid}: {e}")
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def _get_generator(self):
+        """Create the generator on first use (qrcode/PIL are imported only here)"""
+        if self._generator is None:
+            from slices.qr.infrastructure.services.qr_generator_service import QRGeneratorService
+            self._generator = QRGeneratorService()
+        return self._generator
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Create the executor lazily (caller holds the lock)"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="qr-prerender"
+            )
+        return self._executor
+
+
+def parse_box_sizes(value: str) -> List[int]:
+    """Parse comma-separated box sizes, clamped to the supported range"""
+    return [
+        min(MAX_BOX_SIZE, max(MIN_BOX_SIZE, int(item.strip())))
+        for item in value.split(",") if item.strip()
+    ]
+
+
+# Global instance storage
+_qr_prerenderer_instance: Optional[QRPrerenderer] = None
+
+
+def get_qr_prerenderer() -> QRPrerenderer:
+    """
+    Get or create the per-process QR prerenderer
+
+    Returns:
+        QRPrerenderer: The singleton prerenderer instance
+    """
+    global _qr_prerenderer_instance
+
+    if _qr_prerenderer_instance is None:
+        _qr_prerenderer_instance = QRPrerenderer(
+            box_sizes=parse_box_sizes(settings.QR_PRERENDER_BOX_SIZES),
+            max_workers=settings.QR_PRERENDER_MAX_WORKERS,
+            max_pending=settings.QR_PRERENDER_MAX_PENDING,
+            enabled=settings.QR_PRERENDER_ENABLED
+        )
+
+    return _qr_prerenderer_instance
+
+
+def reset_qr_prerenderer() -> None:
+    """
+    Shut down and reset the singleton instance (useful for testing)
+    """
+    global _qr_prerenderer_instance
+
+    if _qr_prerenderer_instance is not None:
+        _qr_prerenderer_instance.shutdown()
+    _qr_prerenderer_instance = None
@@ -0,0 +1,192 @@
+"""
+QR rasterizers: QR module matrix + logo overlay -> PNG bytes
+
+- PILQRRasterizer: qrcode's PIL image factory, RGB -> RGBA -> RGB and two
+  mask pastes (the original rendering path)
+- NumpyQRRasterizer: scales the module matrix with NumPy block repetition,
+  composites the prepared logo with array slicing using the same integer
+  blend as PIL's masked paste, and encodes once. Pixels are identical to the
+  PIL path, so the output scans the same at H error correction.
+
+The rasterizer is chosen with QR_RASTERIZER ("numpy" or "pil"); numpy is
+imported only when the NumPy rasterizer is used, and the PIL path is used
+instead if numpy cannot be imported.
+"""
+from io import BytesIO
+from typing import Any, Dict, Optional, Tuple, Union
+
+from PIL import Image
+
+from shared.config.settings import settings
+from slices.qr.infrastructure.services.logo_asset_cache import LogoAssetCache, LogoOverlay, get_logo_asset_cache
+
+
+class PILQRRasterizer:
+    """Render through qrcode's PIL image factory"""
+
+    def __init__(self, logo_assets: LogoAssetCache):
+        self.logo_assets = logo_assets
+
+    def render(self, qr: Any) -> bytes:
+        """
+        Render a QR code (qrcode.QRCode, already made) with the logo to PNG
+
+        Args:
+            qr: QRCode whose box_size and border define the image size
+
+        Returns:
+            PNG image bytes
+        """
+        # Create QR code image
+        qr_img = qr.make_image(fill_color="black", back_color="white").convert('RGB')
+
+        # Add logo if it exists (prepared once per image size)
+        overlay = self.logo_assets.get_overlay(qr_img.size)
+        if overlay:
+            qr_img = self._add_logo_to_qr(qr_img, overlay)
+
+        return encode_png(qr_img)
+
+    def _add_logo_to_qr(self, qr_img: Image.Image, overlay: LogoOverlay) -> Image.Image:
+        """Add logo to the center of QR code with white background"""
+        # Convert QR to RGBA for compositing
+        qr_img = qr_img.convert('RGBA')
+
+        # Paste white background first
+        qr_img.paste(overlay.background, overlay.background_position, overlay.background)
+
+        # Paste logo on top
+        qr_img.paste(overlay.logo, overlay.logo_position, overlay.logo)
+
+        return qr_img.convert('RGB')
+
+
+class NumpyQRRasterizer:
+    """Render the module matrix with NumPy block repetition and array compositing"""
+
+    def __init__(self, logo_assets: LogoAssetCache):
+        import numpy
+
+        self.np = numpy
+        self.logo_assets = logo_assets
+        # image size -> arrays derived from the LogoOverlay for that size
+        self._logo_layers: Dict[Tuple[int, int], Optional[Dict[str, Any]]] = {}
+
+    def render(self, qr: Any) -> bytes:
+        """
+        Render a QR code (qrcode.QRCode, already made) with the logo to PNG
+
+        Args:
+            qr: QRCode whose box_size and border define the image size
+
+        Returns:
+            PNG image bytes
+        """
+        np = self.np
+
+        # Dark modules are 0 (black), light modules 255 (white)
+        modules = np.asarray(qr.get_matrix(), dtype=bool)
+        gray = np.where(modules, 0, 255).astype(np.uint8)
+        gray = np.repeat(np.repeat(gray, qr.box_size, axis=0), qr.box_size, axis=1)
+
+        pixels = np.repeat(gray[:, :, None], 3, axis=2)
+
+        layers = self._get_logo_layers((pixels.shape[1], pixels.shape[0]))
+        if layers is not None:
+            self._composite(pixels, layers)
+
+        return encode_png(Image.fromarray(pixels, 'RGB'))
+
+    def _get_logo_layers(self, size: Tuple[int, int]) -> Optional[Dict[str, Any]]:
+        """Get the circle mask and logo color/alpha arrays for an image size"""
+        if size in self._logo_layers:
+            return self._logo_layers[size]
+
+        np = self.np
+        overlay = self.logo_assets.get_overlay(size)
+        layers = None
+        if overlay is not None:
+            logo = np.asarray(overlay.logo, dtype=np.int32)
+            layers = {
+                "circle": np.asarray(overlay.background.getchannel('A')) == 255,
+                "background_position": overlay.background_position,
+                "logo_rgb": logo[:, :, :3],
+                "logo_alpha": logo[:, :, 3:4],
+                "logo_position": overlay.logo_position,
+            }
+
+        self._logo_layers[size] = layers
+        return layers
+
+    def _composite(self, pixels: Any, layers: Dict[str, Any]) -> None:
+        """Paint the white circle, then alpha-blend the logo in place"""
+        np = self.np
+
+        x, y = layers["background_position"]
+        circle = layers["circle"]
+        pixels[y:y + circle.shape[0], x:x + circle.shape[1]][circle] = 255
+
+        x, y = layers["logo_position"]
+        logo_rgb = layers["logo_rgb"]
+        region = pixels[y:y + logo_rgb.shape[0], x:x + logo_rgb.shape[1]]
+
+        # Same integer blend as PIL's masked paste: DIV255(dst * (255 - a) + src * a)
+        alpha = layers["logo_alpha"]
+        tmp = region.astype(np.int32) * (255 - alpha) + logo_rgb * alpha + 128
+        region[...] = ((tmp >> 8) + tmp) >> 8
+
+
+def encode_png(image: Image.Image) -> bytes:
+    """Encode PIL Image as PNG bytes"""
+    buffer = BytesIO()
+    image.save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+def create_qr_rasterizer(rasterizer_name: str, logo_assets: LogoAssetCache):
+    """
+    Create the rasterizer configured by QR_RASTERIZER
+
+    Args:
+        rasterizer_name: "numpy" (vectorized) or "pil" (qrcode image factory)
+        logo_assets: Logo asset cache shared by the rasterizer
+
+    Returns:
+        NumpyQRRasterizer or PILQRRasterizer
+    """
+    if rasterizer_name == "numpy":
+        try:
+            return NumpyQRRasterizer(logo_assets)
+        except ImportError as e:
+            print(f"⚠️ QR RASTERIZER - numpy unavailable, using the PIL rasterizer: {e}")
+            return PILQRRasterizer(logo_assets)
+    if rasterizer_name == "pil":
+        return PILQRRasterizer(logo_assets)
+    raise ValueError(f"Unsupported QR rasterizer: {rasterizer_name}")
+
+
+# Global instance storage
+_qr_rasterizer_instance: Optional[Union[NumpyQRRasterizer, PILQRRasterizer]] = None
+
+
+def get_qr_rasterizer() -> Union[NumpyQRRasterizer, PILQRRasterizer]:
+    """
+    Get or create the per-process QR rasterizer
+
+    Returns:
+        The configured rasterizer (holds per-size logo layers)
+    """
+    global _qr_rasterizer_instance
+
+    if _qr_rasterizer_instance is None:
+        _qr_rasterizer_instance = create_qr_rasterizer(settings.QR_RASTERIZER, get_logo_asset_cache())
+
+    return _qr_rasterizer_instance
+
+
+def reset_qr_rasterizer() -> None:
+    """
+    Reset the singleton instance (useful for testing)
+    """
+    global _qr_rasterizer_instance
+    _qr_rasterizer_instance = None
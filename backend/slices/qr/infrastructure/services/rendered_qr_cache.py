@@ -0,0 +1,194 @@
+"""
+Content-addressed cache of rendered QR images
+
+A rendered QR image is a pure function of (FRONTEND_URL, qr_uuid, logo
+version, box size, format), so it is cached under the SHA-256 of that tuple:
+
+- a bounded in-memory LRU per process (limited by total bytes)
+- an optional on-disk directory shared by every worker (QR_IMAGE_CACHE_DIR),
+  sharded by the first two hex digits of the key
+
+The same key doubles as the image ETag, so conditional requests are answered
+without rendering or reading the image. Entries never need invalidation: a new
+URL, QR code or logo produces a new key.
+
+Usage:
+    from slices.qr.infrastructure.services.rendered_qr_cache import get_rendered_qr_cache
+
+    cache = get_rendered_qr_cache()
+    image = cache.get(key, "png")
+    if image is None:
+        cache.put(key, render(), "png")
+"""
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from shared.config.settings import settings
+
+# Pixels per QR module (box_size=10 is the original on-screen size)
+DEFAULT_BOX_SIZE = 10
+MIN_BOX_SIZE = 4
+MAX_BOX_SIZE = 40
+
+
+def rendered_qr_key(frontend_url: str, qr_uuid: Any, logo_version: str, box_size: int, image_format: str) -> str:
+    """Content address of a rendered QR image"""
+    source = "|".join([frontend_url, str(qr_uuid), logo_version, str(box_size), image_format])
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+class RenderedQRCache:
+    """Bounded LRU of rendered QR images with an optional disk tier"""
+
+    def __init__(self, max_bytes: int, cache_dir: Optional[str] = None):
+        self.max_bytes = max_bytes
+        self.cache_dir = cache_dir or None
+
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._size_bytes = 0
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._disk_errors = 0
+
+    def get(self, key: str, image_format: str) -> Optional[bytes]:
+        """
+        Get a rendered image from memory, then from disk
+
+        Args:
+            key: rendered_qr_key of the image
+            image_format: File extension ("png" or "svg")
+
+        Returns:
+            Image bytes, or None on a miss
+        """
+        with self._lock:
+            image = self._entries.get(key)
+            if image is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return image
+
+        image = self._read_disk(key, image_format)
+        if image is not None:
+            self._put_memory(key, image)
+            with self._lock:
+                self._disk_hits += 1
+            return image
+
+        with self._lock:
+            self._misses += 1
+        return None
+
+    def put(self, key: str, image: bytes, image_format: str) -> None:
+        """Store a rendered image in memory and, if configured, on disk"""
+        self._put_memory(key, image)
+        self._write_disk(key, image, image_format)
+
+    def clear(self) -> None:
+        """Drop every in-memory entry (the disk tier is left untouched)"""
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters and current size for this worker"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "size_bytes": self._size_bytes,
+                "max_bytes": self.max_bytes,
+                "disk_enabled": self.cache_dir is not None,
+                "hits": self._hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "disk_errors": self._disk_errors
+            }
+
+    def _put_memory(self, key: str, image: bytes) -> None:
+        if len(image) > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size_bytes -= len(previous)
+
+            self._entries[key] = image
+            self._size_bytes += len(image)
+
+            while self._size_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size_bytes -= len(evicted)
+                self._evictions += 1
+
+    def _path(self, key: str, image_format: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.{image_format}")
+
+    def _read_disk(self, key: str, image_format: str) -> Optional[bytes]:
+        if self.cache_dir is None:
+            return None
+
+        try:
+            with open(self._path(key, image_format), "rb") as image_file:
+                return image_file.read()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            self._disk_errors += 1
+            print(f"⚠️ QR IMAGE CACHE - Could not read {key}: {e}")
+            return None
+
+    def _write_disk(self, key: str, image: bytes, image_format: str) -> None:
+        if self.cache_dir is None:
+            return
+
+        path = self._path(key, image_format)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write then rename so concurrent workers never read a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "wb") as image_file:
+                image_file.write(image)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self._disk_errors += 1
+            print(f"⚠️ QR IMAGE CACHE - Could not write {key}: {e}")
+
+
+# Global instance storage
+_rendered_qr_cache_instance: Optional[RenderedQRCache] = None
+
+
+def get_rendered_qr_cache() -> RenderedQRCache:
+    """
+    Get or create the per-process rendered QR cache
+
+    Returns:
+        RenderedQRCache: The singleton cache instance
+    """
+    global _rendered_qr_cache_instance
+
+    if _rendered_qr_cache_instance is None:
+        _rendered_qr_cache_instance = RenderedQRCache(
+            max_bytes=settings.QR_IMAGE_CACHE_MAX_MB * 1024 * 1024,
+            cache_dir=settings.QR_IMAGE_CACHE_DIR
+        )
+
+    return _rendered_qr_cache_instance
+
+
+def reset_rendered_qr_cache() -> None:
+    """
+    Reset the singleton instance (useful for testing)
+    """
+    global _rendered_qr_cache_instance
+    _rendered_qr_cache_instance = None
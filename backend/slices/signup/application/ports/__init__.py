@@ -3,5 +3,7 @@ Application ports (interfaces) for signup domain
 """
 from .user_repository import UserRepository
 from .patient_repository import PatientRepository
+from .patient_data_change_port import PatientDataChangePort
+from .qr_prerender_port import QRPrerenderPort
 
-__all__ = ["UserRepository", "PatientRepository"]
\ No newline at end of file
+__all__ = ["UserRepository", "PatientRepository", "PatientDataChangePort", "QRPrerenderPort"]
\ No newline at end of file
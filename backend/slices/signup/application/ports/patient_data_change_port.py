@@ -0,0 +1,25 @@
+"""
+Patient data change port (interface)
+
+Writers of a patient's medical or profile data report the change through this
+port before committing, so rows derived from that data (emergency snapshot,
+dashboard medical stats) are recomputed in the same transaction without the
+writer depending on the slices that own them.
+"""
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+
+class PatientDataChangePort(ABC):
+    """Interface notified when a patient's data changes inside a write transaction"""
+
+    @abstractmethod
+    def patient_data_changed(self, db: Session, patient_id: UUID) -> None:
+        """
+        Recompute everything derived from the patient's data in the caller's transaction
+
+        The caller commits (or rolls back) afterwards, together with its own writes.
+        """
+        pass
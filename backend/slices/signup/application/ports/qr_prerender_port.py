@@ -0,0 +1,23 @@
+"""
+QR pre-render port (interface)
+
+Signup hands a new patient's QR code to this port so its images are rendered
+ahead of the first dashboard fetch, without the use case depending on the qr
+slice's rendering infrastructure.
+"""
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+
+class QRPrerenderPort(ABC):
+    """Interface scheduling a QR code for background rendering"""
+
+    @abstractmethod
+    def schedule(self, qr_uuid: UUID) -> bool:
+        """
+        Queue the QR code's images for rendering off the request path
+
+        Returns:
+            True if queued, False if the job was dropped (it is rendered on first fetch)
+        """
+        pass
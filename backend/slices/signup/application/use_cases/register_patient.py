@@ -1,16 +1,17 @@
 """
 Register patient use case - Main business logic for patient registration
 """
-import bcrypt
 from datetime import datetime, date
 from typing import Dict, Any, Optional
 
 from slices.signup.application.ports.user_repository import UserRepository
 from slices.signup.application.ports.patient_repository import PatientRepository
+from slices.signup.application.ports.qr_prerender_port import QRPrerenderPort
 from slices.signup.application.dto.patient_registration import PatientRegistrationDTO, PatientRegistrationResponse
 from slices.signup.domain.models.user_model import User
 from slices.signup.domain.models.patient_model import Patient
 from slices.auth.infrastructure.security.jwt_service import JWTService
+from slices.auth.infrastructure.security.password_service import PasswordService
 from slices.auth.application.ports.user_session_repository import UserSessionRepository
 from slices.auth.application.ports.auth_repository import AuthRepository
 from slices.auth.application.dto import UserResponseDto
@@ -27,7 +28,9 @@ class RegisterPatientUseCase:
         jwt_service: JWTService,
         user_session_repository: UserSessionRepository,
         auth_repository: AuthRepository,
-        subscription_repository: Optional[SubscriptionRepositoryPort] = None
+        subscription_repository: Optional[SubscriptionRepositoryPort] = None,
+        password_service: Optional[PasswordService] = None,
+        qr_prerenderer: Optional[QRPrerenderPort] = None
     ):
         self.user_repository = user_repository
         self.patient_repository = patient_repository
@@ -35,6 +38,8 @@ class RegisterPatientUseCase:
         self.user_session_repository = user_session_repository
         self.auth_repository = auth_repository
         self.subscription_repository = subscription_repository
+        self.password_service = password_service or PasswordService()
+        self.qr_prerenderer = qr_prerenderer
 
     async def execute(
         self,
@@ -103,7 +108,11 @@ class RegisterPatientUseCase:
         # 7. Update user login info (first login)
         await self.auth_repository.update_last_login(user.id)
 
-        # 8. Create user response for consistent format with auth
+        # 8. Pre-render the new QR code in the background so the dashboard fetch is a cache hit
+        if self.qr_prerenderer:
+            self.qr_prerenderer.schedule(patient.qr_code)
+
+        # 9. Create user response for consistent format with auth
         user_response = UserResponseDto(
             id=str(user.id),
             email=user.email,
@@ -115,7 +124,7 @@ class RegisterPatientUseCase:
             mandatory_fields_completed=False  # New users need to add medical data
         )
 
-        # 9. Return enhanced response with auth tokens
+        # 10. Return enhanced response with auth tokens
         return PatientRegistrationResponse(
             success=True,
             message="Cuenta creada exitosamente",
@@ -165,11 +174,8 @@ class RegisterPatientUseCase:
     async def _create_user(self, data: PatientRegistrationDTO) -> User:
         """Create user with hashed password"""
 
-        # Hash password with bcrypt
-        password_hash = bcrypt.hashpw(
-            data.password.encode('utf-8'),
-            bcrypt.gensalt(rounds=12)
-        ).decode('utf-8')
+        # Hash password with bcrypt off the event loop
+        password_hash = await self.password_service.hash_password_async(data.password)
 
         user = User(
             email=data.email.lower(),
@@ -39,8 +39,9 @@ class Patient(Base):
     accept_terms_date = Column(DateTime(timezone=True), nullable=False)
     accept_policy = Column(Boolean, nullable=False)
     accept_policy_date = Column(DateTime(timezone=True), nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    # Indexed for the QR resolver's incremental refresh (created/updated since a watermark)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), index=True)
 
     # RF002 Personal Information Fields - added by migration eb4f0500c848
     biological_sex = Column(String(20), nullable=True)
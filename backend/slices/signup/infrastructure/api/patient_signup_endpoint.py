@@ -9,10 +9,13 @@ from slices.signup.application.dto.patient_registration import PatientRegistrati
 from slices.signup.application.use_cases.register_patient import RegisterPatientUseCase
 from slices.signup.infrastructure.persistence.user_repository import SQLAlchemyUserRepository
 from slices.signup.infrastructure.persistence.patient_repository import SQLAlchemyPatientRepository
+from slices.qr.infrastructure.services.qr_code_resolver import get_qr_code_resolver
 from slices.auth.infrastructure.security.jwt_service_singleton import get_jwt_service
 from slices.auth.infrastructure.persistence.sqlalchemy_user_session_repository import SQLAlchemyUserSessionRepository
 from slices.auth.infrastructure.persistence.sqlalchemy_auth_repository import SQLAlchemyAuthRepository
+from slices.auth.infrastructure.security.password_service import PasswordService
 from slices.subscriptions.infrastructure.persistence.subscription_repository import SubscriptionRepository
+from slices.qr.infrastructure.services.qr_prerenderer import get_qr_prerenderer
 
 router = APIRouter(prefix="/api/signup", tags=["Patient Signup"])
 
@@ -20,7 +23,7 @@ router = APIRouter(prefix="/api/signup", tags=["Patient Signup"])
 def get_register_patient_use_case(db: Session = Depends(get_db)) -> RegisterPatientUseCase:
     """Dependency injection for RegisterPatientUseCase"""
     user_repository = SQLAlchemyUserRepository(db)
-    patient_repository = SQLAlchemyPatientRepository(db)
+    patient_repository = SQLAlchemyPatientRepository(db, get_qr_code_resolver())
     jwt_service = get_jwt_service()
     user_session_repository = SQLAlchemyUserSessionRepository(db)
     auth_repository = SQLAlchemyAuthRepository(db)
@@ -31,7 +34,9 @@ def get_register_patient_use_case(db: Session = Depends(get_db)) -> RegisterPati
         jwt_service,
         user_session_repository,
         auth_repository,
-        subscription_repository
+        subscription_repository,
+        PasswordService(),
+        get_qr_prerenderer()
     )
 
 
@@ -53,6 +58,10 @@ async def register_patient(
         result = await use_case.execute(registration_data)
         return result
 
+    except HTTPException:
+        # Re-raise HTTP exceptions (hashing executor saturated, etc.)
+        raise
+
     except ValueError as e:
         error_message = str(e)
 
@@ -10,6 +10,7 @@ from slices.signup.application.use_cases.validate_document import ValidateDocume
 from slices.signup.application.use_cases.validate_email import ValidateEmailUseCase
 from slices.signup.infrastructure.persistence.user_repository import SQLAlchemyUserRepository
 from slices.signup.infrastructure.persistence.patient_repository import SQLAlchemyPatientRepository
+from slices.qr.infrastructure.services.qr_code_resolver import get_qr_code_resolver
 from slices.signup.domain.models.document_type_model import DocumentType
 
 router = APIRouter(prefix="/api/signup", tags=["Validation"])
@@ -17,7 +18,7 @@ router = APIRouter(prefix="/api/signup", tags=["Validation"])
 
 def get_validate_document_use_case(db: Session = Depends(get_db)) -> ValidateDocumentUseCase:
     """Dependency injection for ValidateDocumentUseCase"""
-    patient_repository = SQLAlchemyPatientRepository(db)
+    patient_repository = SQLAlchemyPatientRepository(db, get_qr_code_resolver())
     return ValidateDocumentUseCase(patient_repository)
 
 
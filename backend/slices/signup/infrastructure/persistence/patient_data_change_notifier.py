@@ -0,0 +1,93 @@
+"""
+Patient data change notifier
+
+Implements PatientDataChangePort: locks the patient row, flushes the
+writer's pending changes once, then runs every registered listener (each
+recomputes one derived table). Listeners are wired by the application's
+composition root (main.py), so writer slices never import the slices that
+own the derived rows.
+
+Usage:
+    from slices.signup.infrastructure.persistence.patient_data_change_notifier import (
+        get_patient_data_change_notifier,
+    )
+
+    repository = MedicationRepository(db, get_patient_data_change_notifier())
+"""
+from typing import Callable, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from slices.signup.application.ports.patient_data_change_port import PatientDataChangePort
+from slices.signup.infrastructure.persistence.patient_row_lock import lock_patient_for_update
+
+PatientDataChangeListener = Callable[[Session, UUID], None]
+
+
+class PatientDataChangeNotifier(PatientDataChangePort):
+    """Runs derived-row listeners under the patient row lock"""
+
+    def __init__(self, listeners: Sequence[PatientDataChangeListener] = ()):
+        """
+        Args:
+            listeners: Called in order with (db, patient_id) after the lock and flush
+        """
+        self.listeners: List[PatientDataChangeListener] = list(listeners)
+
+    def patient_data_changed(self, db: Session, patient_id: UUID) -> None:
+        """
+        Lock the patient row, flush pending changes and run every listener
+
+        The lock is taken before the flush so concurrent writers for the same
+        patient recompute one after the other and the last commit sees every
+        change.
+        """
+        lock_patient_for_update(db, patient_id)
+        db.flush()
+        for listener in self.listeners:
+            listener(db, patient_id)
+
+
+# Global instance storage
+_patient_data_change_notifier_instance: Optional[PatientDataChangeNotifier] = None
+
+
+def configure_patient_data_change_notifier(listeners: Sequence[PatientDataChangeListener]) -> PatientDataChangeNotifier:
+    """
+    Create the per-process notifier with its listeners (called once by the composition root)
+
+    Args:
+        listeners: Derived-row rebuilders, called with (db, patient_id)
+
+    Returns:
+        PatientDataChangeNotifier: The configured singleton instance
+    """
+    global _patient_data_change_notifier_instance
+
+    _patient_data_change_notifier_instance = PatientDataChangeNotifier(listeners)
+    return _patient_data_change_notifier_instance
+
+
+def get_patient_data_change_notifier() -> PatientDataChangeNotifier:
+    """
+    Get the per-process notifier
+
+    Returns:
+        PatientDataChangeNotifier: The singleton instance (no listeners if never configured)
+    """
+    global _patient_data_change_notifier_instance
+
+    if _patient_data_change_notifier_instance is None:
+        print("⚠️ PATIENT DATA CHANGES - Notifier used before configuration, derived rows are not rebuilt")
+        _patient_data_change_notifier_instance = PatientDataChangeNotifier()
+
+    return _patient_data_change_notifier_instance
+
+
+def reset_patient_data_change_notifier() -> None:
+    """
+    Reset the singleton instance (useful for testing)
+    """
+    global _patient_data_change_notifier_instance
+    _patient_data_change_notifier_instance = None
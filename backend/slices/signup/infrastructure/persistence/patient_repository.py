@@ -8,19 +8,22 @@ from sqlalchemy.orm import Session
 from slices.signup.application.ports.patient_repository import PatientRepository
 from slices.signup.domain.models.patient_model import Patient
 from slices.signup.domain.models.document_type_model import DocumentType
+from slices.qr.application.ports.qr_code_resolver_port import QRCodeResolverPort
 
 
 class SQLAlchemyPatientRepository(PatientRepository):
     """SQLAlchemy implementation of patient repository"""
 
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Session, qr_resolver: QRCodeResolverPort):
         self.db_session = db_session
+        self.qr_resolver = qr_resolver
 
     async def create(self, patient: Patient) -> Patient:
         """Create a new patient"""
         self.db_session.add(patient)
         self.db_session.commit()
         self.db_session.refresh(patient)
+        self.qr_resolver.register(patient.qr_code, patient.id)
         return patient
 
     async def get_by_id(self, patient_id: UUID) -> Optional[Patient]:
@@ -33,6 +36,8 @@ class SQLAlchemyPatientRepository(PatientRepository):
 
     async def get_by_qr_code(self, qr_code: UUID) -> Optional[Patient]:
         """Get patient by QR code"""
+        if not await self.qr_resolver.might_exist(qr_code):
+            return None
         return self.db_session.query(Patient).filter(Patient.qr_code == qr_code).first()
 
     async def document_exists(self, document_number: str) -> bool:
@@ -47,4 +52,6 @@ class SQLAlchemyPatientRepository(PatientRepository):
         """Update patient information"""
         self.db_session.commit()
         self.db_session.refresh(patient)
+        # Keep the resolver current if the QR code was regenerated
+        self.qr_resolver.register(patient.qr_code, patient.id)
         return patient
\ No newline at end of file
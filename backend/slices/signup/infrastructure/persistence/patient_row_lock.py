@@ -0,0 +1,33 @@
+"""
+Patient row lock
+
+Derived per-patient rows (emergency snapshot, medical stats) are recomputed
+from the patient's medical data inside the writer's transaction. Writers for
+the same patient take this lock first, before flushing their changes, so two
+concurrent transactions recompute one after the other instead of both
+reading a state that misses the other's writes.
+"""
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from slices.signup.domain.models.patient_model import Patient
+
+
+def lock_patient_for_update(db: Session, patient_id: UUID) -> None:
+    """
+    Lock a patient row (FOR NO KEY UPDATE) until the caller's transaction ends
+
+    FOR NO KEY UPDATE does not conflict with the FOR KEY SHARE locks taken by
+    foreign key checks, so inserts of child rows by other transactions are not
+    blocked, only other writers taking this lock. Autoflush is suspended for
+    the statement, so changes already made in the session are only written
+    once the lock is held.
+
+    Args:
+        db: Session holding the writer's transaction
+        patient_id: Patient about to be modified
+    """
+    with db.no_autoflush:
+        db.execute(select(Patient.id).where(Patient.id == patient_id).with_for_update(key_share=True))
@@ -6,9 +6,11 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from shared.database.database import get_db
-from slices.auth.infrastructure.api.auth_endpoints import get_current_user
+from slices.auth.domain.entities.authenticated_identity import AuthenticatedIdentity
+from slices.auth.infrastructure.api.auth_endpoints import get_current_user, get_current_identity
 from slices.signup.domain.models.user_model import User
 from slices.signup.domain.models.patient_model import Patient
+from slices.signup.infrastructure.persistence.patient_data_change_notifier import get_patient_data_change_notifier
 
 from slices.surgeries.application.use_cases.manage_surgeries import ManageSurgeriesUseCase
 from slices.surgeries.infrastructure.repositories.surgery_repository import SurgeryRepository
@@ -23,13 +25,13 @@ router = APIRouter(prefix="/api/surgeries", tags=["Surgeries"])
 
 def get_surgery_use_case(db: Session = Depends(get_db)) -> ManageSurgeriesUseCase:
     """Dependency to get surgery use case"""
-    surgery_repository = SurgeryRepository(db)
+    surgery_repository = SurgeryRepository(db, get_patient_data_change_notifier())
     return ManageSurgeriesUseCase(surgery_repository)
 
 
-async def get_patient_from_user(user: User, db: Session) -> Patient:
-    """Get patient record from authenticated user"""
-    patient = db.query(Patient).filter(Patient.user_id == user.id).first()
+async def get_patient_from_user(identity: AuthenticatedIdentity) -> Patient:
+    """Get patient record from the identity resolved for this request"""
+    patient = await identity.get_patient()
     if not patient:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -42,7 +44,7 @@ async def get_patient_from_user(user: User, db: Session) -> Patient:
 async def get_surgeries(
     current_user: User = Depends(get_current_user),
     surgery_use_case: ManageSurgeriesUseCase = Depends(get_surgery_use_case),
-    db: Session = Depends(get_db)
+    identity: AuthenticatedIdentity = Depends(get_current_identity)
 ):
     """Get all surgeries for authenticated patient"""
     if current_user.user_type != "patient":
@@ -51,7 +53,7 @@ async def get_surgeries(
             detail="Only patients can access surgery data"
         )
 
-    patient = await get_patient_from_user(current_user, db)
+    patient = await get_patient_from_user(identity)
     return await surgery_use_case.get_patient_surgeries(patient.id)
 
 
@@ -60,7 +62,7 @@ async def get_surgery(
     surgery_id: int,
     current_user: User = Depends(get_current_user),
     surgery_use_case: ManageSurgeriesUseCase = Depends(get_surgery_use_case),
-    db: Session = Depends(get_db)
+    identity: AuthenticatedIdentity = Depends(get_current_identity)
 ):
     """Get a specific surgery by ID"""
     if current_user.user_type != "patient":
@@ -69,7 +71,7 @@ async def get_surgery(
             detail="Only patients can access surgery data"
         )
 
-    patient = await get_patient_from_user(current_user, db)
+    patient = await get_patient_from_user(identity)
     surgery = await surgery_use_case.get_surgery_by_id(surgery_id, patient.id)
 
     if not surgery:
@@ -86,7 +88,7 @@ async def create_surgery(
     surgery_data: CreateSurgeryDTO,
     current_user: User = Depends(get_current_user),
     surgery_use_case: ManageSurgeriesUseCase = Depends(get_surgery_use_case),
-    db: Session = Depends(get_db)
+    identity: AuthenticatedIdentity = Depends(get_current_identity)
 ):
     """Create a new surgery record"""
     if current_user.user_type != "patient":
@@ -95,7 +97,7 @@ async def create_surgery(
             detail="Only patients can create surgery records"
         )
 
-    patient = await get_patient_from_user(current_user, db)
+    patient = await get_patient_from_user(identity)
     return await surgery_use_case.create_surgery(surgery_data, patient.id)
 
 
@@ -105,7 +107,7 @@ async def update_surgery(
     surgery_data: UpdateSurgeryDTO,
     current_user: User = Depends(get_current_user),
     surgery_use_case: ManageSurgeriesUseCase = Depends(get_surgery_use_case),
-    db: Session = Depends(get_db)
+    identity: AuthenticatedIdentity = Depends(get_current_identity)
 ):
     """Update an existing surgery record"""
     if current_user.user_type != "patient":
@@ -114,7 +116,7 @@ async def update_surgery(
             detail="Only patients can update surgery records"
         )
 
-    patient = await get_patient_from_user(current_user, db)
+    patient = await get_patient_from_user(identity)
     updated_surgery = await surgery_use_case.update_surgery(surgery_id, surgery_data, patient.id)
 
     if not updated_surgery:
@@ -131,7 +133,7 @@ async def delete_surgery(
     surgery_id: int,
     current_user: User = Depends(get_current_user),
     surgery_use_case: ManageSurgeriesUseCase = Depends(get_surgery_use_case),
-    db: Session = Depends(get_db)
+    identity: AuthenticatedIdentity = Depends(get_current_identity)
 ):
     """Delete a surgery record"""
     if current_user.user_type != "patient":
@@ -140,7 +142,7 @@ async def delete_surgery(
             detail="Only patients can delete surgery records"
         )
 
-    patient = await get_patient_from_user(current_user, db)
+    patient = await get_patient_from_user(identity)
     success = await surgery_use_case.delete_surgery(surgery_id, patient.id)
 
     if not success:
@@ -9,13 +9,15 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from slices.surgeries.application.ports.surgery_repository import SurgeryRepositoryPort
 from slices.surgeries.domain.models.surgery_model import PatientSurgery
+from slices.signup.application.ports.patient_data_change_port import PatientDataChangePort
 
 
 class SurgeryRepository(SurgeryRepositoryPort):
     """SQLAlchemy implementation of surgery repository"""
 
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Session, patient_data_changes: PatientDataChangePort):
         self.db = db_session
+        self.patient_data_changes = patient_data_changes
 
     async def get_surgeries_by_patient_id(self, patient_id: UUID) -> List[PatientSurgery]:
         """Get all surgeries for a specific patient"""
@@ -42,6 +44,7 @@ class SurgeryRepository(SurgeryRepositoryPort):
         """Create a new surgery record"""
         try:
             self.db.add(surgery)
+            self.patient_data_changes.patient_data_changed(self.db, surgery.patient_id)
             self.db.commit()
             self.db.refresh(surgery)
             return surgery
@@ -66,6 +69,7 @@ class SurgeryRepository(SurgeryRepositoryPort):
                 if hasattr(surgery, key):
                     setattr(surgery, key, value)
 
+            self.patient_data_changes.patient_data_changed(self.db, patient_id)
             self.db.commit()
             self.db.refresh(surgery)
             return surgery
@@ -87,6 +91,7 @@ class SurgeryRepository(SurgeryRepositoryPort):
                 return False
 
             self.db.delete(surgery)
+            self.patient_data_changes.patient_data_changed(self.db, patient_id)
             self.db.commit()
             return True
         except SQLAlchemyError as e:
@@ -0,0 +1,57 @@
+"""
+Login attempt audit rows reach PostgreSQL in one INSERT per batch
+"""
+import pytest
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from shared.database.database import get_async_database_url
+from slices.auth.domain.models.login_attempt_model import LoginAttempt
+from slices.auth.infrastructure.persistence.login_attempt_audit_sink import LoginAttemptAuditSink
+from slices.auth.infrastructure.persistence.sqlalchemy_login_attempt_repository import SQLAlchemyLoginAttemptRepository
+
+ATTEMPTS = 500
+BATCH_SIZE = 200
+
+
+@pytest.fixture
+async def async_engine(db_engine, db_sessionmaker):
+    engine = create_async_engine(get_async_database_url(db_engine.url.render_as_string(hide_password=False)))
+    yield engine
+    await engine.dispose()
+
+
+async def test_attempts_are_written_one_insert_per_batch(async_engine, db_session):
+    inserts = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("INSERT"):
+            inserts.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+    sink = LoginAttemptAuditSink(
+        session_factory=async_sessionmaker(async_engine, class_=AsyncSession),
+        batch_size=BATCH_SIZE,
+        flush_interval_seconds=60
+    )
+    repository = SQLAlchemyLoginAttemptRepository(db_session, audit_sink=sink)
+
+    for index in range(ATTEMPTS):
+        await repository.create_attempt(
+            email=f"user{index}@example.com",
+            ip_address="10.0.0.1",
+            user_agent="pytest",
+            success=False,
+            failure_reason="invalid_password"
+        )
+
+    # Nothing touched the request's session: attempts only reach the database on flush
+    assert db_session.scalar(select(func.count()).select_from(LoginAttempt)) == 0
+
+    await sink.close()
+
+    # 500 attempts cost 3 INSERT round trips instead of 500
+    assert len(inserts) == -(-ATTEMPTS // BATCH_SIZE)
+    assert sink.stats()["written"] == ATTEMPTS
+    assert db_session.scalar(select(func.count()).select_from(LoginAttempt)) == ATTEMPTS
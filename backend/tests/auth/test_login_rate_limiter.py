@@ -0,0 +1,128 @@
+"""
+Login rate limiter on the in-memory and Redis backends
+"""
+import pytest
+from fastapi import HTTPException
+
+from slices.auth.infrastructure.rate_limiting import InMemoryRateLimitBackend, LoginRateLimiter, RedisRateLimitBackend
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture(params=["memory", "redis"])
+async def backend(request, clock):
+    if request.param == "memory":
+        yield InMemoryRateLimitBackend(clock=clock)
+        return
+
+    fakeredis = pytest.importorskip("fakeredis")
+    backend = RedisRateLimitBackend(fakeredis.FakeAsyncRedis(), clock=clock)
+    yield backend
+    await backend.close()
+
+
+@pytest.fixture
+def limiter(backend):
+    return LoginRateLimiter(
+        backend=backend,
+        ip_max_failures=15,
+        ip_window_seconds=3600,
+        email_max_failures=5,
+        email_window_seconds=900
+    )
+
+
+async def _fail(limiter, email="ana@example.com", ip_address="10.0.0.1"):
+    await limiter.check(email, ip_address)
+    await limiter.record_failure(email, ip_address)
+
+
+async def test_email_limit_allows_n_then_429_with_retry_after(limiter, clock):
+    for _ in range(5):
+        await _fail(limiter)
+        clock.now += 10
+
+    with pytest.raises(HTTPException) as exc_info:
+        await limiter.check("ana@example.com", "10.0.0.1")
+
+    assert exc_info.value.status_code == 429
+    # The first failure (50 s ago) leaves the 900 s window in 850 s
+    assert exc_info.value.headers["Retry-After"] == "850"
+
+
+async def test_email_limit_is_case_insensitive_and_per_email(limiter):
+    for _ in range(5):
+        await _fail(limiter, email="Ana@Example.com")
+
+    with pytest.raises(HTTPException):
+        await limiter.check("ana@example.com", "10.0.0.1")
+
+    await limiter.check("otro@example.com", "10.0.0.1")
+
+
+async def test_ip_limit_allows_n_then_429(limiter):
+    for index in range(15):
+        await _fail(limiter, email=f"user{index}@example.com")
+
+    with pytest.raises(HTTPException) as exc_info:
+        await limiter.check("nuevo@example.com", "10.0.0.1")
+
+    assert exc_info.value.status_code == 429
+    assert int(exc_info.value.headers["Retry-After"]) == 3600
+
+    await limiter.check("nuevo@example.com", "10.0.0.2")
+
+
+async def test_window_slides_and_resets(limiter, clock):
+    for _ in range(5):
+        await _fail(limiter)
+        clock.now += 60
+
+    with pytest.raises(HTTPException) as exc_info:
+        await limiter.check("ana@example.com", "10.0.0.1")
+    retry_after = int(exc_info.value.headers["Retry-After"])
+
+    # Just before Retry-After the oldest failure is still in the window
+    clock.now += retry_after - 1
+    with pytest.raises(HTTPException):
+        await limiter.check("ana@example.com", "10.0.0.1")
+
+    # Once it leaves, exactly one more attempt is allowed
+    clock.now += 1
+    await _fail(limiter)
+    with pytest.raises(HTTPException):
+        await limiter.check("ana@example.com", "10.0.0.1")
+
+    # A full quiet window clears the key
+    clock.now += 900
+    for _ in range(5):
+        await _fail(limiter)
+
+
+async def test_redis_keys_expire_with_their_window(clock):
+    fakeredis = pytest.importorskip("fakeredis")
+    client = fakeredis.FakeAsyncRedis()
+    backend = RedisRateLimitBackend(client, clock=clock)
+
+    assert await backend.hit("email:ana@example.com", 900) == 1
+    clock.now += 10
+    assert await backend.hit("email:ana@example.com", 900) == 2
+
+    assert await client.keys() == [b"vitalgo:ratelimit:email:ana@example.com"]
+    assert 0 < await client.ttl("vitalgo:ratelimit:email:ana@example.com") <= 900
+
+    # Events older than the window are trimmed on the next read
+    clock.now += 895
+    assert await backend.count("email:ana@example.com", 900) == 1
+    await backend.close()
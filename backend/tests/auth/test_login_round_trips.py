@@ -0,0 +1,69 @@
+"""
+Database round trips of the login path
+"""
+import pytest
+
+from slices.auth.application.dto import LoginRequestDto
+from slices.auth.application.use_cases.authenticate_user import AuthenticateUserUseCase
+from slices.auth.infrastructure.persistence.sqlalchemy_auth_repository import SQLAlchemyAuthRepository
+from slices.auth.infrastructure.persistence.sqlalchemy_login_attempt_repository import SQLAlchemyLoginAttemptRepository
+from slices.auth.infrastructure.persistence.sqlalchemy_user_session_repository import SQLAlchemyUserSessionRepository
+from slices.auth.infrastructure.rate_limiting import InMemoryRateLimitBackend, LoginRateLimiter
+from slices.auth.infrastructure.security.jwt_service import JWTService
+from slices.auth.infrastructure.security.password_service import PasswordService
+
+PASSWORD = "Clave-Segura-123"
+
+
+def _verbs(statements):
+    return [statement.lstrip().split(None, 1)[0].upper() for statement in statements]
+
+
+@pytest.fixture
+def login_user(db_session, make_patient):
+    patient = make_patient(email="login@example.com")
+    patient.user.password_hash = PasswordService().hash_password(PASSWORD)
+    patient.user.is_verified = True
+    db_session.commit()
+    return patient.user
+
+
+@pytest.fixture
+def use_case(db_session):
+    return AuthenticateUserUseCase(
+        auth_repository=SQLAlchemyAuthRepository(db_session),
+        login_attempt_repository=SQLAlchemyLoginAttemptRepository(db_session),
+        user_session_repository=SQLAlchemyUserSessionRepository(db_session),
+        password_service=PasswordService(),
+        jwt_service=JWTService(),
+        rate_limiter=LoginRateLimiter(InMemoryRateLimitBackend())
+    )
+
+
+async def test_successful_login_is_one_select_and_one_write_transaction(use_case, login_user, db_session, count_statements):
+    db_session.expire_all()
+
+    with count_statements() as statements:
+        result = await use_case.execute(
+            LoginRequestDto(email="login@example.com", password=PASSWORD),
+            ip_address="10.0.0.1",
+            user_agent="pytest"
+        )
+
+    assert result["success"]
+    # get_login_context_by_email, then apply_successful_login's commit flushes
+    # the user update together with the staged session and login attempt
+    assert _verbs(statements) == ["SELECT", "UPDATE", "INSERT", "INSERT"]
+    assert "FROM login_attempts" not in statements[0]
+
+
+async def test_unknown_email_is_one_select_and_one_insert(use_case, count_statements):
+    with count_statements() as statements:
+        result = await use_case.execute(
+            LoginRequestDto(email="nadie@example.com", password=PASSWORD),
+            ip_address="10.0.0.1",
+            user_agent="pytest"
+        )
+
+    assert not result["success"]
+    assert _verbs(statements) == ["SELECT", "INSERT"]
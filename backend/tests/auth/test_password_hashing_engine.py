@@ -0,0 +1,81 @@
+"""
+Password hashing engine backlog limit and lazy engine creation
+"""
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from slices.auth.infrastructure.security import password_hashing_engine as engine_module
+from slices.auth.infrastructure.security import password_service as service_module
+from slices.auth.infrastructure.security.password_hashing_engine import PasswordHashingEngine
+from slices.auth.infrastructure.security.password_service import PasswordService
+
+
+@pytest.fixture
+def release(monkeypatch):
+    """Make hashing block until the returned event is set"""
+    event = threading.Event()
+
+    def blocking_hash(password: str, rounds: int) -> str:
+        event.wait(5)
+        return f"hash:{password}"
+
+    monkeypatch.setattr(engine_module, "_hash_password", blocking_hash)
+    yield event
+    event.set()
+
+
+async def _wait_for_in_flight(engine: PasswordHashingEngine, count: int) -> None:
+    for _ in range(100):
+        if engine.stats()["in_flight"] == count:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"in_flight never reached {count}: {engine.stats()}")
+
+
+async def test_full_backlog_is_rejected_with_retry_after(release):
+    engine = PasswordHashingEngine(max_workers=2, max_queue_depth=1)
+    try:
+        running = [asyncio.create_task(engine.hash_password(f"p{i}", 4)) for i in range(3)]
+        await _wait_for_in_flight(engine, 3)
+        assert engine.stats()["queue_depth"] == 1
+
+        with pytest.raises(HTTPException) as excinfo:
+            await engine.hash_password("one-too-many", 4)
+        assert excinfo.value.status_code == 503
+        assert excinfo.value.headers["Retry-After"] == "1"
+
+        release.set()
+        assert await asyncio.gather(*running) == ["hash:p0", "hash:p1", "hash:p2"]
+
+        stats = engine.stats()
+        assert stats["in_flight"] == 0
+        assert stats["queue_depth"] == 0
+        assert stats["peak_in_flight"] == 3
+        assert stats["completed"] == 3
+        assert stats["rejected"] == 1
+    finally:
+        engine.shutdown()
+
+
+async def test_password_service_creates_the_engine_on_first_async_call(monkeypatch):
+    created = []
+
+    def fake_get_engine():
+        created.append(PasswordHashingEngine(max_workers=1, max_queue_depth=0))
+        return created[-1]
+
+    monkeypatch.setattr(service_module, "get_password_hashing_engine", fake_get_engine)
+
+    service = PasswordService()
+    password_hash = service.hash_password("Secret-123")
+    assert created == []
+
+    try:
+        assert await service.verify_password_async("Secret-123", password_hash)
+        assert await service.verify_password_async("wrong", password_hash) is False
+        assert len(created) == 1
+    finally:
+        created[0].shutdown()
@@ -0,0 +1,137 @@
+"""
+Stateless tokens resolve the request identity without a query; the patient is loaded only on use
+"""
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from shared.config.settings import settings
+from shared.database.database import get_async_database_url
+from slices.auth.application.use_cases.validate_token import ValidateTokenUseCase
+from slices.auth.domain.entities.authenticated_identity import build_profile_info
+from slices.auth.infrastructure.api import auth_endpoints
+from slices.auth.infrastructure.persistence.sqlalchemy_auth_repository import SQLAlchemyAuthRepository
+from slices.auth.infrastructure.persistence.sqlalchemy_user_session_repository import SQLAlchemyUserSessionRepository
+from slices.auth.infrastructure.security.jwt_service import JWTService
+from slices.auth.infrastructure.security.session_revocation_list import SessionRevocationList
+from slices.auth.infrastructure.security.token_digest import hash_token
+from slices.allergies.infrastructure.api.allergies_router import get_patient_from_user
+
+
+@pytest.fixture
+def jwt_service(monkeypatch):
+    monkeypatch.setattr(settings, "TOKEN_VALIDATION_MODE", "stateless")
+    return JWTService()
+
+
+@pytest.fixture
+async def revocation_list(db_engine):
+    """Revocation list refreshed from the test database, ready for stateless validation"""
+    async_engine = create_async_engine(
+        get_async_database_url(db_engine.url.render_as_string(hide_password=False)), poolclass=NullPool
+    )
+    revocation_list = SessionRevocationList(session_factory=async_sessionmaker(async_engine), refresh_interval_seconds=60)
+    await revocation_list.refresh()
+    yield revocation_list
+    await async_engine.dispose()
+
+
+@pytest.fixture
+def login(db_session, make_patient, jwt_service):
+    """Issue a stateless-eligible access token for a new patient (with a matching session row)"""
+    async def issue():
+        patient = make_patient()
+        user = patient.user
+        token = jwt_service.create_access_token(
+            user_id=str(user.id),
+            email=user.email,
+            user_type=user.user_type,
+            additional_claims={"profile": build_profile_info(user, patient)}
+        )
+        await SQLAlchemyUserSessionRepository(db_session).create_session(
+            user.id, token["access_token"], "refresh", "10.0.0.1", "pytest", token["expires_at"]
+        )
+        db_session.expire_all()
+        return patient, token["access_token"]
+
+    return issue
+
+
+def _use_case(db_session, jwt_service, revocation_list=None):
+    return ValidateTokenUseCase(
+        auth_repository=SQLAlchemyAuthRepository(db_session),
+        user_session_repository=SQLAlchemyUserSessionRepository(db_session),
+        jwt_service=jwt_service,
+        revocation_list=revocation_list
+    )
+
+
+async def test_identity_comes_from_the_claims_and_the_patient_is_loaded_once(
+    db_session, jwt_service, revocation_list, login, count_statements
+):
+    patient, token = await login()
+
+    with count_statements() as statements:
+        identity = await _use_case(db_session, jwt_service, revocation_list).resolve_identity_stateless(token)
+
+    assert statements == []
+    assert identity.session is None
+    assert (identity.user.id, identity.user.email, identity.user.user_type) == (
+        patient.user_id, patient.user.email, "patient"
+    )
+
+    with count_statements() as statements:
+        first = await get_patient_from_user(identity)
+        second = await get_patient_from_user(identity)
+
+    assert first.id == second.id == patient.id
+    assert len(statements) == 1
+
+
+async def test_user_without_patient_record_gets_404(db_session, jwt_service, revocation_list, login):
+    patient, token = await login()
+    db_session.delete(patient)
+    db_session.commit()
+
+    identity = await _use_case(db_session, jwt_service, revocation_list).resolve_identity_stateless(token)
+
+    with pytest.raises(HTTPException) as error:
+        await get_patient_from_user(identity)
+    assert error.value.status_code == 404
+
+
+async def test_revoked_token_is_left_to_the_database_path(db_session, jwt_service, revocation_list, login):
+    _, token = await login()
+    revocation_list.revoke_token(hash_token(token))
+
+    assert await _use_case(db_session, jwt_service, revocation_list).resolve_identity_stateless(token) is None
+
+
+async def test_database_mode_keeps_the_joined_query(db_session, jwt_service, login):
+    _, token = await login()
+
+    assert await _use_case(db_session, jwt_service).resolve_identity_stateless(token) is None
+
+
+async def test_current_identity_dependency_skips_the_database_in_stateless_mode(
+    db_session, jwt_service, revocation_list, login, count_statements, monkeypatch
+):
+    patient, token = await login()
+    monkeypatch.setattr(auth_endpoints, "get_jwt_service", lambda: jwt_service)
+    monkeypatch.setattr(auth_endpoints, "get_session_revocation_list", lambda: revocation_list)
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    with count_statements() as statements:
+        identity = await auth_endpoints.get_current_identity(credentials, db_session)
+    assert statements == []
+    assert identity.user.id == patient.user_id
+
+    # A revoked token still gets the database answer: its session is active, so it resolves there
+    revocation_list.revoke_token(hash_token(token))
+    with count_statements() as statements:
+        identity = await auth_endpoints.get_current_identity(credentials, db_session)
+    assert len(statements) >= 1
+    assert identity.session is not None
+    assert identity.patient.id == patient.id
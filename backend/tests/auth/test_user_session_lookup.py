@@ -0,0 +1,46 @@
+"""
+Session lookup by token is one indexed point query on the token digest
+"""
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+
+from slices.auth.domain.models.user_session_model import UserSession
+from slices.auth.infrastructure.persistence.sqlalchemy_user_session_repository import SQLAlchemyUserSessionRepository
+from slices.auth.infrastructure.security.token_digest import hash_token
+
+
+async def test_get_session_by_token_is_one_digest_lookup(db_session, make_patient, count_statements):
+    user_id = make_patient().user_id
+    repository = SQLAlchemyUserSessionRepository(db_session)
+    expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+    for index in range(50):
+        await repository.create_session(user_id, f"access-{index}", f"refresh-{index}", "10.0.0.1", "pytest", expires_at)
+    db_session.expire_all()
+
+    with count_statements() as statements:
+        session = await repository.get_session_by_token("access-37")
+        missing = await repository.get_session_by_token("access-unknown")
+
+    assert session.session_token == "access-37"
+    assert missing is None
+    # One statement per lookup, filtered on the digest instead of scanning active sessions
+    assert len(statements) == 2
+    assert all("user_sessions.session_token_digest = " in statement for statement in statements)
+
+
+def test_digest_lookup_is_served_by_its_unique_index(db_engine):
+    query = select(UserSession).where(
+        UserSession.session_token_digest == hash_token("access"),
+        UserSession.is_active == True
+    )
+    compiled = query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+
+    with db_engine.connect() as conn:
+        # An empty table is always seq-scanned; ask whether an index path exists at all
+        conn.execute(text("SET enable_seqscan = off"))
+        plan = "\n".join(row[0] for row in conn.execute(text(f"EXPLAIN {compiled}")))
+
+    assert "ix_user_sessions_session_token_digest" in plan
+    assert "Seq Scan" not in plan
@@ -0,0 +1,56 @@
+"""
+Dashboard overview: statement budget and severity buckets
+"""
+from datetime import date
+
+import pytest
+
+from slices.allergies.domain.models.allergy_model import PatientAllergy
+from slices.dashboard.infrastructure.repositories.dashboard_repository import DashboardRepository
+from slices.dashboard.infrastructure.repositories.patient_medical_stats_writer import reconcile_patient_medical_stats
+from slices.medications.domain.models.medication_model import PatientMedication
+
+
+@pytest.fixture
+def patient_with_records(db_session, make_patient):
+    patient = make_patient()
+    db_session.add_all([
+        PatientMedication(
+            patient_id=patient.id, medication_name="Losartan", dosage="50 mg",
+            frequency="daily", start_date=date(2024, 1, 1)
+        ),
+        PatientAllergy(patient_id=patient.id, allergen="Penicilina", severity_level="critica"),
+        PatientAllergy(patient_id=patient.id, allergen="Polen", severity_level="leve"),
+        PatientAllergy(patient_id=patient.id, allergen="Látex", severity_level="desconocida"),
+    ])
+    db_session.commit()
+    return patient
+
+
+@pytest.mark.parametrize("with_stats_row, max_statements", [(True, 1), (False, 2)])
+async def test_overview_statement_budget(db_session, patient_with_records, count_statements, with_stats_row, max_statements):
+    if with_stats_row:
+        reconcile_patient_medical_stats(db_session, [patient_with_records.id])
+        db_session.commit()
+
+    patient_id = patient_with_records.id
+    repository = DashboardRepository(db_session)
+    with count_statements() as statements:
+        stats, summary = await repository.get_dashboard_overview(patient_id)
+
+    assert len(statements) <= max_statements
+    assert summary.medications_count == 1
+    assert summary.allergies_count == 3
+    assert summary.has_critical_allergies
+
+
+@pytest.mark.parametrize("with_stats_row", [True, False])
+async def test_unknown_severity_is_counted_as_other(db_session, patient_with_records, with_stats_row):
+    if with_stats_row:
+        reconcile_patient_medical_stats(db_session, [patient_with_records.id])
+        db_session.commit()
+
+    stats, _ = await DashboardRepository(db_session).get_dashboard_overview(patient_with_records.id)
+
+    assert stats.allergies_by_severity == {"leve": 1, "moderada": 0, "severa": 0, "critica": 1, "other": 1}
+    assert sum(stats.allergies_by_severity.values()) == stats.active_allergies
@@ -0,0 +1,64 @@
+"""
+Emergency access log partitions roll forward with the calendar
+"""
+from datetime import datetime, timezone
+
+from slices.emergency_access.infrastructure.persistence import emergency_access_log_sink as sink_module
+from slices.emergency_access.infrastructure.persistence.emergency_access_log_sink import EmergencyAccessLogSink
+from tests.shared.test_buffered_batch_writer import FakeSessionFactory
+
+
+class FakeEngine:
+    def __init__(self):
+        self.statements = []
+
+    def begin(self):
+        engine = self
+
+        class Connection:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc_info):
+                return False
+
+            async def execute(self, statement):
+                engine.statements.append(str(statement))
+
+        return Connection()
+
+
+class FrozenDatetime(datetime):
+    current = datetime(2026, 1, 31, 23, 59, tzinfo=timezone.utc)
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls.current
+
+
+def _partitions(engine):
+    return [statement.split()[5] for statement in engine.statements]
+
+
+async def test_partitions_are_created_again_after_month_rollover(monkeypatch):
+    monkeypatch.setattr(sink_module, "datetime", FrozenDatetime)
+    engine = FakeEngine()
+    sink = EmergencyAccessLogSink(
+        session_factory=FakeSessionFactory(), engine=engine, flush_interval_seconds=60, partition_months_ahead=1
+    )
+
+    await sink.ensure_partitions()
+    assert _partitions(engine) == ["emergency_access_logs_y2026m01", "emergency_access_logs_y2026m02"]
+
+    # Same month: flushing does not touch the partitions
+    sink.enqueue({"qr_code": "x"})
+    await sink.flush()
+    assert len(engine.statements) == 2
+
+    # First flush of the next month creates the partition one month further out
+    FrozenDatetime.current = datetime(2026, 2, 1, 0, 1, tzinfo=timezone.utc)
+    sink.enqueue({"qr_code": "y"})
+    await sink.flush()
+    assert _partitions(engine)[2:] == ["emergency_access_logs_y2026m02", "emergency_access_logs_y2026m03"]
+
+    await sink.close()
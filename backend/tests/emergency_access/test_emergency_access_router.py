@@ -0,0 +1,162 @@
+"""
+Emergency GETs revalidate with 304 until the patient's record actually changes
+"""
+import uuid
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from main import app
+from shared.database import get_async_db
+from shared.database.database import get_async_database_url
+from slices.emergency_access.infrastructure.api import emergency_access_router
+from slices.emergency_access.infrastructure.api.emergency_access_router import get_current_paramedic_user
+from slices.emergency_access.infrastructure.repositories.emergency_snapshot_writer import rebuild_emergency_snapshot
+from slices.medications.domain.models.medication_model import PatientMedication
+from slices.qr.infrastructure.services.qr_code_resolver import reset_qr_code_resolver
+from slices.signup.infrastructure.persistence.patient_data_change_notifier import PatientDataChangeNotifier
+
+ROUTES = ["/api/emergency/{}", "/api/emergency/{}/critical", "/api/emergency/{}?tier=critical"]
+
+
+class FakeAccessLogSink:
+    def __init__(self):
+        self.rows = []
+
+    def enqueue(self, row):
+        self.rows.append(row)
+
+
+@pytest.fixture
+def access_log(monkeypatch):
+    sink = FakeAccessLogSink()
+    monkeypatch.setattr(emergency_access_router, "get_emergency_access_log_sink", lambda: sink)
+    return sink
+
+
+@pytest.fixture
+def client(db_engine, db_sessionmaker, access_log):
+    # NullPool: connections are opened on the TestClient's event loop, never reused across loops
+    engine = create_async_engine(
+        get_async_database_url(db_engine.url.render_as_string(hide_password=False)), poolclass=NullPool
+    )
+
+    async def override_get_async_db():
+        async with AsyncSession(engine) as session:
+            yield session
+
+    reset_qr_code_resolver()
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_current_paramedic_user] = lambda: SimpleNamespace(id=uuid.uuid4())
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+    reset_qr_code_resolver()
+
+
+@pytest.fixture
+def patient_with_medication(db_session, make_patient):
+    """Patient with one active medication and an up-to-date snapshot"""
+    patient = make_patient()
+    medication = PatientMedication(
+        patient_id=patient.id, medication_name="Insulina", dosage="10 UI",
+        frequency="Diaria", start_date=date(2020, 1, 1), is_active=True
+    )
+    db_session.add(medication)
+    _patient_data_changed(db_session, patient.id)
+    return patient, medication
+
+
+def _patient_data_changed(db_session, patient_id):
+    PatientDataChangeNotifier([rebuild_emergency_snapshot]).patient_data_changed(db_session, patient_id)
+    db_session.commit()
+
+
+def _revalidate(client, url, etag):
+    return client.get(url, headers={"If-None-Match": etag})
+
+
+@pytest.mark.parametrize("route", ROUTES)
+def test_unchanged_record_revalidates_with_304(client, patient_with_medication, route):
+    patient, _ = patient_with_medication
+    url = route.format(patient.qr_code)
+
+    first = client.get(url)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+
+    second = _revalidate(client, url, etag)
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["ETag"] == etag
+
+
+@pytest.mark.parametrize("route", ROUTES)
+def test_child_row_update_and_delete_invalidate_the_etag(client, db_session, patient_with_medication, route):
+    patient, medication = patient_with_medication
+    url = route.format(patient.qr_code)
+    etag = client.get(url).headers["ETag"]
+    assert _revalidate(client, url, etag).status_code == 304
+
+    # Same row count, edited in place
+    medication.dosage = "20 UI"
+    _patient_data_changed(db_session, patient.id)
+
+    updated = _revalidate(client, url, etag)
+    assert updated.status_code == 200
+    assert updated.json()["medications"][0]["dosage"] == "20 UI"
+    assert updated.headers["ETag"] != etag
+    etag = updated.headers["ETag"]
+    assert _revalidate(client, url, etag).status_code == 304
+
+    db_session.delete(medication)
+    _patient_data_changed(db_session, patient.id)
+
+    deleted = _revalidate(client, url, etag)
+    assert deleted.status_code == 200
+    assert deleted.json()["medications"] == []
+    assert deleted.headers["ETag"] != etag
+
+
+def test_critical_tier_query_is_an_alias_of_the_critical_route(client, patient_with_medication):
+    patient, _ = patient_with_medication
+
+    alias = client.get(f"/api/emergency/{patient.qr_code}?tier=critical")
+    route = client.get(f"/api/emergency/{patient.qr_code}/critical")
+
+    assert alias.status_code == route.status_code == 200
+    assert alias.json()["tier"] == "critical"
+    assert alias.content == route.content
+    assert alias.headers["ETag"] == route.headers["ETag"]
+    assert alias.headers["ETag"] != client.get(f"/api/emergency/{patient.qr_code}").headers["ETag"]
+
+
+def test_unknown_tier_is_rejected(client, patient_with_medication):
+    patient, _ = patient_with_medication
+
+    assert client.get(f"/api/emergency/{patient.qr_code}?tier=everything").status_code == 422
+
+
+def test_record_without_snapshot_still_revalidates(client, make_patient):
+    patient = make_patient()
+    url = f"/api/emergency/{patient.qr_code}"
+
+    first = client.get(url)
+    assert first.status_code == 200
+
+    assert _revalidate(client, url, first.headers["ETag"]).status_code == 304
+
+
+def test_every_request_is_logged(client, access_log, patient_with_medication):
+    patient, _ = patient_with_medication
+    url = f"/api/emergency/{patient.qr_code}"
+
+    etag = client.get(url).headers["ETag"]
+    _revalidate(client, url, etag)
+    client.get(f"/api/emergency/{uuid.uuid4()}")
+
+    assert [row["status_code"] for row in access_log.rows] == [200, 304, 404]
+    assert [row["patient_id"] for row in access_log.rows] == [patient.id, patient.id, None]
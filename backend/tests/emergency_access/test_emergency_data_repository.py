@@ -0,0 +1,123 @@
+"""
+Snapshot digests change with the payload they describe, whatever the commit timing
+"""
+import re
+import uuid
+from datetime import date
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from shared.database.database import get_async_database_url
+from slices.emergency_access.infrastructure.repositories.emergency_data_repository import EmergencyDataRepository
+from slices.emergency_access.infrastructure.repositories.emergency_snapshot_writer import rebuild_emergency_snapshot
+from slices.medications.domain.models.medication_model import PatientMedication
+from slices.medications.infrastructure.repositories.medication_repository import MedicationRepository
+from slices.qr.infrastructure.services.qr_code_resolver import QRCodeResolver
+from slices.signup.infrastructure.persistence.patient_data_change_notifier import PatientDataChangeNotifier
+from slices.surgeries.domain.models.surgery_model import PatientSurgery
+
+
+@pytest.fixture
+async def snapshot_digests(db_engine):
+    """Read a patient's (payload_digest, critical_digest) through the async repository"""
+    async_engine = create_async_engine(get_async_database_url(db_engine.url.render_as_string(hide_password=False)))
+
+    async def read(qr_code):
+        async with AsyncSession(async_engine) as session:
+            return await EmergencyDataRepository(session, QRCodeResolver()).get_snapshot_digests(qr_code)
+
+    yield read
+    await async_engine.dispose()
+
+
+@pytest.fixture
+async def record_statements(db_engine):
+    """Load a record with one repository method and return the SQL it sent"""
+    async_engine = create_async_engine(get_async_database_url(db_engine.url.render_as_string(hide_password=False)))
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+    async def load(method, qr_code):
+        statements.clear()
+        async with AsyncSession(async_engine) as session:
+            record = await getattr(EmergencyDataRepository(session, QRCodeResolver()), method)(qr_code)
+        return record, list(statements)
+
+    yield load
+    await async_engine.dispose()
+
+
+def _patient_columns(statement):
+    """patients columns in the outer select list (before the first aggregate subquery)"""
+    return set(re.findall(r"\bpatients\.(\w+)", statement.split("(SELECT", 1)[0]))
+
+
+async def test_critical_query_loads_only_the_projected_columns(make_patient, record_statements):
+    patient = make_patient()
+
+    critical, critical_statements = await record_statements("get_critical_record_by_qr_code", patient.qr_code)
+    full, full_statements = await record_statements("get_emergency_record_by_qr_code", patient.qr_code)
+
+    assert critical.patient.id == full.patient.id == patient.id
+    assert len(critical_statements) == len(full_statements) == 1
+    assert _patient_columns(critical_statements[0]) == {
+        "id", "qr_code", "first_name", "last_name", "birth_date", "biological_sex", "blood_type",
+        "is_pregnant", "pregnancy_weeks", "emergency_contact_name", "emergency_contact_relationship",
+        "emergency_contact_phone", "emergency_contact_phone_alt",
+    }
+    assert len(_patient_columns(full_statements[0])) > 13
+    assert "patient_surgeries" not in critical_statements[0]
+    assert "document_types" not in critical_statements[0]
+
+
+async def test_critical_digest_ignores_surgeries_and_follows_critical_rows(db_session, make_patient, snapshot_digests):
+    patient = make_patient()
+    patient_id, qr_code = patient.id, patient.qr_code
+    rebuild_emergency_snapshot(db_session, patient_id)
+    db_session.commit()
+
+    initial = await snapshot_digests(qr_code)
+
+    db_session.add(PatientSurgery(patient_id=patient_id, procedure_name="Apendicectomía", surgery_date=date(2010, 5, 1)))
+    rebuild_emergency_snapshot(db_session, patient_id)
+    db_session.commit()
+    after_surgery = await snapshot_digests(qr_code)
+
+    assert after_surgery[0] != initial[0]
+    assert after_surgery[1] == initial[1]
+
+    db_session.add(PatientMedication(
+        patient_id=patient_id, medication_name="Insulina", dosage="10 UI",
+        frequency="Diaria", start_date=date(2020, 1, 1), is_active=True
+    ))
+    rebuild_emergency_snapshot(db_session, patient_id)
+    db_session.commit()
+    after_medication = await snapshot_digests(qr_code)
+
+    assert after_medication[0] != after_surgery[0]
+    assert after_medication[1] != after_surgery[1]
+
+
+async def test_digest_changes_when_a_row_is_edited_in_place(db_session, make_patient, snapshot_digests):
+    # An edit keeps every row count; only the payload itself tells the versions apart
+    patient = make_patient()
+    medications = MedicationRepository(db_session, PatientDataChangeNotifier([rebuild_emergency_snapshot]))
+    medication = await medications.create_medication(PatientMedication(
+        patient_id=patient.id, medication_name="Insulina", dosage="10 UI",
+        frequency="Diaria", start_date=date(2020, 1, 1), is_active=True
+    ))
+    before = await snapshot_digests(patient.qr_code)
+
+    await medications.update_medication(medication.id, {"dosage": "20 UI"})
+
+    assert await snapshot_digests(patient.qr_code) != before
+
+
+async def test_digests_of_unknown_code_are_none(db_engine, snapshot_digests):
+    assert await snapshot_digests(uuid.uuid4()) is None
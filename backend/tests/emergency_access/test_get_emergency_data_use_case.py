@@ -0,0 +1,80 @@
+"""
+Emergency records cost one statement, for one QR code or a whole batch
+"""
+import uuid
+from datetime import date
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from shared.database.database import get_async_database_url
+# The infrastructure package (which mounts the router) must load before the use case
+from slices.emergency_access.infrastructure.repositories.emergency_data_repository import EmergencyDataRepository
+from slices.emergency_access.application.use_cases.get_emergency_data_use_case import GetEmergencyDataUseCase
+from slices.medications.domain.models.medication_model import PatientMedication
+from slices.qr.infrastructure.services.qr_code_resolver import QRCodeResolver
+from slices.surgeries.domain.models.surgery_model import PatientSurgery
+
+
+@pytest.fixture
+async def async_engine(db_engine):
+    engine = create_async_engine(get_async_database_url(db_engine.url.render_as_string(hide_password=False)))
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def count_async_statements(async_engine):
+    """Record every statement the async engine sends"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture
+def patients_with_history(db_session, make_patient):
+    """Three patients, each with two medications and a surgery; returns their QR codes"""
+    qr_codes = []
+    for _ in range(3):
+        patient = make_patient()
+        for name in ("Insulina", "Losartán"):
+            db_session.add(PatientMedication(
+                patient_id=patient.id, medication_name=name, dosage="1",
+                frequency="Diaria", start_date=date(2020, 1, 1), is_active=True
+            ))
+        db_session.add(PatientSurgery(patient_id=patient.id, procedure_name="Apendicectomía", surgery_date=date(2010, 5, 1)))
+        qr_codes.append(patient.qr_code)
+    db_session.commit()
+    return qr_codes
+
+
+async def test_single_record_is_one_statement(async_engine, count_async_statements, patients_with_history):
+    async with AsyncSession(async_engine) as session:
+        use_case = GetEmergencyDataUseCase(EmergencyDataRepository(session, QRCodeResolver()))
+        response = await use_case.execute(patients_with_history[0])
+
+    assert len(response.medications) == 2
+    assert len(response.surgeries) == 1
+    assert len(count_async_statements) == 1
+
+
+async def test_batch_is_one_statement_regardless_of_size(async_engine, count_async_statements, patients_with_history):
+    unknown = uuid.uuid4()
+    qr_codes = [*patients_with_history, unknown, patients_with_history[0]]
+
+    async with AsyncSession(async_engine) as session:
+        use_case = GetEmergencyDataUseCase(EmergencyDataRepository(session, QRCodeResolver()))
+        response = await use_case.execute_batch(qr_codes)
+
+    assert [item.qr_code for item in response.results] == qr_codes
+    assert [item.found for item in response.results] == [True, True, True, False, True]
+    assert all(len(item.data.medications) == 2 for item in response.results if item.found)
+    assert (response.found_count, response.not_found_count) == (4, 1)
+    # Five codes (one unknown, one repeated) are resolved with a single query
+    assert len(count_async_statements) == 1
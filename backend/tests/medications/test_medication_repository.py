@@ -0,0 +1,68 @@
+"""
+Concurrent writers for one patient must not lose each other's changes in the
+derived rows (emergency snapshot, medical stats)
+"""
+import asyncio
+import json
+import threading
+from datetime import date
+
+from slices.dashboard.domain.models.patient_medical_stats_model import PatientMedicalStats
+from slices.dashboard.infrastructure.repositories.patient_medical_stats_writer import refresh_patient_medical_stats
+from slices.emergency_access.domain.models.emergency_snapshot_model import PatientEmergencySnapshot
+from slices.emergency_access.infrastructure.repositories.emergency_snapshot_writer import rebuild_emergency_snapshot
+from slices.medications.domain.models.medication_model import PatientMedication
+from slices.medications.infrastructure.repositories.medication_repository import MedicationRepository
+from slices.signup.infrastructure.persistence.patient_data_change_notifier import PatientDataChangeNotifier
+
+
+def _medication(patient_id, name):
+    return PatientMedication(
+        patient_id=patient_id,
+        medication_name=name,
+        dosage="10 mg",
+        frequency="daily",
+        start_date=date(2024, 1, 1)
+    )
+
+
+def test_concurrent_writers_keep_snapshot_and_stats_complete(db_sessionmaker, make_patient):
+    patient_id = make_patient().id
+    notifier = PatientDataChangeNotifier([rebuild_emergency_snapshot, refresh_patient_medical_stats])
+
+    first = db_sessionmaker()
+    second = db_sessionmaker()
+    try:
+        # An open transaction that has already rebuilt both derived rows
+        first.add(_medication(patient_id, "Losartan"))
+        notifier.patient_data_changed(first, patient_id)
+
+        second_done = threading.Event()
+
+        def second_writer():
+            asyncio.run(MedicationRepository(second, notifier).create_medication(_medication(patient_id, "Metformina")))
+            second_done.set()
+
+        thread = threading.Thread(target=second_writer)
+        thread.start()
+
+        # The repository waits on the patient row lock held by the first writer
+        assert not second_done.wait(0.5)
+
+        first.commit()
+        thread.join(timeout=10)
+        assert second_done.is_set()
+    finally:
+        first.close()
+        second.close()
+
+    check = db_sessionmaker()
+    try:
+        payload = json.loads(check.get(PatientEmergencySnapshot, patient_id).payload)
+        stats = check.get(PatientMedicalStats, patient_id)
+    finally:
+        check.close()
+
+    names = sorted(medication["medication_name"] for medication in payload["medications"])
+    assert names == ["Losartan", "Metformina"]
+    assert stats.medications_count == 2
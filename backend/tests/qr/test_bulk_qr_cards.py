@@ -0,0 +1,63 @@
+"""
+Bulk QR card job renders every patient once, in files or sheets, and resumes
+"""
+import json
+import os
+
+import pytest
+
+pytest.importorskip("qrcode")
+Image = pytest.importorskip("PIL.Image")
+
+from slices.qr.infrastructure.batch.bulk_qr_cards import CHECKPOINT_FILE, BulkQRCardJob
+
+PATIENTS = 7
+
+
+@pytest.fixture
+def patients(make_patient):
+    """(patient_id, qr_code) of every patient, in the job's id order"""
+    created = [make_patient() for _ in range(PATIENTS)]
+    return sorted((str(patient.id), str(patient.qr_code)) for patient in created)
+
+
+def _written_files(output_dir):
+    return sorted(
+        name[:-len(".png")]
+        for shard in os.listdir(output_dir) if os.path.isdir(os.path.join(output_dir, shard))
+        for name in os.listdir(os.path.join(output_dir, shard))
+    )
+
+
+def test_files_layout_writes_one_sharded_png_per_patient(db_engine, patients, tmp_path):
+    result = BulkQRCardJob(str(tmp_path), workers=2, box_size=4, db_engine=db_engine).run()
+
+    qr_codes = [qr_code for _, qr_code in patients]
+    assert result.rendered == PATIENTS
+    assert _written_files(tmp_path) == sorted(qr_codes)
+    assert all(os.path.exists(tmp_path / qr_code[:2] / f"{qr_code}.png") for qr_code in qr_codes)
+
+
+def test_rerun_resumes_after_the_checkpoint(db_engine, patients, tmp_path):
+    # A previous run stopped after the first three patients
+    with open(tmp_path / CHECKPOINT_FILE, "w") as checkpoint_file:
+        json.dump({"last_patient_id": patients[2][0], "rendered": 3, "sheets": 0}, checkpoint_file)
+
+    result = BulkQRCardJob(str(tmp_path), workers=2, box_size=4, db_engine=db_engine).run()
+
+    assert result.rendered == PATIENTS
+    assert result.last_patient_id == patients[-1][0]
+    assert _written_files(tmp_path) == sorted(qr_code for _, qr_code in patients[3:])
+
+
+def test_sheets_layout_tiles_every_patient(db_engine, patients, tmp_path):
+    result = BulkQRCardJob(
+        str(tmp_path), layout="sheets", workers=2, box_size=4, columns=2, rows=2, db_engine=db_engine
+    ).run()
+
+    # Seven patients on 2x2 sheets: one full sheet and one partial
+    assert result.rendered == PATIENTS
+    assert result.sheets == 2
+    assert sorted(name for name in os.listdir(tmp_path) if name.startswith("sheet-")) == [
+        "sheet-00001.png", "sheet-00002.png"
+    ]
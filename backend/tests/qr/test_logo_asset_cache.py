@@ -0,0 +1,80 @@
+"""
+Logo assets are prepared once per process and per size, and rendered images are reused
+"""
+from uuid import uuid4
+
+import pytest
+
+pytest.importorskip("qrcode")
+Image = pytest.importorskip("PIL.Image")
+
+from slices.qr.infrastructure.services.logo_asset_cache import LogoAssetCache
+from slices.qr.infrastructure.services.qr_generator_service import QRGeneratorService
+from slices.qr.infrastructure.services.qr_rasterizer import PILQRRasterizer
+from slices.qr.infrastructure.services.rendered_qr_cache import RenderedQRCache
+
+
+class CountingLogoAssetCache(LogoAssetCache):
+    """LogoAssetCache that counts logo decodes and overlay builds"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.loads = 0
+        self.overlay_builds = 0
+
+    def _load_logo(self):
+        self.loads += 1
+        return super()._load_logo()
+
+    def _build_overlay(self, logo, qr_size):
+        self.overlay_builds += 1
+        return super()._build_overlay(logo, qr_size)
+
+
+@pytest.fixture
+def logo_path(tmp_path):
+    path = tmp_path / "logo.png"
+    Image.new("RGBA", (64, 64), (20, 80, 200, 255)).save(path)
+    return str(path)
+
+
+def _generator(logo_assets, max_bytes=0):
+    return QRGeneratorService(
+        logo_assets=logo_assets,
+        image_cache=RenderedQRCache(max_bytes=max_bytes),
+        rasterizer=PILQRRasterizer(logo_assets)
+    )
+
+
+def test_logo_is_decoded_once_and_overlays_built_once_per_size(logo_path):
+    logo_assets = CountingLogoAssetCache(logo_paths=[logo_path])
+    generator = _generator(logo_assets)
+
+    for _ in range(5):
+        for box_size in (4, 10):
+            generator.render_png(uuid4(), box_size)
+
+    # 10 uncached renders: one decode, one overlay per output size
+    assert logo_assets.loads == 1
+    assert logo_assets.overlay_builds == 2
+
+
+def test_cached_assets_render_the_same_image_as_fresh_ones(logo_path):
+    qr_uuid = uuid4()
+    shared = _generator(LogoAssetCache(logo_paths=[logo_path]))
+    shared.render_png(uuid4())
+
+    assert shared.render_png(qr_uuid) == _generator(LogoAssetCache(logo_paths=[logo_path])).render_png(qr_uuid)
+
+
+def test_repeated_render_is_served_from_the_image_cache(logo_path):
+    logo_assets = CountingLogoAssetCache(logo_paths=[logo_path])
+    generator = _generator(logo_assets, max_bytes=1_000_000)
+    qr_uuid = uuid4()
+
+    first = generator.render_png(qr_uuid)
+    assert generator.render_png(qr_uuid) == first
+
+    stats = generator.image_cache.stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+    assert logo_assets.overlay_builds == 1
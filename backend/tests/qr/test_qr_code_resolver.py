@@ -0,0 +1,196 @@
+"""
+QR code resolver answers unknown and known codes without Postgres, and keeps up with new patients
+"""
+import uuid
+from datetime import date, datetime, timezone
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from shared.database.database import get_async_database_url
+from slices.emergency_access.infrastructure.repositories.emergency_data_repository import EmergencyDataRepository
+from slices.qr.infrastructure.services.qr_code_resolver import QRCodeResolver, build_refresh_query
+from slices.signup.domain.models import DocumentType, Patient, User
+from slices.signup.infrastructure.persistence.patient_repository import SQLAlchemyPatientRepository
+
+
+@pytest.fixture
+async def async_engine(db_engine):
+    engine = create_async_engine(get_async_database_url(db_engine.url.render_as_string(hide_password=False)))
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def async_statements(async_engine):
+    """Statements sent through the async engine (emergency lookups and resolver refreshes)"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture
+def make_resolver(async_engine):
+    def factory(**kwargs) -> QRCodeResolver:
+        kwargs.setdefault("refresh_interval_seconds", 3600)
+        return QRCodeResolver(engine=async_engine, **kwargs)
+
+    return factory
+
+
+async def _lookup(async_engine, resolver, qr_code):
+    """Resolve a scanned code the way the emergency endpoint does; returns the patient id"""
+    async with AsyncSession(async_engine) as session:
+        record = await EmergencyDataRepository(session, resolver).get_emergency_record_by_qr_code(qr_code)
+    return record.patient.id if record else None
+
+
+def _new_patient(db_session) -> Patient:
+    """Unsaved patient (with its user) as the signup use case builds it"""
+    document_type = db_session.query(DocumentType).filter(DocumentType.code == "CC").one()
+    user = User(email=f"{uuid.uuid4().hex[:12]}@example.com", password_hash="x", user_type="patient")
+    db_session.add(user)
+    db_session.flush()
+
+    now = datetime.now(timezone.utc)
+    return Patient(
+        user_id=user.id, first_name="Luis", last_name="Gómez", document_type_id=document_type.id,
+        document_number=uuid.uuid4().hex[:12], phone_international="+57 3000000001", birth_date=date(1985, 3, 2),
+        accept_terms=True, accept_terms_date=now, accept_policy=True, accept_policy_date=now
+    )
+
+
+def test_refresh_query_is_served_by_timestamp_indexes(db_engine):
+    query = build_refresh_query(datetime(2026, 1, 1, tzinfo=timezone.utc))
+    compiled = query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+
+    with db_engine.connect() as conn:
+        # An empty table is always seq-scanned; ask whether an index path exists at all
+        conn.execute(text("SET enable_seqscan = off"))
+        plan = "\n".join(row[0] for row in conn.execute(text(f"EXPLAIN {compiled}")))
+
+    assert "ix_patients_created_at" in plan
+    assert "ix_patients_updated_at" in plan
+    assert "Seq Scan" not in plan
+
+
+async def test_unknown_code_is_rejected_by_the_bloom_filter(
+    db_session, make_patient, make_resolver, async_engine, count_statements, async_statements
+):
+    make_patient()
+    resolver = make_resolver()
+    await resolver.rebuild()
+    async_statements.clear()
+
+    with count_statements() as statements:
+        assert await SQLAlchemyPatientRepository(db_session, resolver).get_by_qr_code(uuid.uuid4()) is None
+        assert await _lookup(async_engine, resolver, uuid.uuid4()) is None
+
+    assert statements == []
+    assert async_statements == []
+    assert resolver.stats()["rejected"] == 2
+
+
+async def test_removed_code_is_rejected_by_the_negative_cache(
+    db_session, make_patient, make_resolver, async_engine, async_statements
+):
+    patient = make_patient()
+    qr_code = patient.qr_code
+    resolver = make_resolver()
+    await resolver.rebuild()
+
+    # Still in the Bloom filter: the first lookup asks Postgres, the next ones do not
+    patient.qr_code = uuid.uuid4()
+    db_session.commit()
+    async_statements.clear()
+
+    assert await _lookup(async_engine, resolver, qr_code) is None
+    assert len(async_statements) == 1
+
+    assert await _lookup(async_engine, resolver, qr_code) is None
+    assert len(async_statements) == 1
+    assert resolver.stats()["negative_cached"] == 1
+
+
+async def test_resolved_code_is_served_from_the_lru(make_patient, make_resolver, async_engine, async_statements):
+    patient = make_patient()
+    resolver = make_resolver()
+    await resolver.rebuild()
+    async_statements.clear()
+
+    assert await _lookup(async_engine, resolver, patient.qr_code) == patient.id
+    assert len(async_statements) == 1
+
+    # The access log reads the patient id back without a query
+    assert resolver.get_patient_id(patient.qr_code) == patient.id
+    assert await resolver.might_exist(patient.qr_code) is True
+    assert len(async_statements) == 1
+    assert resolver.stats()["hits"] == 1
+
+
+def test_lru_evicts_the_least_recently_used_code():
+    resolver = QRCodeResolver(max_entries=2)
+    first, second, third = (uuid.uuid4() for _ in range(3))
+
+    resolver.remember(first, uuid.uuid4())
+    resolver.remember(second, uuid.uuid4())
+    resolver.get_patient_id(first)
+    resolver.remember(third, uuid.uuid4())
+
+    assert resolver.get_patient_id(second) is None
+    assert resolver.get_patient_id(first) is not None
+    assert resolver.get_patient_id(third) is not None
+
+
+async def test_patient_created_by_signup_resolves_immediately(
+    db_session, make_patient, make_resolver, count_statements, async_statements
+):
+    make_patient()
+    resolver = make_resolver()
+    await resolver.rebuild()
+    async_statements.clear()
+
+    patient = await SQLAlchemyPatientRepository(db_session, resolver).create(_new_patient(db_session))
+
+    # No refresh is due: the signup write registered the code itself
+    with count_statements() as statements:
+        assert await resolver.might_exist(patient.qr_code) is True
+        assert resolver.get_patient_id(patient.qr_code) == patient.id
+
+    assert statements == []
+    assert async_statements == []
+
+
+async def test_patient_created_on_another_worker_is_found_by_refresh(make_patient, make_resolver, async_engine):
+    make_patient()
+    resolver = make_resolver(refresh_interval_seconds=0)
+    await resolver.rebuild()
+
+    # Written without going through this worker's resolver
+    patient = make_patient()
+
+    assert await _lookup(async_engine, resolver, patient.qr_code) == patient.id
+    assert resolver.stats()["refreshes"] == 1
+
+
+async def test_restarted_worker_knows_every_existing_code(make_patient, make_resolver):
+    before = make_patient()
+    stale = make_resolver()
+    await stale.rebuild()
+    after = make_patient()
+
+    # Until its refresh interval elapses the old worker does not see the new patient
+    assert await stale.might_exist(after.qr_code) is False
+
+    restarted = make_resolver()
+    await restarted.rebuild()
+
+    assert await restarted.might_exist(before.qr_code) is True
+    assert await restarted.might_exist(after.qr_code) is True
@@ -0,0 +1,98 @@
+"""
+QR image endpoints serve raw PNG/SVG with a stable strong ETag and answer 304 without rendering
+"""
+from io import BytesIO
+from types import SimpleNamespace
+from uuid import uuid4
+from xml.etree import ElementTree
+
+import pytest
+
+pytest.importorskip("qrcode")
+Image = pytest.importorskip("PIL.Image")
+
+from fastapi.testclient import TestClient
+
+from main import app
+from slices.qr.infrastructure.api.qr_simple_router import get_qr_patient
+from slices.qr.infrastructure.services.qr_generator_service import QRGeneratorService
+from slices.qr.infrastructure.services.rendered_qr_cache import MAX_BOX_SIZE, MIN_BOX_SIZE, reset_rendered_qr_cache
+
+
+@pytest.fixture
+def patient():
+    return SimpleNamespace(qr_code=uuid4())
+
+
+@pytest.fixture
+def client(patient):
+    reset_rendered_qr_cache()
+    app.dependency_overrides[get_qr_patient] = lambda: patient
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+    reset_rendered_qr_cache()
+
+
+def test_png_is_served_as_raw_bytes(client):
+    response = client.get("/api/qr/image.png", params={"box_size": 4})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/png"
+    assert response.content.startswith(b"\x89PNG\r\n\x1a\n")
+    with Image.open(BytesIO(response.content)) as image:
+        assert image.format == "PNG"
+        # Every module is box_size pixels: the side is a multiple of 4
+        assert image.size[0] == image.size[1] and image.size[0] % 4 == 0
+
+
+@pytest.mark.parametrize("box_size", [MIN_BOX_SIZE - 1, MAX_BOX_SIZE + 1])
+def test_box_size_outside_the_supported_range_is_rejected(client, box_size):
+    assert client.get("/api/qr/image.png", params={"box_size": box_size}).status_code == 422
+
+
+def test_svg_is_well_formed(client):
+    response = client.get("/api/qr/image.svg")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/svg+xml"
+    root = ElementTree.fromstring(response.content)
+    assert root.tag.endswith("svg")
+
+
+@pytest.mark.parametrize("path, params", [("/api/qr/image.png", {"box_size": 4}), ("/api/qr/image.svg", {})])
+def test_strong_etag_is_stable(client, path, params):
+    first = client.get(path, params=params)
+    second = client.get(path, params=params)
+
+    etag = first.headers["ETag"]
+    assert not etag.startswith("W/")
+    assert etag.startswith('"') and etag.endswith('"')
+    assert second.headers["ETag"] == etag
+    assert second.content == first.content
+
+
+def test_etag_differs_per_size_and_format(client):
+    etags = {
+        client.get("/api/qr/image.png", params={"box_size": 4}).headers["ETag"],
+        client.get("/api/qr/image.png", params={"box_size": 8}).headers["ETag"],
+        client.get("/api/qr/image.svg").headers["ETag"],
+    }
+
+    assert len(etags) == 3
+
+
+@pytest.mark.parametrize("path, params", [("/api/qr/image.png", {"box_size": 4}), ("/api/qr/image.svg", {})])
+def test_matching_if_none_match_returns_304_without_rendering(client, path, params, monkeypatch):
+    etag = client.get(path, params=params).headers["ETag"]
+
+    def render(*args, **kwargs):
+        raise AssertionError("image rendered for a matching If-None-Match")
+
+    monkeypatch.setattr(QRGeneratorService, "render_png", render)
+    monkeypatch.setattr(QRGeneratorService, "render_svg", render)
+
+    response = client.get(path, params=params, headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
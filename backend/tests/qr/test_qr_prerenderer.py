@@ -0,0 +1,87 @@
+"""
+Signup pre-renders every configured QR size, drops jobs past the backlog and drains on shutdown
+"""
+import threading
+from uuid import uuid4
+
+import pytest
+
+pytest.importorskip("qrcode")
+pytest.importorskip("PIL.Image")
+
+from shared.config.settings import settings
+from slices.qr.infrastructure.services.logo_asset_cache import LogoAssetCache
+from slices.qr.infrastructure.services.qr_generator_service import QRGeneratorService
+from slices.qr.infrastructure.services.qr_prerenderer import QRPrerenderer, parse_box_sizes
+from slices.qr.infrastructure.services.qr_rasterizer import PILQRRasterizer
+from slices.qr.infrastructure.services.rendered_qr_cache import RenderedQRCache
+
+
+class BlockingGenerator:
+    """Generator whose renders wait until released"""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.rendered = []
+
+    def render_png(self, qr_uuid, box_size):
+        self.release.wait(timeout=10)
+        self.rendered.append((qr_uuid, box_size))
+        return b""
+
+
+@pytest.fixture
+def generator():
+    logo_assets = LogoAssetCache(logo_paths=[])
+    return QRGeneratorService(
+        logo_assets=logo_assets,
+        image_cache=RenderedQRCache(max_bytes=10_000_000),
+        rasterizer=PILQRRasterizer(logo_assets)
+    )
+
+
+def test_every_configured_box_size_lands_in_the_image_cache(generator):
+    box_sizes = parse_box_sizes(settings.QR_PRERENDER_BOX_SIZES)
+    prerenderer = QRPrerenderer(box_sizes=box_sizes, generator=generator)
+    qr_uuid = uuid4()
+
+    assert prerenderer.schedule(qr_uuid) is True
+    prerenderer.shutdown()
+
+    for box_size in box_sizes:
+        key = generator.image_key(qr_uuid, box_size, "png")
+        assert generator.image_cache.get(key, "png") is not None
+    assert generator.image_cache.stats()["hits"] == len(box_sizes)
+    assert prerenderer.stats()["rendered"] == 1
+
+
+def test_full_backlog_drops_new_jobs():
+    generator = BlockingGenerator()
+    prerenderer = QRPrerenderer(box_sizes=[10], max_workers=1, max_pending=2, generator=generator)
+
+    # One job rendering, one waiting: the backlog is full
+    assert prerenderer.schedule(uuid4()) is True
+    assert prerenderer.schedule(uuid4()) is True
+    assert prerenderer.schedule(uuid4()) is False
+
+    stats = prerenderer.stats()
+    assert (stats["pending"], stats["scheduled"], stats["dropped"]) == (2, 2, 1)
+
+    generator.release.set()
+    prerenderer.shutdown()
+    assert prerenderer.stats()["rendered"] == 2
+
+
+def test_shutdown_drains_queued_jobs():
+    generator = BlockingGenerator()
+    prerenderer = QRPrerenderer(box_sizes=[10, 20], max_workers=1, max_pending=10, generator=generator)
+    qr_uuids = [uuid4() for _ in range(3)]
+    for qr_uuid in qr_uuids:
+        prerenderer.schedule(qr_uuid)
+
+    threading.Timer(0.05, generator.release.set).start()
+    prerenderer.shutdown()
+
+    assert generator.rendered == [(qr_uuid, box_size) for qr_uuid in qr_uuids for box_size in (10, 20)]
+    assert prerenderer.stats()["pending"] == 0
+    assert prerenderer.stats()["rendered"] == 3
@@ -0,0 +1,93 @@
+"""
+NumPy and PIL QR rasterizers must produce identical bitmaps, the NumPy one faster
+"""
+import time
+from io import BytesIO
+from uuid import UUID
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("qrcode")
+Image = pytest.importorskip("PIL.Image")
+
+from slices.qr.infrastructure.services.logo_asset_cache import LOGO_PATHS, LogoAssetCache
+from slices.qr.infrastructure.services.qr_generator_service import QRGeneratorService
+from slices.qr.infrastructure.services import qr_rasterizer
+from slices.qr.infrastructure.services.qr_rasterizer import NumpyQRRasterizer, PILQRRasterizer
+from slices.qr.infrastructure.services.rendered_qr_cache import RenderedQRCache
+
+QR_UUIDS = [
+    UUID("00000000-0000-0000-0000-000000000000"),
+    UUID("6f1c2b8e-4d3a-4f5e-9a7b-1c2d3e4f5a6b"),
+    UUID("ffffffff-ffff-ffff-ffff-ffffffffffff"),
+]
+BOX_SIZES = [4, 7, 10, 20, 33]
+THROUGHPUT_RENDERS = 20
+
+
+@pytest.fixture(scope="module")
+def translucent_logo(tmp_path_factory):
+    """Logo with a gradient alpha channel, so every blend weight is exercised"""
+    logo = Image.new("RGBA", (64, 64))
+    logo.putdata([(x * 4, y * 4, (x + y) * 2, (x * 7 + y * 3) % 256) for y in range(64) for x in range(64)])
+    path = tmp_path_factory.mktemp("logo") / "logo.png"
+    logo.save(path)
+    return str(path)
+
+
+def _generator(logo_assets):
+    return QRGeneratorService(
+        logo_assets=logo_assets,
+        image_cache=RenderedQRCache(max_bytes=0),
+        rasterizer=PILQRRasterizer(logo_assets)
+    )
+
+
+def _renders_per_second(rasterizer, qrs) -> float:
+    """Best of three passes, so a busy CI machine does not decide the comparison"""
+    rasterizer.render(qrs[0])
+    best = float("inf")
+    for _ in range(3):
+        started = time.perf_counter()
+        for qr in qrs:
+            rasterizer.render(qr)
+        best = min(best, time.perf_counter() - started)
+    return len(qrs) / best
+
+
+def _pixels(png: bytes) -> bytes:
+    with Image.open(BytesIO(png)) as image:
+        assert image.mode == "RGB"
+        return image.size, image.tobytes()
+
+
+@pytest.mark.parametrize("logo_source", ["translucent", "vitalgo", "none"])
+@pytest.mark.parametrize("box_size", BOX_SIZES)
+@pytest.mark.parametrize("qr_uuid", QR_UUIDS)
+def test_numpy_matches_pil(qr_uuid, box_size, logo_source, translucent_logo):
+    logo_paths = {"translucent": [translucent_logo], "vitalgo": LOGO_PATHS, "none": []}[logo_source]
+    logo_assets = LogoAssetCache(logo_paths=logo_paths)
+    if logo_source != "none" and logo_assets.get_logo() is None:
+        pytest.skip("logo file not available")
+
+    qr = _generator(logo_assets)._build_qr(qr_uuid, box_size)
+
+    pil_png = PILQRRasterizer(logo_assets).render(qr)
+    numpy_png = NumpyQRRasterizer(logo_assets).render(qr)
+
+    assert _pixels(numpy_png) == _pixels(pil_png)
+
+
+@pytest.mark.parametrize("box_size", [4, 10])
+def test_numpy_rasterizes_faster_than_pil(box_size, translucent_logo, monkeypatch):
+    # PNG encoding is the same zlib call on both paths; compare the rasterization itself
+    monkeypatch.setattr(qr_rasterizer, "encode_png", lambda image: b"")
+    logo_assets = LogoAssetCache(logo_paths=[translucent_logo])
+    generator = _generator(logo_assets)
+    qrs = [generator._build_qr(qr_uuid, box_size) for qr_uuid in QR_UUIDS * (THROUGHPUT_RENDERS // len(QR_UUIDS))]
+
+    pil_rate = _renders_per_second(PILQRRasterizer(logo_assets), qrs)
+    numpy_rate = _renders_per_second(NumpyQRRasterizer(logo_assets), qrs)
+
+    assert numpy_rate > pil_rate, f"numpy {numpy_rate:.0f}/s vs pil {pil_rate:.0f}/s"
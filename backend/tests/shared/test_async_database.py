@@ -0,0 +1,40 @@
+"""
+Async sessions check connections out of the asyncpg pool concurrently
+"""
+import asyncio
+import time
+
+import pytest
+from sqlalchemy import text
+
+from shared.database.database import async_engine, get_async_db
+
+CONCURRENT_REQUESTS = 5
+QUERY_SECONDS = 0.2
+
+
+@pytest.fixture
+async def pool(db_engine):
+    """The application's async engine, disposed so no connection outlives the test's event loop"""
+    yield async_engine.pool
+    await async_engine.dispose()
+
+
+async def _request() -> None:
+    """One request's lifetime through the get_async_db dependency"""
+    dependency = get_async_db()
+    db = await dependency.__anext__()
+    await db.execute(text(f"SELECT pg_sleep({QUERY_SECONDS})"))
+    await dependency.aclose()
+
+
+async def test_concurrent_requests_do_not_serialize_on_the_pool(pool):
+    started = time.perf_counter()
+    await asyncio.gather(*[_request() for _ in range(CONCURRENT_REQUESTS)])
+    elapsed = time.perf_counter() - started
+
+    # Serialized, the requests would take CONCURRENT_REQUESTS * QUERY_SECONDS (1.0 s)
+    assert elapsed < CONCURRENT_REQUESTS * QUERY_SECONDS / 2
+    # Every session returned its connection when the dependency closed
+    assert pool.checkedout() == 0
+    assert pool.checkedin() == CONCURRENT_REQUESTS
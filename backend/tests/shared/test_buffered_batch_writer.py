@@ -0,0 +1,92 @@
+"""
+BufferedBatchWriter batching, bounds and retry
+"""
+from sqlalchemy import Column, Integer, MetaData, Table
+
+from shared.database.buffered_batch_writer import BufferedBatchWriter
+
+
+class FakeSession:
+    def __init__(self, factory):
+        self.factory = factory
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def execute(self, statement, rows):
+        if self.factory.fail_next:
+            self.factory.fail_next -= 1
+            raise RuntimeError("database unavailable")
+        self.factory.batches.append(list(rows))
+
+    async def commit(self):
+        self.factory.commits += 1
+
+
+class FakeSessionFactory:
+    def __init__(self):
+        self.batches = []
+        self.commits = 0
+        self.fail_next = 0
+
+    def __call__(self):
+        return FakeSession(self)
+
+
+class ProbeWriter(BufferedBatchWriter):
+    model = Table("batch_writer_probe", MetaData(), Column("id", Integer, primary_key=True))
+    log_label = "PROBE"
+
+
+async def test_rows_are_written_in_batch_size_chunks():
+    factory = FakeSessionFactory()
+    writer = ProbeWriter(session_factory=factory, batch_size=100, flush_interval_seconds=60)
+
+    for index in range(250):
+        assert writer.enqueue({"id": index})
+
+    assert await writer.flush() == 250
+    # 250 rows cost 3 INSERT round trips instead of 250
+    assert [len(batch) for batch in factory.batches] == [100, 100, 50]
+    assert factory.commits == 3
+    await writer.close()
+
+
+async def test_full_buffer_drops_and_counts():
+    writer = ProbeWriter(session_factory=FakeSessionFactory(), batch_size=10, flush_interval_seconds=60, max_queue_size=5)
+
+    results = [writer.enqueue({"id": index}) for index in range(8)]
+
+    assert results == [True] * 5 + [False] * 3
+    assert writer.stats()["dropped"] == 3
+    await writer.close()
+
+
+async def test_failed_batch_is_retried_on_next_flush():
+    factory = FakeSessionFactory()
+    factory.fail_next = 1
+    writer = ProbeWriter(session_factory=factory, batch_size=10, flush_interval_seconds=60)
+
+    for index in range(3):
+        writer.enqueue({"id": index})
+
+    assert await writer.flush() == 0
+    assert writer.stats()["failed_batches"] == 1
+    assert writer.stats()["queued"] == 3
+
+    assert await writer.flush() == 3
+    assert factory.batches == [[{"id": 0}, {"id": 1}, {"id": 2}]]
+    await writer.close()
+
+
+async def test_close_flushes_remaining_rows():
+    factory = FakeSessionFactory()
+    writer = ProbeWriter(session_factory=factory, batch_size=100, flush_interval_seconds=60)
+    writer.enqueue({"id": 1})
+
+    await writer.close()
+
+    assert factory.batches == [[{"id": 1}]]
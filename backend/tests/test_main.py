@@ -0,0 +1,62 @@
+"""
+/health stays minimal; worker counters are admin-only
+"""
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from main import app
+from slices.auth.infrastructure.api.auth_endpoints import get_current_user
+
+
+@pytest.fixture
+def client():
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def _login_as(user_type: str) -> None:
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(user_type=user_type)
+
+
+def test_health_exposes_no_internal_stats(client):
+    response = client.get("/health")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "healthy", "service": "vitalgo-backend", "version": "0.1.0"}
+
+
+def test_stats_require_authentication(client):
+    assert client.get("/api/admin/stats").status_code in (401, 403)
+
+
+def test_stats_are_forbidden_to_non_admins(client):
+    _login_as("patient")
+
+    assert client.get("/api/admin/stats").status_code == 403
+
+
+def test_admin_sees_worker_stats(client):
+    _login_as("admin")
+
+    response = client.get("/api/admin/stats")
+
+    assert response.status_code == 200
+    assert {"worker_pid", "token_cache", "password_hashing", "emergency_access_log"} <= response.json().keys()
+
+
+def test_shutdown_flushes_emergency_qr_access_counts(db_engine, monkeypatch):
+    closed = []
+
+    class FakeCounter:
+        async def close(self):
+            closed.append(True)
+
+    monkeypatch.setattr(main, "get_emergency_qr_access_counter", lambda: FakeCounter())
+
+    with TestClient(app):
+        assert closed == []
+
+    assert closed == [True]